@@ -0,0 +1,53 @@
+"""
+Posterizarr Async Database Module
+Async facade over the synchronous database classes. Calls run on a dedicated
+thread pool so a slow query never blocks the event loop (WebSockets, SSE, requests).
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Separate from the default executor so long DB calls can't starve
+# asyncio.to_thread() users (log tailing, file scans) and vice versa
+DB_EXECUTOR_WORKERS = int(os.getenv("POSTERIZARR_DB_WORKERS", "4"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="posterizarr-db"
+        )
+    return _executor
+
+
+async def run_db(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking database call on the DB thread pool and await its result
+
+    Example:
+        records = await run_db(db.get_all_choices)
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_get_executor(), call)
+
+
+def shutdown_db_executor():
+    """Wait for running DB calls and stop the DB thread pool (used on shutdown)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
@@ -6,8 +6,12 @@ from fastapi import Request, HTTPException, status
 from fastapi.responses import Response
 from starlette.middleware.base import BaseHTTPMiddleware
 import base64
+import hashlib
+import os
 import secrets
 import logging
+import time
+from collections import OrderedDict
 import bcrypt
 from pathlib import Path
 import json
@@ -15,12 +19,32 @@ import json
 # Use the root logger so output appears in console/BackendServer.log
 logger = logging.getLogger(__name__)
 
+# Verified Authorization headers are trusted this long before bcrypt runs again
+CREDENTIAL_CACHE_TTL_SECONDS = 300
+CREDENTIAL_CACHE_MAX_ENTRIES = 256
+
+
+def _file_signature(path: Path):
+    """(mtime, size, inode) of the config file, or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
 class BasicAuthMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, config_path: Path, db_path: Path):
         super().__init__(app)
         self.config_path = config_path
         self.db_path = db_path
         self.auth_db = None
+        self.enabled = False
+        self.username = "admin"
+        self.password_hash = ""
+        self._config_signature = None
+        # sha256(Authorization header) -> expiry (monotonic), oldest first
+        self._verified = OrderedDict()
 
         # Try to load ConfigDB
         try:
@@ -40,12 +64,18 @@ class BasicAuthMiddleware(BaseHTTPMiddleware):
         except ValueError:
             return False
 
-    def _load_config(self) -> dict:
-        default_config = {"enabled": False, "username": "admin", "password": ""}
+    def _load_config(self):
+        # Only re-read config.json when it changed on disk
+        signature = _file_signature(self.config_path)
+        if signature is not None and signature == self._config_signature:
+            return
+        self._config_signature = signature
+        # Credentials verified against the old settings must be checked again
+        self._verified.clear()
         try:
-            if not self.config_path.exists():
+            if signature is None:
                 self.enabled = False
-                return default_config
+                return
 
             with open(self.config_path, "r", encoding="utf-8") as f:
                 config = json.load(f)
@@ -75,9 +105,39 @@ class BasicAuthMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             logger.error(f"AUTH: Error loading config: {e}")
             self.enabled = False
+            # Retry on the next request (e.g. while the file is being rewritten)
+            self._config_signature = None
+
+    def _check_credentials(self, auth_header: str) -> bool:
+        """
+        Verify a Basic Authorization header. Successful verifications are
+        remembered (by hash of the header) for CREDENTIAL_CACHE_TTL_SECONDS, so
+        bcrypt runs once per session instead of once per request.
+        """
+        key = hashlib.sha256(auth_header.encode("utf-8")).digest()
+        now = time.monotonic()
+        expires = self._verified.get(key)
+        if expires is not None:
+            if expires > now:
+                return True
+            del self._verified[key]
+
+        try:
+            creds = base64.b64decode(auth_header[6:]).decode("utf-8")
+            u, p = creds.split(":", 1)
+        except Exception:
+            return False
+        # Verify username and password
+        if not (secrets.compare_digest(u, self.username) and self._verify_password(p, self.password_hash)):
+            return False
+
+        self._verified[key] = now + CREDENTIAL_CACHE_TTL_SECONDS
+        while len(self._verified) > CREDENTIAL_CACHE_MAX_ENTRIES:
+            self._verified.popitem(last=False)
+        return True
 
     async def dispatch(self, request: Request, call_next):
-        # Reload config on every request to support dynamic changes
+        # Pick up config changes (re-reads config.json only when it changed)
         self._load_config()
         
         path = request.url.path
@@ -153,14 +213,8 @@ class BasicAuthMiddleware(BaseHTTPMiddleware):
         if not auth_header or not auth_header.startswith("Basic "):
             return self._unauthorized_response()
 
-        try:
-            creds = base64.b64decode(auth_header[6:]).decode("utf-8")
-            u, p = creds.split(":", 1)
-            # Verify username and password
-            if secrets.compare_digest(u, self.username) and self._verify_password(p, self.password_hash):
-                return await call_next(request)
-        except Exception:
-            pass
+        if self._check_credentials(auth_header):
+            return await call_next(request)
 
         return self._unauthorized_response()
 
@@ -178,12 +232,21 @@ class BasicAuthMiddleware(BaseHTTPMiddleware):
             }
         )
 
+# config path -> (file signature, result) for load_auth_config
+_auth_config_cache = {}
+
+
 # Helper function for main.py (Standalone)
 def load_auth_config(config_path: Path) -> dict:
     """Helper for main.py to check auth status without instantiating middleware"""
+    signature = _file_signature(config_path)
+    cached = _auth_config_cache.get(config_path)
+    if cached is not None and signature is not None and cached[0] == signature:
+        return dict(cached[1])
+
     default_config = {"enabled": False}
     try:
-        if not config_path.exists():
+        if signature is None:
             return default_config
 
         with open(config_path, "r", encoding="utf-8") as f:
@@ -194,6 +257,8 @@ def load_auth_config(config_path: Path) -> dict:
         val_nested = config.get("WebUI", {}).get("basicAuthEnabled")
 
         enabled = val_root if val_root is not None else val_nested
-        return {"enabled": str(enabled).lower() in ["true", "1", "yes"]}
+        result = {"enabled": str(enabled).lower() in ["true", "1", "yes"]}
+        _auth_config_cache[config_path] = (signature, result)
+        return dict(result)
     except Exception:
         return default_config
\ No newline at end of file
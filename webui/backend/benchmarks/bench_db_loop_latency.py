@@ -0,0 +1,137 @@
+"""
+Event loop latency check for database calls
+
+Fills a temporary imagechoices database, then runs a large query (get_all_choices)
+twice while a ticker coroutine measures how late the event loop wakes it up:
+- called directly inside a coroutine (blocks the loop)
+- awaited through async_db.run_db (runs on the DB thread pool)
+
+Usage:
+    python benchmarks/bench_db_loop_latency.py
+    python benchmarks/bench_db_loop_latency.py --rows 500000 --max-lag-ms 50 --json
+
+Exits with status 1 if the run_db variant lags more than --max-lag-ms.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from async_db import run_db, shutdown_db_executor
+from database import ImageChoicesDB
+from db_pool import close_all_pools
+
+logging.basicConfig(level=logging.ERROR)
+
+TICK_SECONDS = 0.005
+
+
+def fill_database(db: ImageChoicesDB, rows: int):
+    conn = db._get_connection()
+    conn.executemany(
+        """
+        INSERT INTO imagechoices (Title, Type, Rootfolder, LibraryName, Language,
+                                  DownloadSource, FavProviderLink, Manual)
+        VALUES (?, 'Poster', ?, 'Movies', 'en', 'https://image.tmdb.org/t/p/original/x.jpg',
+                'https://www.themoviedb.org/movie/1', 'false')
+        """,
+        (
+            (f"Movie {i}", f"Movie {i} ({1950 + i % 75}) {{tmdb-{i}}}")
+            for i in range(rows)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+async def _ticker(lags: List[float], stop: asyncio.Event):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(loop.time() - expected, 0.0))
+
+
+async def _measure(query) -> Dict:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(TICK_SECONDS * 4)  # let the ticker settle
+
+    start = time.perf_counter()
+    rows = await query()
+    duration = time.perf_counter() - start
+
+    await asyncio.sleep(TICK_SECONDS * 4)
+    stop.set()
+    await ticker
+
+    lags.sort()
+    return {
+        "rows": len(rows),
+        "query_ms": round(duration * 1000, 1),
+        "max_lag_ms": round(lags[-1] * 1000, 1) if lags else None,
+        "p95_lag_ms": round(lags[int(len(lags) * 0.95)] * 1000, 1) if lags else None,
+        "ticks": len(lags),
+    }
+
+
+async def run_benchmark(db: ImageChoicesDB) -> Dict:
+    async def blocking():
+        return db.get_all_choices()
+
+    async def offloaded():
+        return await run_db(db.get_all_choices)
+
+    return {
+        "blocking": await _measure(blocking),
+        "run_db": await _measure(offloaded),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure event loop lag during DB queries")
+    parser.add_argument("--rows", type=int, default=200000, help="Rows to insert")
+    parser.add_argument("--max-lag-ms", type=float, default=100.0, help="Allowed loop lag for run_db")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = ImageChoicesDB(Path(tmp) / "imagechoices.db")
+        fill_database(db, args.rows)
+        try:
+            results = asyncio.run(run_benchmark(db))
+        finally:
+            shutdown_db_executor()
+            close_all_pools()
+
+    passed = results["run_db"]["max_lag_ms"] <= args.max_lag_ms
+    results["max_lag_ms_allowed"] = args.max_lag_ms
+    results["passed"] = passed
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name in ("blocking", "run_db"):
+            result = results[name]
+            print(
+                f"{name:9} {result['rows']} rows in {result['query_ms']} ms | "
+                f"loop lag max {result['max_lag_ms']} ms, p95 {result['p95_lag_ms']} ms "
+                f"({result['ticks']} ticks)"
+            )
+        print(f"run_db lag within {args.max_lag_ms} ms: {'yes' if passed else 'NO'}")
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Media export CSV import benchmark
+
+Writes a synthetic PlexLibexport.csv (long season URL lists, like large TV
+libraries) and imports it into a fresh media export database with:
+- legacy: the former approach (csv.DictReader, per-field cleanup dict, the whole
+  file as one record list, stored in a single transaction)
+- streaming: MediaExportDatabase.import_library_csv (chunked reader and
+  transactions)
+
+Each variant runs in its own process so peak RSS is measured independently.
+
+Usage:
+    python benchmarks/bench_media_export_import.py
+    python benchmarks/bench_media_export_import.py --rows 80000 --seasons 30 --json
+"""
+
+import argparse
+import csv
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from db_pool import close_all_pools
+from media_export_database import CSV_FIELDS, MediaExportDatabase
+
+logging.basicConfig(level=logging.ERROR)
+
+TABLE = "plex_library_export"
+RUN_TIMESTAMP = "2025-01-01T00:00:00"
+
+
+def write_csv(path: Path, rows: int, seasons: int):
+    fields = CSV_FIELDS[TABLE]["fields"]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter=";", quoting=csv.QUOTE_ALL)
+        writer.writerow(fields)
+        for i in range(rows):
+            row = dict.fromkeys(fields, "")
+            row.update({
+                "Library Name": "TV Shows" if i % 2 else "Movies",
+                "Library Type": "show" if i % 2 else "movie",
+                "Library Language": "en",
+                "title": f"Title {i}",
+                "year": str(1950 + i % 75),
+                "tmdbid": str(i),
+                "ratingKey": str(100000 + i),
+                "Path": f"/media/library/Title {i} ({1950 + i % 75})",
+                "RootFoldername": f"Title {i} ({1950 + i % 75}) {{tmdb-{i}}}",
+                "PlexPosterUrl": f"http://plex:32400/library/metadata/{100000 + i}/thumb",
+                "PlexBackgroundUrl": f"http://plex:32400/library/metadata/{100000 + i}/art",
+            })
+            if i % 2:
+                row["SeasonNames"] = ",".join(f"Season {s}" for s in range(1, seasons + 1))
+                row["SeasonNumbers"] = ",".join(str(s) for s in range(1, seasons + 1))
+                row["SeasonRatingKeys"] = ",".join(str(i * 100 + s) for s in range(1, seasons + 1))
+                row["PlexSeasonUrls"] = ",".join(
+                    f"http://plex:32400/library/metadata/{i * 100 + s}/thumb?X-Plex-Token=xxxxxxxxxxxxxxxxxxxx"
+                    for s in range(1, seasons + 1)
+                )
+            writer.writerow(row[field] for field in fields)
+
+
+def legacy_import(db: MediaExportDatabase, csv_path: Path) -> int:
+    records_to_insert = []
+    with open(csv_path, "r", encoding="utf-8") as f:
+        sample = f.read(1024)
+        f.seek(0)
+        delimiter = ";" if ";" in sample else ","
+        for row in csv.DictReader(f, delimiter=delimiter):
+            clean_row = {}
+            for k, v in row.items():
+                if isinstance(v, str):
+                    clean_row[k] = v.strip('"').strip()
+                else:
+                    clean_row[k] = str(v).strip() if v is not None else ""
+            if not clean_row.get("title") and not clean_row.get("ratingKey"):
+                continue
+            records_to_insert.append(
+                (RUN_TIMESTAMP, *(clean_row.get(field, "") for field in CSV_FIELDS[TABLE]["fields"]))
+            )
+    db._store_run_versions(
+        TABLE, RUN_TIMESTAMP, records_to_insert, chunk_size=max(len(records_to_insert), 1)
+    )
+    return len(records_to_insert)
+
+
+def run_variant(variant: str, csv_path: Path) -> Dict:
+    """Import csv_path into a fresh database (runs in the child process)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = MediaExportDatabase(Path(tmp) / "media_export.db")
+        baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        start = time.perf_counter()
+        if variant == "legacy":
+            rows = legacy_import(db, csv_path)
+        else:
+            rows = db.import_library_csv(csv_path, RUN_TIMESTAMP)
+        duration = time.perf_counter() - start
+
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        close_all_pools()
+
+    return {
+        "rows": rows,
+        "seconds": round(duration, 2),
+        "rows_per_second": round(rows / duration) if duration else None,
+        "peak_rss_mb": round(peak_kb / 1024, 1),
+        "import_rss_mb": round((peak_kb - baseline_kb) / 1024, 1),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark media export CSV imports")
+    parser.add_argument("--rows", type=int, default=80000, help="Library items to generate")
+    parser.add_argument("--seasons", type=int, default=20, help="Seasons per show (URL list length)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--variant", choices=("legacy", "streaming"), help=argparse.SUPPRESS)
+    parser.add_argument("--csv", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, args.csv)))
+        return 0
+
+    results = {"rows": args.rows, "seasons": args.seasons}
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "PlexLibexport.csv"
+        write_csv(csv_path, args.rows, args.seasons)
+        results["csv_mb"] = round(csv_path.stat().st_size / 1024 / 1024, 1)
+
+        for variant in ("legacy", "streaming"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--variant", variant, "--csv", str(csv_path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results[variant] = json.loads(output.strip().splitlines()[-1])
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{args.rows} rows, {args.seasons} seasons per show, CSV {results['csv_mb']} MB")
+        for variant in ("legacy", "streaming"):
+            result = results[variant]
+            print(
+                f"{variant:9} {result['rows_per_second']} rows/s ({result['seconds']} s) | "
+                f"peak RSS {result['peak_rss_mb']} MB, +{result['import_rss_mb']} MB during import"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
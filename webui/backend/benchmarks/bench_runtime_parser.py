@@ -0,0 +1,164 @@
+"""
+Micro-benchmark for the runtime/log parsers
+
+Measures parse time per MB of script log for:
+- runtime_parser.parse_runtime_from_log (end-of-run summary from the log tail)
+- run_progress.RunProgressTracker (live metrics from the full streamed log)
+
+Usage:
+    python benchmarks/bench_runtime_parser.py                     # synthetic log
+    python benchmarks/bench_runtime_parser.py --log Logs/Scriptlog.log
+    python benchmarks/bench_runtime_parser.py --json > results.json
+
+Run it against the same recorded logs on each release to compare parse time per MB.
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from run_progress import RunProgressTracker
+from runtime_parser import parse_runtime_from_log
+
+# Only report parser errors, not the per-file info messages
+logging.basicConfig(level=logging.ERROR)
+
+SYNTHETIC_LINES = [
+    "|L.{n}| Start Poster Search for: {title}",
+    "|L.{n}| Searching on TMDB for: {title}",
+    "|L.{n}| Found Poster with text on TMDB",
+    "|L.{n}| Added: /assets/Movies/{title}/poster.jpg",
+    "|L.{n}| Start Background Search for: {title}",
+    "|L.{n}| Took TMDB Fallback background",
+    "|L.{n}| Added: /assets/Movies/{title}/background.jpg",
+    "|L.{n}| Processing assets: {i}/{total}",
+]
+
+
+# End-of-run error summary as written by the script (ArrMode.ps1, TautulliMode.ps1);
+# it contains the [ERROR-HERE] marker but is not an error itself
+SUMMARY_ERRORS_LINE = (
+    "During execution '{errors}' Errors occurred, please check the log for a "
+    "detailed description where you see [ERROR-HERE]."
+)
+
+
+def write_synthetic_log(path: Path, items: int, seed: int = 42) -> int:
+    """Write a log that resembles a normal run with `items` processed titles (returns the error count)"""
+    rng = random.Random(seed)
+    errors = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[2025-11-25 16:00:00] [INFO]    |L.1| --- Processing Library: Movies ---\n")
+        f.write(f"[2025-11-25 16:00:00] [INFO]    |L.2| Found '{items}' Items...\n")
+        for i in range(1, items + 1):
+            title = f"Movie {i} ({rng.randint(1950, 2025)}) {{tmdb-{rng.randint(1, 999999)}}}"
+            for template in SYNTHETIC_LINES:
+                line = template.format(n=rng.randint(100, 9999), title=title, i=i, total=items)
+                f.write(f"[2025-11-25 16:{i // 60 % 60:02d}:{i % 60:02d}] [INFO]    {line}\n")
+            if rng.random() < 0.01:
+                f.write("[2025-11-25 16:00:00] [ERROR]   |L.9| [ERROR-HERE] Could not download artwork\n")
+                errors += 1
+        f.write(
+            f"[2025-11-25 17:00:00] [INFO]    |L.9000| Show/Movie Posters created: {items}| "
+            "Season images created: 0 | Background images created: "
+            f"{items} | TitleCards created: 0\n"
+        )
+        f.write(f"[2025-11-25 17:00:00] [INFO]    |L.9001| Finished, Total images created: {items * 2}\n")
+        f.write(f"[2025-11-25 17:00:00] [INFO]    |L.9002| {SUMMARY_ERRORS_LINE.format(errors=errors)}\n")
+        f.write("[2025-11-25 17:00:00] [INFO]    |L.9003| Script execution time: 1h 0m 0s\n")
+    return errors
+
+
+def _time_best(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _feed_tracker(path: Path):
+    tracker = RunProgressTracker()
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        tracker.feed(f.read().splitlines())
+    return tracker
+
+
+def benchmark_log(path: Path, repeat: int) -> Dict:
+    size_mb = path.stat().st_size / (1024 * 1024)
+
+    summary_seconds = _time_best(lambda: parse_runtime_from_log(path), repeat)
+    tracker_seconds = _time_best(lambda: _feed_tracker(path), repeat)
+
+    return {
+        "log": str(path),
+        "size_mb": round(size_mb, 3),
+        "parse_runtime_from_log_ms": round(summary_seconds * 1000, 3),
+        "progress_tracker_ms": round(tracker_seconds * 1000, 3),
+        "progress_tracker_ms_per_mb": round(tracker_seconds * 1000 / size_mb, 3) if size_mb else None,
+        "progress_tracker_mb_per_s": round(size_mb / tracker_seconds, 2) if tracker_seconds else None,
+        "summary_found": parse_runtime_from_log(path) is not None,
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the runtime/log parsers")
+    parser.add_argument("--log", action="append", type=Path, help="Recorded log file (repeatable)")
+    parser.add_argument("--items", type=int, default=20000, help="Titles in the synthetic log")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    if args.log:
+        for path in args.log:
+            if not path.exists():
+                print(f"Log file not found: {path}", file=sys.stderr)
+                return 1
+            results.append(benchmark_log(path, args.repeat))
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "Scriptlog.log"
+            errors = write_synthetic_log(path, args.items)
+            result = benchmark_log(path, args.repeat)
+            result["log"] = f"synthetic ({args.items} items)"
+            results.append(result)
+
+            # The tracker must count the error lines, not the summary that mentions the marker
+            tracker = _feed_tracker(path)
+            if tracker.errors != errors or tracker.summary.get("errors") != errors:
+                print(
+                    f"RunProgressTracker counted {tracker.errors} errors "
+                    f"(summary: {tracker.summary.get('errors')}), expected {errors}",
+                    file=sys.stderr,
+                )
+                return 1
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    for result in results:
+        print(f"{result['log']} ({result['size_mb']} MB)")
+        print(f"  parse_runtime_from_log: {result['parse_runtime_from_log_ms']} ms")
+        print(
+            f"  RunProgressTracker:     {result['progress_tracker_ms']} ms "
+            f"({result['progress_tracker_ms_per_mb']} ms/MB, "
+            f"{result['progress_tracker_mb_per_s']} MB/s)"
+        )
+        print(f"  summary found:          {result['summary_found']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
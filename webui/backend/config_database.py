@@ -6,15 +6,61 @@ Automatically syncs with config.json on startup
 
 import sqlite3
 import json
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime
 import threading
 import bcrypt 
 
+try:
+    from .db_pool import get_pool
+except ImportError:
+    from db_pool import get_pool
+
 logger = logging.getLogger(__name__)
 
+# Length of the non-secret key prefix stored in api_keys.prefix (indexed lookup)
+API_KEY_PREFIX_LENGTH = 8
+# Verified API keys are trusted this long before bcrypt runs again
+API_KEY_CACHE_TTL_SECONDS = 300
+API_KEY_CACHE_MAX_ENTRIES = 256
+# Pending last_used_at updates are written at most this often
+LAST_USED_FLUSH_SECONDS = 30
+
+
+class _ApiKeyState:
+    """
+    Verified API keys and pending last_used_at updates of one config.db.
+
+    Shared by all ConfigDB instances for the same file (the auth middleware
+    and main.py each create one), so revoking a key drops it everywhere.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # sha256(raw key) -> (key id, expiry (monotonic)), oldest first
+        self.verified: "OrderedDict[bytes, Tuple[int, float]]" = OrderedDict()
+        # key id -> last use (localtime, same format as datetime('now', 'localtime'))
+        self.pending_last_used: Dict[int, str] = {}
+        self.flush_timer: Optional[threading.Timer] = None
+
+
+_api_key_states: Dict[str, _ApiKeyState] = {}
+_api_key_states_lock = threading.Lock()
+
+
+def _api_key_state(db_path: Path) -> _ApiKeyState:
+    key = str(Path(db_path).resolve())
+    with _api_key_states_lock:
+        state = _api_key_states.get(key)
+        if state is None:
+            state = _api_key_states[key] = _ApiKeyState()
+        return state
+
 
 class ConfigDB:
     """Database class for managing configuration and API keys in SQLite"""
@@ -30,12 +76,14 @@ class ConfigDB:
         self.db_path = db_path
         self.config_json_path = config_json_path
         self.lock = threading.RLock()  # Thread-safety lock
+        self._api_keys = _api_key_state(db_path)
 
-    def _get_connection(self):
-        """Helper to create a new, thread-safe connection"""
-        conn = sqlite3.connect(self.db_path, timeout=10)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _get_connection(self, readonly: bool = False):
+        """
+        Get a pooled connection (WAL mode). Readers don't take self.lock;
+        conn.close() returns the connection to the pool.
+        """
+        return get_pool(self.db_path).connection(readonly=readonly)
 
     def connect(self):
         """Establish database connection (now just ensures tables exist)"""
@@ -43,8 +91,9 @@ class ConfigDB:
         self.create_tables()
 
     def close(self):
-        """Close connection - No longer needed as we use per-request connections."""
-        pass
+        """Close connection - No longer needed as we use per-request connections.
+        Writes pending API key last_used_at updates."""
+        self.flush_api_key_usage()
 
     def create_tables(self):
         """Create the config and api_keys tables if they don't exist"""
@@ -110,6 +159,12 @@ class ConfigDB:
                     )
                     """
                 )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_api_keys_prefix
+                    ON api_keys(prefix)
+                    """
+                )
 
                 conn.commit()
                 conn.close()
@@ -304,28 +359,27 @@ class ConfigDB:
 
     def get_value(self, section: str, key: str, default: Any = None) -> Any:
         """Get a configuration value"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT value, value_type FROM config
-                    WHERE section = ? AND key = ?
-                    """,
-                    (section, key),
-                )
-                row = cursor.fetchone()
-                conn.close()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT value, value_type FROM config
+                WHERE section = ? AND key = ?
+                """,
+                (section, key),
+            )
+            row = cursor.fetchone()
+            conn.close()
 
-                if row:
-                    return self._deserialize_value(row["value"], row["value_type"])
-                return default
-            except sqlite3.Error as e:
-                logger.error(f"Error getting value: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return default
+            if row:
+                return self._deserialize_value(row["value"], row["value_type"])
+            return default
+        except sqlite3.Error as e:
+            logger.error(f"Error getting value: {e}")
+            if 'conn' in locals():
+                conn.close()
+            return default
 
     def set_value(self, section: str, key: str, value: Any) -> bool:
         """Set a configuration value"""
@@ -360,54 +414,52 @@ class ConfigDB:
 
     def get_section(self, section: str) -> Dict:
         """Get all values from a configuration section"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT key, value, value_type FROM config
-                    WHERE section = ?
-                    ORDER BY key
-                    """,
-                    (section,),
-                )
-
-                result = {}
-                for row in cursor.fetchall():
-                    key = row["key"]
-                    value = self._deserialize_value(row["value"], row["value_type"])
-                    result[key] = value
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT key, value, value_type FROM config
+                WHERE section = ?
+                ORDER BY key
+                """,
+                (section,),
+            )
+
+            result = {}
+            for row in cursor.fetchall():
+                key = row["key"]
+                value = self._deserialize_value(row["value"], row["value_type"])
+                result[key] = value
 
+            conn.close()
+            return result
+        except sqlite3.Error as e:
+            logger.error(f"Error getting section: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return result
-            except sqlite3.Error as e:
-                logger.error(f"Error getting section: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return {}
+            return {}
 
     def get_all_sections(self) -> list:
         """Get list of all configuration sections"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT DISTINCT section FROM config
-                    WHERE section != '_root'
-                    ORDER BY section
-                    """
-                )
-                sections = [row["section"] for row in cursor.fetchall()]
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT DISTINCT section FROM config
+                WHERE section != '_root'
+                ORDER BY section
+                """
+            )
+            sections = [row["section"] for row in cursor.fetchall()]
+            conn.close()
+            return sections
+        except sqlite3.Error as e:
+            logger.error(f"Error getting sections: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return sections
-            except sqlite3.Error as e:
-                logger.error(f"Error getting sections: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+            return []
 
     def initialize(self):
         """Initialize the database (connect, create tables, import from JSON)"""
@@ -511,38 +563,37 @@ class ConfigDB:
 
     def get_status(self) -> dict:
         """Get status and metadata, thread-safe"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
 
-                cursor.execute("SELECT * FROM config_metadata ORDER BY last_sync_time DESC LIMIT 1")
-                metadata_row = cursor.fetchone()
-                metadata = dict(metadata_row) if metadata_row else None
+            cursor.execute("SELECT * FROM config_metadata ORDER BY last_sync_time DESC LIMIT 1")
+            metadata_row = cursor.fetchone()
+            metadata = dict(metadata_row) if metadata_row else None
 
-                cursor.execute("SELECT COUNT(*) FROM config")
-                total_entries = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM config")
+            total_entries = cursor.fetchone()[0]
 
-                cursor.execute("SELECT COUNT(*) FROM api_keys")
-                api_key_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM api_keys")
+            api_key_count = cursor.fetchone()[0]
 
-                cursor.execute("SELECT DISTINCT section FROM config WHERE section != '_root' ORDER BY section")
-                sections = [row["section"] for row in cursor.fetchall()]
+            cursor.execute("SELECT DISTINCT section FROM config WHERE section != '_root' ORDER BY section")
+            sections = [row["section"] for row in cursor.fetchall()]
 
+            conn.close()
+            return {
+                "database_path": str(self.db_path),
+                "sections": sections,
+                "section_count": len(sections),
+                "total_entries": total_entries,
+                "api_key_count": api_key_count,
+                "metadata": metadata,
+            }
+        except Exception as e:
+            logger.error(f"Error getting config DB status: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return {
-                    "database_path": str(self.db_path),
-                    "sections": sections,
-                    "section_count": len(sections),
-                    "total_entries": total_entries,
-                    "api_key_count": api_key_count,
-                    "metadata": metadata,
-                }
-            except Exception as e:
-                logger.error(f"Error getting config DB status: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return {"error": str(e)}
+            return {"error": str(e)}
 
     # ==========================================
     # API Key Management Methods
@@ -555,7 +606,8 @@ class ConfigDB:
                 # Hash the key
                 key_hash = bcrypt.hashpw(raw_key.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
                 # Store first 8 chars as prefix for display identification
-                prefix = raw_key[:8]
+                # and indexed lookup in validate_api_key
+                prefix = raw_key[:API_KEY_PREFIX_LENGTH]
 
                 conn = self._get_connection()
                 cursor = conn.cursor()
@@ -575,19 +627,19 @@ class ConfigDB:
 
     def list_api_keys(self) -> List[Dict]:
         """List all API keys (excluding the actual hash)"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT id, name, prefix, created_at, last_used_at FROM api_keys ORDER BY created_at DESC")
-                rows = cursor.fetchall()
+        self.flush_api_key_usage()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, name, prefix, created_at, last_used_at FROM api_keys ORDER BY created_at DESC")
+            rows = cursor.fetchall()
+            conn.close()
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error listing API keys: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return [dict(row) for row in rows]
-            except Exception as e:
-                logger.error(f"Error listing API keys: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+            return []
 
     def delete_api_key(self, key_id: int) -> bool:
         """Delete an API key by ID"""
@@ -598,6 +650,7 @@ class ConfigDB:
                 cursor.execute("DELETE FROM api_keys WHERE id = ?", (key_id,))
                 conn.commit()
                 conn.close()
+                self._forget_api_key(key_id)
                 return True
             except Exception as e:
                 logger.error(f"Error deleting API key: {e}")
@@ -609,42 +662,106 @@ class ConfigDB:
         """
         Validate a raw API key against stored hashes in the database.
         Returns True if a match is found, False otherwise.
-        Updates last_used_at timestamp on match.
+
+        Only keys with the same prefix are checked with bcrypt (indexed lookup),
+        and a match is cached for API_KEY_CACHE_TTL_SECONDS. The last_used_at
+        update is queued and written in batches (see flush_api_key_usage).
         """
+        if not raw_key:
+            return False
+
+        state = self._api_keys
+        digest = hashlib.sha256(raw_key.encode('utf-8')).digest()
+        now = time.monotonic()
+        with state.lock:
+            cached = state.verified.get(digest)
+            if cached is not None and cached[1] <= now:
+                del state.verified[digest]
+                cached = None
+        if cached is not None:
+            self._record_api_key_use(cached[0])
+            return True
+
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, key_hash FROM api_keys WHERE prefix = ?",
+                (raw_key[:API_KEY_PREFIX_LENGTH],)
+            )
+            rows = cursor.fetchall()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error validating API key: {e}")
+            if 'conn' in locals():
+                conn.close()
+            return False
+
+        matched_id = None
+        for row in rows:
+            stored_hash = row['key_hash']
+            try:
+                # Verify the provided key against the stored hash
+                if bcrypt.checkpw(raw_key.encode('utf-8'), stored_hash.encode('utf-8')):
+                    matched_id = row['id']
+                    break
+            except ValueError:
+                continue # Skip invalid/malformed hashes
+
+        if matched_id is None:
+            return False
+
+        with state.lock:
+            state.verified[digest] = (matched_id, now + API_KEY_CACHE_TTL_SECONDS)
+            while len(state.verified) > API_KEY_CACHE_MAX_ENTRIES:
+                state.verified.popitem(last=False)
+        self._record_api_key_use(matched_id)
+        return True
+
+    def _record_api_key_use(self, key_id: int):
+        """Queue a last_used_at update and schedule a flush"""
+        state = self._api_keys
+        with state.lock:
+            state.pending_last_used[key_id] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            if state.flush_timer is None:
+                state.flush_timer = threading.Timer(LAST_USED_FLUSH_SECONDS, self.flush_api_key_usage)
+                state.flush_timer.daemon = True
+                state.flush_timer.start()
+
+    def _forget_api_key(self, key_id: int):
+        """Drop cached verifications and pending updates of a deleted key"""
+        state = self._api_keys
+        with state.lock:
+            for digest in [d for d, (cached_id, _) in state.verified.items() if cached_id == key_id]:
+                del state.verified[digest]
+            state.pending_last_used.pop(key_id, None)
+
+    def flush_api_key_usage(self) -> int:
+        """Write queued last_used_at updates in one transaction. Returns the number of keys updated."""
+        state = self._api_keys
+        with state.lock:
+            if state.flush_timer is not None:
+                state.flush_timer.cancel()
+                state.flush_timer = None
+            pending = state.pending_last_used
+            state.pending_last_used = {}
+        if not pending:
+            return 0
+
         with self.lock:
             try:
                 conn = self._get_connection()
                 cursor = conn.cursor()
-                # Get all hashes to check against (bcrypt comparison must be done in Python)
-                cursor.execute("SELECT id, key_hash FROM api_keys")
-                rows = cursor.fetchall()
-                
-                matched_id = None
-                
-                for row in rows:
-                    stored_hash = row['key_hash']
-                    try:
-                        # Verify the provided key against the stored hash
-                        if bcrypt.checkpw(raw_key.encode('utf-8'), stored_hash.encode('utf-8')):
-                            matched_id = row['id']
-                            break
-                    except ValueError:
-                        continue # Skip invalid/malformed hashes
-
-                if matched_id:
-                    # Update last used time
-                    cursor.execute(
-                        "UPDATE api_keys SET last_used_at = datetime('now', 'localtime') WHERE id = ?", 
-                        (matched_id,)
-                    )
-                    conn.commit()
-                    conn.close()
-                    return True
-                
+                cursor.executemany(
+                    "UPDATE api_keys SET last_used_at = ? WHERE id = ?",
+                    [(used_at, key_id) for key_id, used_at in pending.items()]
+                )
+                conn.commit()
                 conn.close()
-                return False
-            except Exception as e:
-                logger.error(f"Error validating API key: {e}")
+                return len(pending)
+            except sqlite3.Error as e:
+                logger.error(f"Error updating API key usage: {e}")
                 if 'conn' in locals():
+                    conn.rollback()
                     conn.close()
-                return False
\ No newline at end of file
+                return 0
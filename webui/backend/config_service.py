@@ -0,0 +1,144 @@
+"""
+Posterizarr Config Service Module
+Cached, read-only access to config.json: the file is parsed once per change
+(detected by mtime/size/inode, or invalidated explicitly after writes) and the
+flattened view is computed once per load
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError("Config snapshots are read-only; use config_service.get_copy()")
+
+
+class FrozenDict(dict):
+    """
+    dict that refuses modification. Still a dict, so it serializes with json and
+    FastAPI (and passes isinstance checks) like the parsed config did.
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """list that refuses modification (see FrozenDict)"""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts and lists into FrozenDicts and FrozenLists"""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a (frozen) config value"""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+class ConfigService:
+    """
+    Shared config.json reader.
+
+    get() and get_flat() return immutable snapshots that callers can keep; a new
+    snapshot is loaded when the file's mtime, size or inode changes, or after
+    invalidate() (call it after writing config.json). A missing or unreadable
+    file yields None.
+    """
+
+    def __init__(self, config_path: Path, flatten: Optional[Callable[[Dict], Dict]] = None):
+        self.config_path = Path(config_path)
+        self.flatten = flatten
+        self._lock = threading.Lock()
+        self._signature = None
+        self._config: Optional[FrozenDict] = None
+        self._flat: Optional[FrozenDict] = None
+        self.loads = 0
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _refresh(self):
+        signature = self._file_signature()
+        if signature is not None and signature == self._signature:
+            return
+        self._signature = signature
+        self._config = None
+        self._flat = None
+        if signature is None:
+            return
+        try:
+            with open(self.config_path, "r", encoding="utf-8") as f:
+                self._config = freeze(json.load(f))
+            self.loads += 1
+            logger.debug(f"Loaded {self.config_path.name} (load #{self.loads})")
+        except (OSError, ValueError) as e:
+            # Retried on the next access (e.g. while the file is being rewritten)
+            logger.error(f"Error reading {self.config_path}: {e}")
+            self._signature = None
+
+    def exists(self) -> bool:
+        return self.get() is not None
+
+    def get(self) -> Optional[FrozenDict]:
+        """Grouped config.json as an immutable snapshot (None if missing/unreadable)"""
+        with self._lock:
+            self._refresh()
+            return self._config
+
+    def get_flat(self) -> Optional[FrozenDict]:
+        """Flattened config (config_mapper.flatten_config), memoized per load"""
+        with self._lock:
+            self._refresh()
+            if self._config is None:
+                return None
+            if self._flat is None:
+                if self.flatten is None:
+                    self._flat = self._config
+                else:
+                    self._flat = freeze(self.flatten(thaw(self._config)))
+            return self._flat
+
+    def get_copy(self) -> Optional[Dict]:
+        """Mutable deep copy of the grouped config, for callers that edit it"""
+        config = self.get()
+        return thaw(config) if config is not None else None
+
+    def invalidate(self):
+        """Reload on the next access (call after writing config.json)"""
+        with self._lock:
+            self._signature = None
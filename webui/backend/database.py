@@ -4,14 +4,88 @@ Database module for ImageChoices tracking
 
 import sqlite3
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Sequence
 import logging
 import csv
 import threading
+import base64
+import hashlib
+import io
+import json
+import re
 from datetime import datetime, timedelta
 
+try:
+    from .db_pool import get_pool
+except ImportError:
+    from db_pool import get_pool
+
 logger = logging.getLogger(__name__)
 
+# Columns that can be selected, filtered or sorted on by query_choices
+IMAGECHOICES_COLUMNS = (
+    "id", "Title", "Type", "Rootfolder", "LibraryName", "Language",
+    "Fallback", "TextTruncated", "DownloadSource", "FavProviderLink",
+    "Manual", "tmdbid", "tvdbid", "imdbid", "LogoSource", "LogoLanguage",
+    "LogoTextFallback", "created_at", "updated_at",
+)
+SORTABLE_COLUMNS = ("id", "Title", "Type", "LibraryName", "Language", "created_at", "updated_at")
+# Sort keys that are never NULL can be compared directly (and use their index)
+NOT_NULL_SORT_COLUMNS = ("id", "Title")
+MANUAL_TRUE_VALUES = ("Yes", "yes", "true", "True")
+MAX_QUERY_LIMIT = 1000
+# Ids per IN (...) list in batch reads/deletes (SQLite's default variable limit is 999)
+MAX_IN_PARAMS = 500
+
+# Full-text index over Title and Rootfolder (external content, kept in sync by triggers)
+FTS_TABLE = "imagechoices_fts"
+# Title matches rank above Rootfolder matches
+FTS_RANK = f"bm25({FTS_TABLE}, 10.0, 1.0)"
+RE_SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+# "{tmdb-123}", "[tvdb-456]", "imdb-tt0078748", "tmdb:123"
+RE_PROVIDER_ID = re.compile(r"\b(tmdb|tvdb|imdb)[-:\s]?(tt\d+|\d+)\b", re.IGNORECASE)
+# Id values that mean "no id" in CSVs and media server exports
+EMPTY_ID_VALUES = ("", "false", "none", "null", "n/a", "0")
+# Media server export database (same folder) used to fill ids for folders without an id tag
+MEDIA_EXPORT_DB_NAME = "media_export.db"
+# Bytes hashed at the start and end of the imported part of a CSV to detect rewrites
+CSV_FINGERPRINT_BYTES = 4096
+# PRAGMA user_version of the imagechoices database after the id backfill
+SCHEMA_VERSION_PROVIDER_IDS = 1
+
+# Assets per day and download provider, kept in sync by triggers for the
+# provider analytics (a few rows per day instead of scanning imagechoices)
+PROVIDER_ROLLUP_TABLE = "provider_daily"
+PROVIDER_DAY = "IFNULL(substr({row}created_at, 1, 10), '')"
+PROVIDER_CASE = """CASE
+    WHEN LOWER({row}DownloadSource) LIKE '%tmdb%' OR LOWER({row}DownloadSource) LIKE '%themoviedb%' THEN 'TMDB'
+    WHEN LOWER({row}DownloadSource) LIKE '%tvdb%' OR LOWER({row}DownloadSource) LIKE '%thetvdb%' THEN 'TVDB'
+    WHEN LOWER({row}DownloadSource) LIKE '%fanart%' THEN 'Fanart'
+    ELSE 'Other'
+END"""
+PROVIDER_NAMES = ("TMDB", "TVDB", "Fanart", "Other")
+
+
+def clean_provider_id(value: Any) -> Optional[str]:
+    """Normalize an id value, returning None for empty/placeholder values"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return None if value.lower() in EMPTY_ID_VALUES else value
+
+
+def extract_provider_ids(rootfolder: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse provider ids out of a folder name, e.g.
+    "Alien (1979) {tmdb-348} [imdb-tt0078748]" -> {"tmdbid": "348", "tvdbid": None, "imdbid": "tt0078748"}
+    """
+    ids = {"tmdbid": None, "tvdbid": None, "imdbid": None}
+    for provider, provider_id in RE_PROVIDER_ID.findall(rootfolder or ""):
+        key = f"{provider.lower()}id"
+        if ids[key] is None:
+            ids[key] = provider_id
+    return ids
+
 
 class ImageChoicesDB:
     """Database handler for ImageChoices.csv data"""
@@ -19,13 +93,15 @@ class ImageChoicesDB:
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.lock = threading.RLock()  # Thread-safety lock
+        self.fts_enabled = False
         self.init_database()
 
-    def _get_connection(self):
-        """Helper to create a new, thread-safe connection"""
-        conn = sqlite3.connect(self.db_path, timeout=10)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _get_connection(self, readonly: bool = False):
+        """
+        Get a pooled connection (WAL mode). Readers don't take self.lock;
+        conn.close() returns the connection to the pool.
+        """
+        return get_pool(self.db_path).connection(readonly=readonly)
 
     def init_database(self):
         """Initialize the database and create table if it doesn't exist"""
@@ -76,6 +152,30 @@ class ImageChoicesDB:
                 cursor.execute(
                     "CREATE INDEX IF NOT EXISTS idx_created_at ON imagechoices(created_at)"
                 )
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_library_type ON imagechoices(LibraryName, Type)"
+                )
+                for id_column in ("tmdbid", "tvdbid", "imdbid"):
+                    cursor.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{id_column} ON imagechoices({id_column})"
+                    )
+
+                # Byte offset and identity of the last CSV import (incremental imports)
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS csv_import_state (
+                        source TEXT PRIMARY KEY,
+                        device INTEGER,
+                        inode INTEGER,
+                        size INTEGER,
+                        offset INTEGER,
+                        rows INTEGER,
+                        header TEXT,
+                        fingerprint TEXT,
+                        updated_at TIMESTAMP
+                    )
+                """
+                )
 
                 conn.commit()
                 conn.close()
@@ -83,6 +183,10 @@ class ImageChoicesDB:
             # Run schema migration check to add columns to existing DBs
             self.check_schema_updates()
 
+            self.fts_enabled = self.init_fts()
+            self.migrate_provider_ids()
+            self.init_provider_rollup()
+
             logger.info("✓ ImageChoices database initialized successfully")
             logger.info("=" * 60)
         except sqlite3.Error as e:
@@ -134,6 +238,311 @@ class ImageChoicesDB:
                 if 'conn' in locals():
                     conn.close()
 
+    def init_fts(self) -> bool:
+        """
+        Create the FTS5 shadow table and its sync triggers. Existing rows are
+        indexed once when the table is created. Returns False if this SQLite
+        build has no FTS5 (search then falls back to LIKE).
+        """
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (FTS_TABLE,),
+                )
+                exists = cursor.fetchone() is not None
+
+                cursor.execute(
+                    f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+                        Title, Rootfolder,
+                        content='imagechoices', content_rowid='id',
+                        tokenize='unicode61 remove_diacritics 2',
+                        prefix='2 3'
+                    )
+                """
+                )
+                cursor.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS imagechoices_fts_insert
+                    AFTER INSERT ON imagechoices BEGIN
+                        INSERT INTO {FTS_TABLE}(rowid, Title, Rootfolder)
+                        VALUES (new.id, new.Title, new.Rootfolder);
+                    END
+                """
+                )
+                cursor.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS imagechoices_fts_delete
+                    AFTER DELETE ON imagechoices BEGIN
+                        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, Title, Rootfolder)
+                        VALUES ('delete', old.id, old.Title, old.Rootfolder);
+                    END
+                """
+                )
+                # Only title/rootfolder changes touch the index (CSV upserts don't)
+                cursor.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS imagechoices_fts_update
+                    AFTER UPDATE OF Title, Rootfolder ON imagechoices BEGIN
+                        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, Title, Rootfolder)
+                        VALUES ('delete', old.id, old.Title, old.Rootfolder);
+                        INSERT INTO {FTS_TABLE}(rowid, Title, Rootfolder)
+                        VALUES (new.id, new.Title, new.Rootfolder);
+                    END
+                """
+                )
+
+                if not exists:
+                    logger.info("MIGRATION: Building full-text search index for imagechoices...")
+                    cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+                conn.commit()
+                conn.close()
+                return True
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Full-text search not available, using LIKE search: {e}")
+                if 'conn' in locals():
+                    conn.rollback()
+                    conn.close()
+                return False
+
+    def init_provider_rollup(self):
+        """
+        Create the provider_daily rollup and its sync triggers. Existing rows are
+        counted once when the table is created.
+        """
+        add = f"""
+            INSERT INTO {PROVIDER_ROLLUP_TABLE}(day, provider, count)
+            VALUES ({PROVIDER_DAY.format(row="new.")}, {PROVIDER_CASE.format(row="new.")}, 1)
+            ON CONFLICT(day, provider) DO UPDATE SET count = count + 1;
+        """
+        remove = f"""
+            UPDATE {PROVIDER_ROLLUP_TABLE} SET count = count - 1
+            WHERE day = {PROVIDER_DAY.format(row="old.")}
+              AND provider = {PROVIDER_CASE.format(row="old.")};
+        """
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (PROVIDER_ROLLUP_TABLE,),
+                )
+                exists = cursor.fetchone() is not None
+
+                cursor.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {PROVIDER_ROLLUP_TABLE} (
+                        day TEXT NOT NULL,
+                        provider TEXT NOT NULL,
+                        count INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (day, provider)
+                    ) WITHOUT ROWID
+                """
+                )
+                cursor.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS provider_daily_insert
+                    AFTER INSERT ON imagechoices BEGIN
+                        {add}
+                    END
+                """
+                )
+                cursor.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS provider_daily_delete
+                    AFTER DELETE ON imagechoices BEGIN
+                        {remove}
+                    END
+                """
+                )
+                # Only source/date changes move a row between buckets (CSV upserts
+                # rewrite DownloadSource with the same value most of the time)
+                cursor.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS provider_daily_update
+                    AFTER UPDATE OF DownloadSource, created_at ON imagechoices
+                    WHEN {PROVIDER_DAY.format(row="old.")} IS NOT {PROVIDER_DAY.format(row="new.")}
+                      OR {PROVIDER_CASE.format(row="old.")} IS NOT {PROVIDER_CASE.format(row="new.")}
+                    BEGIN
+                        {remove}
+                        {add}
+                    END
+                """
+                )
+
+                if not exists:
+                    logger.info("MIGRATION: Building daily provider statistics...")
+                    cursor.execute(
+                        f"""
+                        INSERT INTO {PROVIDER_ROLLUP_TABLE}(day, provider, count)
+                        SELECT {PROVIDER_DAY.format(row="")}, {PROVIDER_CASE.format(row="")}, COUNT(*)
+                        FROM imagechoices
+                        GROUP BY 1, 2
+                    """
+                    )
+
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Error creating provider statistics rollup: {e}")
+                if 'conn' in locals():
+                    conn.rollback()
+                    conn.close()
+
+    def migrate_provider_ids(self):
+        """
+        One-time backfill of tmdbid/tvdbid/imdbid for rows imported before the ids
+        were extracted on import (tracked with PRAGMA user_version)
+        """
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                cursor.execute("PRAGMA user_version")
+                if cursor.fetchone()[0] >= SCHEMA_VERSION_PROVIDER_IDS:
+                    conn.close()
+                    return
+
+                logger.info("MIGRATION: Extracting provider ids from Rootfolder...")
+                cursor.execute(
+                    """
+                    SELECT id, Rootfolder, tmdbid, tvdbid, imdbid FROM imagechoices
+                    WHERE Rootfolder LIKE '%tmdb%' OR Rootfolder LIKE '%tvdb%'
+                       OR Rootfolder LIKE '%imdb%'
+                """
+                )
+                updates = []
+                for row in cursor.fetchall():
+                    ids = extract_provider_ids(row["Rootfolder"])
+                    updates.append((
+                        clean_provider_id(row["tmdbid"]) or ids["tmdbid"],
+                        clean_provider_id(row["tvdbid"]) or ids["tvdbid"],
+                        clean_provider_id(row["imdbid"]) or ids["imdbid"],
+                        row["id"],
+                    ))
+                cursor.executemany(
+                    "UPDATE imagechoices SET tmdbid = ?, tvdbid = ?, imdbid = ? WHERE id = ?",
+                    updates,
+                )
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION_PROVIDER_IDS}")
+                conn.commit()
+                conn.close()
+                logger.info(f"✓ Provider ids extracted for {len(updates)} records")
+            except sqlite3.Error as e:
+                logger.error(f"Error extracting provider ids: {e}")
+                if 'conn' in locals():
+                    conn.rollback()
+                    conn.close()
+
+        self.fill_ids_from_media_export()
+
+    def fill_ids_from_media_export(self, min_id: Optional[int] = None) -> int:
+        """
+        Fill ids for records whose folder name has no id tag from the media server
+        export tables (matched on root folder name). Returns the number of rows updated.
+
+        Args:
+            min_id: Only consider records with a higher id (rows added by one CSV import);
+                None checks all records (after a media server export import)
+        """
+        media_db_path = Path(self.db_path).with_name(MEDIA_EXPORT_DB_NAME)
+        if not media_db_path.exists():
+            return 0
+
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, Rootfolder FROM imagechoices
+                WHERE id > ? AND tmdbid IS NULL AND tvdbid IS NULL AND imdbid IS NULL
+                  AND Rootfolder IS NOT NULL AND Rootfolder != ''
+            """,
+                (min_id or 0,),
+            )
+            missing = cursor.fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error filling provider ids from media exports: {e}")
+            if 'conn' in locals():
+                conn.close()
+            return 0
+        if not missing:
+            return 0
+
+        # Only the current version (valid_to IS NULL) of the items in the missing
+        # folders; "+valid_to" keeps the planner on the root_foldername index
+        folders = sorted({row["Rootfolder"] for row in missing})
+        ids_by_folder = {}
+        try:
+            media_conn = sqlite3.connect(f"file:{media_db_path}?mode=ro", uri=True, timeout=10)
+        except sqlite3.Error as e:
+            logger.error(f"Error opening media export database: {e}")
+            return 0
+        try:
+            for table in ("plex_library_export", "other_media_library_export"):
+                for start in range(0, len(folders), MAX_IN_PARAMS):
+                    chunk = folders[start:start + MAX_IN_PARAMS]
+                    try:
+                        media_rows = media_conn.execute(
+                            f"""
+                            SELECT root_foldername, tmdbid, tvdbid, imdbid FROM {table}
+                            WHERE +valid_to IS NULL
+                              AND root_foldername IN ({", ".join("?" * len(chunk))})
+                        """,  # nosec B608
+                            chunk,
+                        ).fetchall()
+                    except sqlite3.OperationalError:
+                        break
+                    for folder, tmdbid, tvdbid, imdbid in media_rows:
+                        if folder not in ids_by_folder:
+                            ids = (
+                                clean_provider_id(tmdbid),
+                                clean_provider_id(tvdbid),
+                                clean_provider_id(imdbid),
+                            )
+                            if any(ids):
+                                ids_by_folder[folder] = ids
+        finally:
+            media_conn.close()
+
+        updates = [
+            (*ids_by_folder[row["Rootfolder"]], row["id"])
+            for row in missing
+            if row["Rootfolder"] in ids_by_folder
+        ]
+        if not updates:
+            return 0
+
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                # Rows that got ids in the meantime keep them
+                cursor.executemany(
+                    """
+                    UPDATE imagechoices SET tmdbid = ?, tvdbid = ?, imdbid = ?
+                    WHERE id = ? AND tmdbid IS NULL AND tvdbid IS NULL AND imdbid IS NULL
+                """,
+                    updates,
+                )
+                updated = cursor.rowcount
+                conn.commit()
+                conn.close()
+                logger.info(f"Filled provider ids for {updated} records from media server exports")
+                return updated
+            except sqlite3.Error as e:
+                logger.error(f"Error filling provider ids from media exports: {e}")
+                if 'conn' in locals():
+                    conn.rollback()
+                    conn.close()
+                return 0
+
     def close(self):
         """Close connection - No longer needed as connections are per-function."""
         pass
@@ -165,148 +574,319 @@ class ImageChoicesDB:
 
     def get_all_choices(self) -> List[sqlite3.Row]:
         """Get all choices from the database"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM imagechoices ORDER BY id DESC")
-                rows = cursor.fetchall()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM imagechoices ORDER BY id DESC")
+            rows = cursor.fetchall()
+            conn.close()
+            return rows
+        except sqlite3.Error as e:
+            logger.error(f"Error getting all choices: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return rows
-            except sqlite3.Error as e:
-                logger.error(f"Error getting all choices: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+            return []
+
+    @staticmethod
+    def _encode_cursor(sort_value: Any, record_id: int) -> str:
+        payload = json.dumps([sort_value, record_id]).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple:
+        try:
+            sort_value, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            return sort_value, int(record_id)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    @staticmethod
+    def _build_filters(
+        library: Optional[str] = None,
+        asset_type: Optional[str] = None,
+        language: Optional[str] = None,
+        manual: Optional[bool] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+    ) -> tuple:
+        """Build the WHERE conditions and parameters shared by query/count"""
+        conditions = []
+        params: List[Any] = []
+        if library:
+            conditions.append("LibraryName = ?")
+            params.append(library)
+        if asset_type:
+            conditions.append("Type = ?")
+            params.append(asset_type)
+        if language:
+            conditions.append("Language = ? COLLATE NOCASE")
+            params.append(language)
+        if manual is not None:
+            placeholders = ", ".join("?" * len(MANUAL_TRUE_VALUES))
+            if manual:
+                conditions.append(f"Manual IN ({placeholders})")
+            else:
+                conditions.append(f"(Manual IS NULL OR Manual NOT IN ({placeholders}))")
+            params.extend(MANUAL_TRUE_VALUES)
+        if created_from:
+            conditions.append("created_at >= ?")
+            params.append(created_from)
+        if created_to:
+            conditions.append("created_at <= ?")
+            params.append(created_to)
+        return conditions, params
+
+    def query_choices(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        library: Optional[str] = None,
+        asset_type: Optional[str] = None,
+        language: Optional[str] = None,
+        manual: Optional[bool] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        sort: str = "id",
+        order: str = "desc",
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """
+        Query imagechoices with filters, column projection, server-side sorting
+        and keyset pagination (pass the returned next_cursor to get the next page).
+
+        limit=None returns all matching rows in one page.
+
+        Returns:
+            {"items": [...], "next_cursor": str | None, "has_more": bool}
+
+        Raises:
+            ValueError: On unknown columns, sort keys or an invalid cursor
+        """
+        if sort not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort by '{sort}'")
+        order = order.lower()
+        if order not in ("asc", "desc"):
+            raise ValueError(f"Invalid sort order '{order}'")
+
+        if columns:
+            unknown = [c for c in columns if c not in IMAGECHOICES_COLUMNS]
+            if unknown:
+                raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+            # id and the sort key are needed to build the cursor
+            selected = list(dict.fromkeys(["id", sort, *columns]))
+        else:
+            selected = list(IMAGECHOICES_COLUMNS)
+
+        if limit is not None:
+            limit = max(1, min(int(limit), MAX_QUERY_LIMIT))
+
+        sort_expr = f'"{sort}"' if sort in NOT_NULL_SORT_COLUMNS else f"COALESCE(\"{sort}\", '')"
+        conditions, params = self._build_filters(
+            library, asset_type, language, manual, created_from, created_to
+        )
+
+        if cursor:
+            sort_value, last_id = self._decode_cursor(cursor)
+            op = "<" if order == "desc" else ">"
+            if sort == "id":
+                conditions.append(f"id {op} ?")
+                params.append(last_id)
+            else:
+                conditions.append(f"({sort_expr} {op} ? OR ({sort_expr} = ? AND id {op} ?))")
+                params.extend([sort_value, sort_value, last_id])
+
+        query = "SELECT " + ", ".join(f'"{c}"' for c in selected) + " FROM imagechoices"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {sort_expr} {order.upper()}"
+        if sort != "id":
+            query += f", id {order.upper()}"
+        if limit is not None:
+            # One extra row tells whether another page exists
+            query += " LIMIT ?"
+            params.append(limit + 1)
+
+        try:
+            conn = self._get_connection(readonly=True)
+            rows = conn.execute(query, params).fetchall()  # nosec B608
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error querying choices: {e}")
+            if 'conn' in locals():
+                conn.close()
+            return {"items": [], "next_cursor": None, "has_more": False}
+
+        has_more = limit is not None and len(rows) > limit
+        if has_more:
+            rows = rows[:limit]
+
+        items = [dict(row) for row in rows]
+        next_cursor = None
+        if has_more and items:
+            last = items[-1]
+            last_value = last[sort] if last[sort] is not None or sort in NOT_NULL_SORT_COLUMNS else ""
+            next_cursor = self._encode_cursor(last_value, last["id"])
+
+        if columns:
+            wanted = set(columns)
+            items = [{k: v for k, v in item.items() if k in wanted} for item in items]
+
+        return {"items": items, "next_cursor": next_cursor, "has_more": has_more}
+
+    def count_choices(self, **filters) -> int:
+        """Count imagechoices matching the query_choices filters"""
+        conditions, params = self._build_filters(**filters)
+        query = "SELECT COUNT(*) FROM imagechoices"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        try:
+            conn = self._get_connection(readonly=True)
+            count = conn.execute(query, params).fetchone()[0]  # nosec B608
+            conn.close()
+            return count
+        except sqlite3.Error as e:
+            logger.error(f"Error counting choices: {e}")
+            if 'conn' in locals():
+                conn.close()
+            return 0
 
     # NEW METHODS FOR RUNTIME HISTORY & ANALYTICS
 
     def get_assets_created_between(self, start_date: str, end_date: str) -> List[sqlite3.Row]:
         """Get assets created within a specific time range"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                # Use >= and <= to include the boundaries
-                cursor.execute(
-                    "SELECT * FROM imagechoices WHERE created_at >= ? AND created_at <= ? ORDER BY created_at DESC",
-                    (start_date, end_date)
-                )
-                rows = cursor.fetchall()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            # Use >= and <= to include the boundaries
+            cursor.execute(
+                "SELECT * FROM imagechoices WHERE created_at >= ? AND created_at <= ? ORDER BY created_at DESC",
+                (start_date, end_date)
+            )
+            rows = cursor.fetchall()
+            conn.close()
+            return rows
+        except sqlite3.Error as e:
+            logger.error(f"Error getting assets by date range: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return rows
-            except sqlite3.Error as e:
-                logger.error(f"Error getting assets by date range: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+            return []
 
     def get_provider_stats_by_date(self, days: int = 30) -> List[Dict]:
         """
         Get daily statistics of asset providers (TMDB, TVDB, Fanart)
         Returns list of {date: 'YYYY-MM-DD', TMDB: 5, TVDB: 2, ...}
         """
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
 
-                # Calculate cutoff date
-                cutoff_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-
-                # Use substr for reliable YYYY-MM-DD extraction across all SQLite versions
-                query = """
-                    SELECT
-                        substr(created_at, 1, 10) as day,
-                        CASE
-                            WHEN LOWER(DownloadSource) LIKE '%tmdb%' OR LOWER(DownloadSource) LIKE '%themoviedb%' THEN 'TMDB'
-                            WHEN LOWER(DownloadSource) LIKE '%tvdb%' OR LOWER(DownloadSource) LIKE '%thetvdb%' THEN 'TVDB'
-                            WHEN LOWER(DownloadSource) LIKE '%fanart%' THEN 'Fanart'
-                            ELSE 'Other'
-                        END as provider,
-                        COUNT(*) as count
-                    FROM imagechoices
-                    WHERE created_at >= ?
-                    GROUP BY day, provider
-                    ORDER BY day ASC
-                """
+            # Calculate cutoff date
+            cutoff_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
-                cursor.execute(query, (cutoff_date,))
-                rows = cursor.fetchall()
-                conn.close()
+            # Pre-aggregated per day/provider by the provider_daily triggers
+            cursor.execute(
+                f"""
+                SELECT day, provider, count
+                FROM {PROVIDER_ROLLUP_TABLE}
+                WHERE day >= ? AND count > 0
+                ORDER BY day ASC
+            """,
+                (cutoff_date,),
+            )
+            rows = cursor.fetchall()
+            conn.close()
 
-                # Pivot data
-                stats_by_day = {}
+            # Pivot data
+            stats_by_day = {}
 
-                for row in rows:
-                    day = row['day']
-                    if not day or len(day) != 10: continue
+            for row in rows:
+                day = row['day']
+                if not day or len(day) != 10: continue
 
-                    provider = row['provider']
-                    count = row['count']
+                provider = row['provider']
+                count = row['count']
 
-                    if day not in stats_by_day:
-                        stats_by_day[day] = {"date": day, "TMDB": 0, "TVDB": 0, "Fanart": 0, "Other": 0}
+                if day not in stats_by_day:
+                    stats_by_day[day] = {"date": day, **dict.fromkeys(PROVIDER_NAMES, 0)}
 
-                    stats_by_day[day][provider] = count
+                stats_by_day[day][provider] = count
 
-                # Sort by date
-                return sorted(list(stats_by_day.values()), key=lambda x: x['date'])
+            # Sort by date
+            return sorted(list(stats_by_day.values()), key=lambda x: x['date'])
 
-            except sqlite3.Error as e:
-                logger.error(f"Error getting provider stats: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+        except sqlite3.Error as e:
+            logger.error(f"Error getting provider stats: {e}")
+            if 'conn' in locals():
+                conn.close()
+            return []
     #-------------------------------------------------
 
     def get_choice_by_id(self, record_id: int) -> Optional[sqlite3.Row]:
         """Get a specific choice by its ID"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM imagechoices WHERE id = ?", (record_id,))
-                row = cursor.fetchone()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM imagechoices WHERE id = ?", (record_id,))
+            row = cursor.fetchone()
+            conn.close()
+            return row
+        except sqlite3.Error as e:
+            logger.error(f"Error getting choice by ID: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return row
-            except sqlite3.Error as e:
-                logger.error(f"Error getting choice by ID: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return None
+            return None
+
+    def get_choices_by_ids(self, record_ids: Sequence[int]) -> Dict[int, sqlite3.Row]:
+        """Get several choices by id with one query per MAX_IN_PARAMS ids"""
+        records = {}
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            ids = list(dict.fromkeys(record_ids))
+            for start in range(0, len(ids), MAX_IN_PARAMS):
+                chunk = ids[start:start + MAX_IN_PARAMS]
+                cursor.execute(
+                    f"SELECT * FROM imagechoices WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                records.update((row["id"], row) for row in cursor.fetchall())
+            conn.close()
+            return records
+        except sqlite3.Error as e:
+            logger.error(f"Error getting choices by ID: {e}")
+            if 'conn' in locals():
+                conn.close()
+            return records
 
     def get_choice_by_title(self, title: str) -> Optional[sqlite3.Row]:
         """Get a specific choice by its Title"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM imagechoices WHERE Title = ?", (title,))
-                row = cursor.fetchone()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM imagechoices WHERE Title = ?", (title,))
+            row = cursor.fetchone()
+            conn.close()
+            return row
+        except sqlite3.Error as e:
+            logger.error(f"Error getting choice by Title: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return row
-            except sqlite3.Error as e:
-                logger.error(f"Error getting choice by Title: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return None
+            return None
 
     def get_choice_by_rootfolder(self, rootfolder: str) -> Optional[sqlite3.Row]:
         """Get a specific choice by its Rootfolder"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM imagechoices WHERE Rootfolder = ?", (rootfolder,))
-                row = cursor.fetchone()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM imagechoices WHERE Rootfolder = ?", (rootfolder,))
+            row = cursor.fetchone()
+            conn.close()
+            return row
+        except sqlite3.Error as e:
+            logger.error(f"Error getting choice by Rootfolder: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return row
-            except sqlite3.Error as e:
-                logger.error(f"Error getting choice by Rootfolder: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return None
+            return None
 
     def update_choice(self, record_id: int, **kwargs):
         """Update an existing choice and auto-update 'updated_at'"""
@@ -364,69 +944,236 @@ class ImageChoicesDB:
                     conn.close()
                 raise
 
-    def import_from_csv(self, csv_path: Path) -> dict:
+    def delete_choices(self, record_ids: Sequence[int]) -> int:
+        """Delete several choices by id in one transaction"""
+        ids = list(dict.fromkeys(record_ids))
+        if not ids:
+            return 0
+
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                deleted = 0
+                for start in range(0, len(ids), MAX_IN_PARAMS):
+                    chunk = ids[start:start + MAX_IN_PARAMS]
+                    cursor.execute(
+                        f"DELETE FROM imagechoices WHERE id IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                    deleted += cursor.rowcount
+                conn.commit()
+                conn.close()
+                return deleted
+            except sqlite3.Error as e:
+                logger.error(f"Error deleting choices: {e}")
+                if 'conn' in locals():
+                    conn.rollback()
+                    conn.close()
+                raise
+
+    def delete_asset_entries(self, matches: Sequence[tuple]) -> List[Dict]:
+        """
+        Delete the records of several asset files in one transaction.
+
+        Args:
+            matches: (rootfolder, types, title_patterns) per asset; a record matches
+                if its Rootfolder equals rootfolder, its Type is one of types and,
+                when title_patterns is not empty, its Title is LIKE one of them
+
+        Returns:
+            The deleted records (id, Title, Type, Rootfolder)
+        """
+        if not matches:
+            return []
+
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                found = {}
+                for rootfolder, types, title_patterns in matches:
+                    query = (
+                        "SELECT id, Title, Type, Rootfolder FROM imagechoices "
+                        f"WHERE Rootfolder = ? AND Type IN ({','.join('?' * len(types))})"
+                    )
+                    params = [rootfolder, *types]
+                    if title_patterns:
+                        query += f" AND ({' OR '.join(['Title LIKE ?'] * len(title_patterns))})"
+                        params.extend(title_patterns)
+                    cursor.execute(query, params)
+                    for row in cursor.fetchall():
+                        found[row["id"]] = dict(row)
+
+                ids = list(found)
+                for start in range(0, len(ids), MAX_IN_PARAMS):
+                    chunk = ids[start:start + MAX_IN_PARAMS]
+                    cursor.execute(
+                        f"DELETE FROM imagechoices WHERE id IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                conn.commit()
+                conn.close()
+                return list(found.values())
+            except sqlite3.Error as e:
+                logger.error(f"Error deleting asset entries: {e}")
+                if 'conn' in locals():
+                    conn.rollback()
+                    conn.close()
+                raise
+
+    @staticmethod
+    def _csv_row_to_record(clean_row: Dict[str, str]) -> tuple:
+        """Map a cleaned ImageChoices.csv row to the upsert parameter tuple"""
+        ids = extract_provider_ids(clean_row.get("Rootfolder", ""))
+        return (
+            clean_row.get("Title", ""),
+            clean_row.get("Type", ""),
+            clean_row.get("Rootfolder", ""),
+            clean_row.get("LibraryName", ""),
+            clean_row.get("Language", ""),
+            clean_row.get("Fallback", ""),
+            clean_row.get("TextTruncated", ""),
+            clean_row.get("Download Source", ""),
+            clean_row.get("Fav Provider Link", ""),
+            clean_row.get("Manual", ""),
+            clean_row.get("Logo Source", ""),
+            clean_row.get("Logo Language", ""),
+            clean_row.get("Logo TextFallback", ""),
+            ids["tmdbid"],
+            ids["tvdbid"],
+            ids["imdbid"],
+        )
+
+    @staticmethod
+    def _csv_fingerprint(f, offset: int) -> str:
+        """
+        Hash of the first and last CSV_FINGERPRINT_BYTES before offset. If these
+        still match, the already imported part of the file was not rewritten.
+        """
+        f.seek(0)
+        digest = hashlib.sha1(f.read(min(offset, CSV_FINGERPRINT_BYTES)))
+        tail_start = max(offset - CSV_FINGERPRINT_BYTES, 0)
+        f.seek(tail_start)
+        digest.update(f.read(offset - tail_start))
+        return digest.hexdigest()
+
+    def _get_import_state(self, cursor, source: str) -> Optional[Dict]:
+        cursor.execute("SELECT * FROM csv_import_state WHERE source = ?", (source,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def reset_import_state(self, source: str = "ImageChoices.csv"):
+        """Forget the import offset so the next import reads the whole file"""
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                conn.execute("DELETE FROM csv_import_state WHERE source = ?", (source,))
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Error resetting import state for {source}: {e}")
+                if 'conn' in locals():
+                    conn.rollback()
+                    conn.close()
+
+    def import_from_csv(self, csv_path: Path, full: bool = False) -> dict:
         """
         Import data from ImageChoices.csv, inserting new records
         and updating existing ones based on the unique key.
+
+        The byte offset and identity (device/inode, header, fingerprint) of the
+        imported part are stored in csv_import_state. While the script only appends
+        to the file, just the new complete lines are read. A rewritten, replaced or
+        truncated file (or full=True) falls back to a full diff import.
         """
+        empty = {"added": 0, "updated": 0, "skipped": 0, "errors": 0, "error_details": []}
         if not csv_path.exists():
-            return {"added": 0, "updated": 0, "skipped": 0, "errors": 0, "error_details": []}
+            return empty
 
         with self.lock:
             conn = None
+            errors = 0
+            error_details = []
             try:
                 conn = self._get_connection()
                 cursor = conn.cursor()
 
-                records_to_upsert = []
-                errors = 0
-                error_details = []
-
-                with open(csv_path, "r", encoding="utf-8", errors="ignore") as f:
-                    reader = csv.DictReader(f, delimiter=";")
-
-                    for i, row in enumerate(reader):
-                        try:
-                            # Clean up quotes from values
-                            clean_row = {k.strip('"'): v.strip('"') for k, v in row.items()}
-
-                            if not clean_row.get("Title") and not clean_row.get("Rootfolder"):
-                                continue
-
-                            records_to_upsert.append((
-                                clean_row.get("Title", ""),
-                                clean_row.get("Type", ""),
-                                clean_row.get("Rootfolder", ""),
-                                clean_row.get("LibraryName", ""),
-                                clean_row.get("Language", ""),
-                                clean_row.get("Fallback", ""),
-                                clean_row.get("TextTruncated", ""),
-                                clean_row.get("Download Source", ""),
-                                clean_row.get("Fav Provider Link", ""),
-                                clean_row.get("Manual", ""),
-                                clean_row.get("Logo Source", ""),
-                                clean_row.get("Logo Language", ""),
-                                clean_row.get("Logo TextFallback", ""),
-                            ))
-                        except Exception as e_row:
-                            logger.warning(f"Error processing CSV row {i+1}: {e_row}")
-                            errors += 1
-                            error_details.append(f"Row {i+1}: {str(e_row)}")
+                stat = csv_path.stat()
+                state = None if full else self._get_import_state(cursor, csv_path.name)
+
+                with open(csv_path, "rb") as f:
+                    header_line = f.readline()
+                    header = header_line.decode("utf-8-sig", errors="ignore").strip()
+                    header_end = len(header_line) if header_line.endswith(b"\n") else 0
+
+                    incremental = (
+                        state is not None
+                        and state["device"] == stat.st_dev
+                        and state["inode"] == stat.st_ino
+                        and state["header"] == header
+                        and 0 < header_end <= state["offset"] <= stat.st_size
+                        and state["fingerprint"] == self._csv_fingerprint(f, state["offset"])
+                    )
 
-                if records_to_upsert:
-                    cursor.execute("SELECT COUNT(*) FROM imagechoices")
-                    rows_before = cursor.fetchone()[0]
+                    start = state["offset"] if incremental else 0
+                    f.seek(start)
+                    data = f.read()
+                    # Lines after the last newline may still be in the middle of being written
+                    end = start + data.rfind(b"\n") + 1
+                    size = start + len(data)
+                    fingerprint = self._csv_fingerprint(f, end)
 
-                    cursor.execute("SELECT total_changes()")
-                    changes_before = cursor.fetchone()[0]
+                if incremental and end == start:
+                    conn.close()
+                    return {**empty, "mode": "unchanged"}
+
+                if incremental:
+                    fieldnames = next(csv.reader([header], delimiter=";"))
+                    text = data[:end - start].decode("utf-8", errors="ignore")
+                    reader = csv.DictReader(io.StringIO(text), fieldnames=fieldnames, delimiter=";")
+                    first_row = state["rows"]
+                    mode = "incremental"
+                else:
+                    if state is not None:
+                        logger.info(f"{csv_path.name} was rewritten or truncated, running full import")
+                    text = data[:end].decode("utf-8-sig", errors="ignore")
+                    reader = csv.DictReader(io.StringIO(text), delimiter=";")
+                    first_row = 0
+                    mode = "full"
+
+                records_to_upsert = []
+                rows_read = 0
+                for i, row in enumerate(reader, start=first_row):
+                    rows_read += 1
+                    try:
+                        # Clean up quotes from values
+                        clean_row = {k.strip('"'): (v or "").strip('"') for k, v in row.items() if k}
+
+                        if not clean_row.get("Title") and not clean_row.get("Rootfolder"):
+                            continue
+
+                        records_to_upsert.append(self._csv_row_to_record(clean_row))
+                    except Exception as e_row:
+                        logger.warning(f"Error processing CSV row {i+1}: {e_row}")
+                        errors += 1
+                        error_details.append(f"Row {i+1}: {str(e_row)}")
+
+                total_changes = 0
+                added_count = 0
+                if records_to_upsert:
+                    # AUTOINCREMENT ids only grow, so new rows are the ones above this id
+                    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM imagechoices")
+                    max_id_before = cursor.fetchone()[0]
 
                     # UPSERT Logic
                     sql_upsert = """
                         INSERT INTO imagechoices (
                             Title, Type, Rootfolder, LibraryName, Language,
                             Fallback, TextTruncated, DownloadSource, FavProviderLink, Manual,
-                            LogoSource, LogoLanguage, LogoTextFallback
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            LogoSource, LogoLanguage, LogoTextFallback,
+                            tmdbid, tvdbid, imdbid
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                         ON CONFLICT(Title, Rootfolder, Type, LibraryName) DO UPDATE SET
                             Language = excluded.Language,
                             Fallback = excluded.Fallback,
@@ -437,6 +1184,9 @@ class ImageChoicesDB:
                             LogoSource = excluded.LogoSource,
                             LogoLanguage = excluded.LogoLanguage,
                             LogoTextFallback = excluded.LogoTextFallback,
+                            tmdbid = COALESCE(excluded.tmdbid, imagechoices.tmdbid),
+                            tvdbid = COALESCE(excluded.tvdbid, imagechoices.tvdbid),
+                            imdbid = COALESCE(excluded.imdbid, imagechoices.imdbid),
                             updated_at = (datetime('now', 'localtime'))
                         WHERE
                             imagechoices.Language IS NOT excluded.Language OR
@@ -447,35 +1197,58 @@ class ImageChoicesDB:
                             imagechoices.Manual IS NOT excluded.Manual OR
                             imagechoices.LogoSource IS NOT excluded.LogoSource OR
                             imagechoices.LogoLanguage IS NOT excluded.LogoLanguage OR
-                            imagechoices.LogoTextFallback IS NOT excluded.LogoTextFallback
+                            imagechoices.LogoTextFallback IS NOT excluded.LogoTextFallback OR
+                            (excluded.tmdbid IS NOT NULL AND imagechoices.tmdbid IS NOT excluded.tmdbid) OR
+                            (excluded.tvdbid IS NOT NULL AND imagechoices.tvdbid IS NOT excluded.tvdbid) OR
+                            (excluded.imdbid IS NOT NULL AND imagechoices.imdbid IS NOT excluded.imdbid)
                     """
 
                     cursor.executemany(sql_upsert, records_to_upsert)
-                    conn.commit()
-
-                    cursor.execute("SELECT total_changes()")
-                    changes_after = cursor.fetchone()[0]
-
-                    cursor.execute("SELECT COUNT(*) FROM imagechoices")
-                    rows_after = cursor.fetchone()[0]
-
-                    conn.close()
-
-                    total_changes = changes_after - changes_before
-                    added_count = rows_after - rows_before
-                    updated_count = total_changes - added_count
-                    skipped_count = len(records_to_upsert) - total_changes
+                    # Rows inserted or actually updated; unlike total_changes() this
+                    # excludes the writes done by the full-text index triggers
+                    total_changes = cursor.rowcount
 
-                    return {
-                        "added": added_count,
-                        "updated": updated_count,
-                        "skipped": skipped_count,
-                        "errors": errors,
-                        "error_details": error_details,
-                    }
+                    cursor.execute("SELECT COUNT(*) FROM imagechoices WHERE id > ?", (max_id_before,))
+                    added_count = cursor.fetchone()[0]
 
+                # Saved in the same transaction as the rows it describes
+                cursor.execute(
+                    """
+                    INSERT OR REPLACE INTO csv_import_state
+                        (source, device, inode, size, offset, rows, header, fingerprint, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now', 'localtime'))
+                """,
+                    (
+                        csv_path.name,
+                        stat.st_dev,
+                        stat.st_ino,
+                        size,
+                        end,
+                        first_row + rows_read,
+                        header,
+                        fingerprint,
+                    ),
+                )
+                conn.commit()
                 conn.close()
-                return {"added": 0, "updated": 0, "skipped": 0, "errors": errors, "error_details": error_details}
+
+                if mode == "incremental":
+                    logger.debug(
+                        f"Incremental import of {csv_path.name}: {rows_read} new rows "
+                        f"from byte {state['offset']}"
+                    )
+                if added_count:
+                    # New folders without an id tag get their ids from the media server exports
+                    self.fill_ids_from_media_export(min_id=max_id_before)
+
+                return {
+                    "added": added_count,
+                    "updated": total_changes - added_count,
+                    "skipped": len(records_to_upsert) - total_changes,
+                    "errors": errors,
+                    "error_details": error_details,
+                    "mode": mode,
+                }
 
             except Exception as e:
                 logger.error(f"Error importing CSV: {e}")
@@ -508,33 +1281,135 @@ class ImageChoicesDB:
                     conn.close()
                 raise
 
-    def search_assets(self, query: str, limit: int = 5) -> List[Dict]:
-        """Search for assets by title"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                sql = "SELECT * FROM imagechoices WHERE Title LIKE ? OR Rootfolder LIKE ? ORDER BY id DESC LIMIT ?"
-                cursor.execute(sql, (f"%{query}%", f"%{query}%", limit))
+    @staticmethod
+    def _fts_match_expression(query: str, column: Optional[str] = None) -> Optional[str]:
+        """
+        Turn free text into an FTS5 query: every word must match as a token prefix.
+        Returns None if the text has no searchable words.
+        """
+        tokens = RE_SEARCH_TOKEN.findall(query)
+        if not tokens:
+            return None
+        expression = " AND ".join(f'"{token}"*' for token in tokens)
+        if column:
+            return f"{{{column}}} : ({expression})"
+        return expression
+
+    def search_choices(
+        self, query: str, limit: int = 20, column: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Ranked token/prefix search over Title and Rootfolder.
+
+        Args:
+            query: Free text ("star wa" matches "Star Wars")
+            limit: Maximum number of results
+            column: Restrict the match to "Title" or "Rootfolder"
+        """
+        if column not in (None, "Title", "Rootfolder"):
+            raise ValueError(f"Cannot search column '{column}'")
+
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+
+            if self.fts_enabled:
+                expression = self._fts_match_expression(query, column)
+                if expression is None:
+                    conn.close()
+                    return []
+                cursor.execute(
+                    f"""
+                    SELECT imagechoices.*
+                    FROM {FTS_TABLE}
+                    JOIN imagechoices ON imagechoices.id = {FTS_TABLE}.rowid
+                    WHERE {FTS_TABLE} MATCH ?
+                    ORDER BY {FTS_RANK}, imagechoices.id DESC
+                    LIMIT ?
+                """,
+                    (expression, limit),
+                )
+            else:
+                columns = [column] if column else ["Title", "Rootfolder"]
+                where = " OR ".join(f"{c} LIKE ?" for c in columns)
+                cursor.execute(
+                    f"SELECT * FROM imagechoices WHERE {where} ORDER BY id DESC LIMIT ?",  # nosec B608
+                    [f"%{query}%"] * len(columns) + [limit],
+                )
+
+            rows = [dict(row) for row in cursor.fetchall()]
+            conn.close()
+            return rows
+        except sqlite3.Error as e:
+            logger.error(f"Error searching choices: {e}")
+            if 'conn' in locals():
+                conn.close()
+            return []
+
+    def find_by_provider_id(self, text: str, limit: int = 20) -> List[Dict]:
+        """
+        Look up records by a provider id pattern such as "{tmdb-123}", "[tvdb-456]"
+        or "imdb-tt0078748". Uses the extracted id columns first and falls back to
+        a phrase match on the Rootfolder tokens.
+        """
+        match = RE_PROVIDER_ID.search(text)
+        if not match:
+            return []
+        provider, provider_id = match.group(1).lower(), match.group(2)
+
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT * FROM imagechoices WHERE {provider}id = ? ORDER BY id DESC LIMIT ?",  # nosec B608
+                (provider_id, limit),
+            )
+            rows = cursor.fetchall()
+
+            if not rows and self.fts_enabled:
+                # "{tmdb-123}" is indexed as the adjacent tokens "tmdb" "123"
+                cursor.execute(
+                    f"""
+                    SELECT imagechoices.*
+                    FROM {FTS_TABLE}
+                    JOIN imagechoices ON imagechoices.id = {FTS_TABLE}.rowid
+                    WHERE {FTS_TABLE} MATCH ?
+                    ORDER BY imagechoices.id DESC
+                    LIMIT ?
+                """,
+                    (f'{{Rootfolder}} : "{provider} {provider_id}"', limit),
+                )
                 rows = cursor.fetchall()
+
+            conn.close()
+            return [dict(row) for row in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Error looking up provider id {provider}-{provider_id}: {e}")
+            if 'conn' in locals():
                 conn.close()
+            return []
 
-                results = []
-                for row in rows:
-                    r = dict(row)
-                    results.append({
-                        "id": r["id"],
-                        "title": r["Title"],
-                        "type": r["Type"],
-                        "year": "",
-                        "library": r["LibraryName"]
-                    })
-                return results
-            except sqlite3.Error as e:
-                logger.error(f"Error searching assets: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+    def search_assets(self, query: str, limit: int = 5) -> List[Dict]:
+        """Search for assets by title, rootfolder or provider id"""
+        try:
+            rows = self.find_by_provider_id(query, limit) if RE_PROVIDER_ID.search(query) else []
+            if not rows:
+                rows = self.search_choices(query, limit)
+
+            results = []
+            for row in rows:
+                r = dict(row)
+                results.append({
+                    "id": r["id"],
+                    "title": r["Title"],
+                    "type": r["Type"],
+                    "year": "",
+                    "library": r["LibraryName"]
+                })
+            return results
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Error searching assets: {e}")
+            return []
 
 def init_database(db_path: Path) -> ImageChoicesDB:
     """Initialize the database"""
@@ -0,0 +1,226 @@
+"""
+Posterizarr Database Pool Module
+Shared SQLite connection pools (WAL mode, tuned pragmas) with separate reader and
+writer connections for all backend databases
+"""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Connection tuning. synchronous=NORMAL is durable in WAL mode except for the last
+# commits before a power loss, which is fine for this data.
+BUSY_TIMEOUT_MS = 10000
+CACHE_SIZE_KB = 8 * 1024  # 8 MB page cache per connection
+MMAP_SIZE = 64 * 1024 * 1024  # 64 MB memory-mapped I/O
+READER_POOL_SIZE = 8
+WRITER_POOL_SIZE = 2
+
+# WAL needs shared memory, which some network filesystems (SMB/NFS mounts) lack.
+# Set POSTERIZARR_SQLITE_WAL=false to keep the rollback journal on such setups.
+WAL_ENABLED = os.getenv("POSTERIZARR_SQLITE_WAL", "true").lower() != "false"
+
+_DEFAULT = object()
+
+
+class PooledConnection:
+    """
+    Thin wrapper around a pooled sqlite3.Connection. close() returns the connection
+    to its pool instead of closing it; everything else is delegated.
+    """
+
+    def __init__(self, pool: "SQLitePool", conn: sqlite3.Connection, readonly: bool):
+        self._pool = pool
+        self._conn = conn
+        self._readonly = readonly
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._conn, name, value)
+
+    def __enter__(self):
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._conn.__exit__(exc_type, exc, tb)
+
+    def close(self):
+        """Release the connection back to the pool (safe to call more than once)"""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool._release(conn, self._readonly)
+
+    def __del__(self):
+        # Connections leaked on an early return are still given back
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class SQLitePool:
+    """
+    Connection pool for one SQLite database file.
+
+    Readers come from their own pool and are opened with query_only, so in WAL mode
+    API reads run concurrently with each other and with a writer. Writers come from
+    a small separate pool; SQLite serializes the actual write transactions.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        reader_pool_size: int = READER_POOL_SIZE,
+        writer_pool_size: int = WRITER_POOL_SIZE,
+    ):
+        self.db_path = Path(db_path)
+        self.readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(
+            maxsize=reader_pool_size
+        )
+        self.writers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(
+            maxsize=writer_pool_size
+        )
+        self.journal_mode: Optional[str] = None
+        self._init_lock = threading.Lock()
+
+    def _open(self, readonly: bool) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False
+        )
+        cursor = conn.cursor()
+        cursor.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        if self.journal_mode is None:
+            self._set_journal_mode(cursor)
+        cursor.execute("PRAGMA synchronous = NORMAL")
+        cursor.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KB}")
+        cursor.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        cursor.execute("PRAGMA temp_store = MEMORY")
+        if readonly:
+            cursor.execute("PRAGMA query_only = ON")
+        cursor.close()
+        return conn
+
+    def _set_journal_mode(self, cursor: sqlite3.Cursor):
+        """Switch the database file to WAL once (the mode is persistent)"""
+        with self._init_lock:
+            if self.journal_mode is not None:
+                return
+            mode = "wal" if WAL_ENABLED else "delete"
+            try:
+                cursor.execute(f"PRAGMA journal_mode = {mode}")
+                self.journal_mode = str(cursor.fetchone()[0]).lower()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not set journal mode for {self.db_path.name}: {e}")
+                self.journal_mode = "unknown"
+                return
+            if self.journal_mode != mode:
+                logger.warning(
+                    f"{self.db_path.name}: journal_mode={mode} not supported, "
+                    f"using {self.journal_mode}"
+                )
+            else:
+                logger.debug(f"{self.db_path.name}: journal_mode={self.journal_mode}")
+
+    def connection(
+        self, readonly: bool = False, row_factory: Optional[Callable] = _DEFAULT
+    ) -> PooledConnection:
+        """
+        Get a connection from the pool. Call close() (or use the connection in a
+        `with closing(...)` block) to give it back.
+
+        Args:
+            readonly: Use a reader connection (writes fail with "attempt to write a readonly database")
+            row_factory: Row factory for this use (defaults to sqlite3.Row)
+        """
+        pool = self.readers if readonly else self.writers
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            conn = self._open(readonly)
+        conn.row_factory = sqlite3.Row if row_factory is _DEFAULT else row_factory
+        return PooledConnection(self, conn, readonly)
+
+    def _release(self, conn: sqlite3.Connection, readonly: bool):
+        try:
+            # Anything not committed by the caller is discarded, like on close()
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+
+        pool = self.readers if readonly else self.writers
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close_all(self):
+        """Close all idle connections (e.g. on shutdown or before replacing the file)"""
+        for pool in (self.readers, self.writers):
+            while True:
+                try:
+                    conn = pool.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+
+
+def backup_database(source: Path, destination: Path):
+    """
+    Copy a live database to destination with the SQLite backup API. A plain file
+    copy would miss commits that are still in the -wal file.
+    """
+    src = sqlite3.connect(source, timeout=BUSY_TIMEOUT_MS / 1000)
+    try:
+        dst = sqlite3.connect(destination)
+        try:
+            src.backup(dst)
+            # Keep the copy self-contained (no -wal/-shm side files)
+            dst.execute("PRAGMA journal_mode = DELETE")
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Path) -> SQLitePool:
+    """Return the shared pool for a database file (one per resolved path)"""
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SQLitePool(Path(db_path))
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools():
+    """Close the idle connections of every pool"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
@@ -0,0 +1,199 @@
+"""
+Posterizarr Import Scheduler Module
+Debounced, coalescing scheduler for the database imports triggered by file changes
+in the Logs directory (one pending import per source, a small bounded worker pool)
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Imports of different sources (CSV, Plex export, runtime JSON) may run in parallel;
+# imports of the same source never do
+DEFAULT_MAX_WORKERS = 2
+
+
+@dataclass
+class ImportSource:
+    """An import job and its debounce settings"""
+
+    func: Callable[..., Any]
+    debounce_seconds: float
+    # Upper bound for how long continuous triggers can postpone the import
+    # (keeps the database current while a file is written to during a whole run)
+    max_delay_seconds: Optional[float] = None
+    triggers: int = 0
+    coalesced: int = 0
+    runs: int = 0
+    failures: int = 0
+    last_run: Optional[float] = None
+    last_duration: Optional[float] = None
+
+
+@dataclass
+class _PendingImport:
+    first_trigger: float
+    due: float
+    triggers: int = 1
+
+
+class ImportScheduler:
+    """
+    Collects import triggers and runs each import once per burst.
+
+    A trigger schedules its job after the source's debounce window; more triggers
+    for the same key inside the window are coalesced and push the run back (up to
+    max_delay_seconds after the first trigger). A trigger that arrives while the
+    same import is running schedules exactly one follow-up run.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, name: str = "LogsImport"):
+        self.name = name
+        self.sources: Dict[str, ImportSource] = {}
+        self._pending: Dict[Tuple[str, Hashable], _PendingImport] = {}
+        self._running: set = set()
+        # Keys triggered again while their import was running
+        self._rerun: set = set()
+        self._cond = threading.Condition()
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def register(
+        self,
+        source: str,
+        func: Callable[..., Any],
+        debounce_seconds: float,
+        max_delay_seconds: Optional[float] = None,
+    ):
+        """Register an import job. func is called with the trigger key, if one was given."""
+        self.sources[source] = ImportSource(func, debounce_seconds, max_delay_seconds)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        self._thread = threading.Thread(target=self._dispatch_loop, daemon=True, name=f"{self.name}Scheduler")
+        self._thread.start()
+
+    def stop(self, wait: bool = True):
+        """Stop dispatching; pending (not yet due) imports are dropped"""
+        with self._cond:
+            self._stopped = True
+            self._pending.clear()
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=5)
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+
+    def trigger(self, source: str, key: Hashable = None) -> bool:
+        """
+        Request an import of source (key: e.g. the file name for per-file imports).
+        Returns False if the trigger was coalesced into an already pending or running import.
+        """
+        config = self.sources[source]
+        now = time.monotonic()
+        item = (source, key)
+
+        with self._cond:
+            if self._stopped:
+                return False
+            config.triggers += 1
+
+            if item in self._running:
+                config.coalesced += 1
+                self._rerun.add(item)
+                return False
+
+            pending = self._pending.get(item)
+            if pending is not None:
+                config.coalesced += 1
+                pending.triggers += 1
+                pending.due = now + config.debounce_seconds
+                if config.max_delay_seconds is not None:
+                    pending.due = min(pending.due, pending.first_trigger + config.max_delay_seconds)
+                self._cond.notify_all()
+                return False
+
+            self._pending[item] = _PendingImport(now, now + config.debounce_seconds)
+            self._cond.notify_all()
+            return True
+
+    def _dispatch_loop(self):
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                due = [
+                    item
+                    for item, pending in self._pending.items()
+                    if pending.due <= now and item not in self._running
+                ]
+                if not due:
+                    next_due = min((p.due for p in self._pending.values()), default=None)
+                    self._cond.wait(None if next_due is None else max(next_due - now, 0.01))
+                    continue
+                for item in due:
+                    pending = self._pending.pop(item)
+                    self._running.add(item)
+                    if pending.triggers > 1:
+                        logger.debug(f"Import {item[0]} {item[1] or ''}: {pending.triggers} triggers coalesced")
+                    self._executor.submit(self._run, item)
+
+    def _run(self, item: Tuple[str, Hashable]):
+        source, key = item
+        config = self.sources[source]
+        start = time.monotonic()
+        try:
+            if key is None:
+                config.func()
+            else:
+                config.func(key)
+        except Exception as e:
+            config.failures += 1
+            logger.error(f"Import {source} failed: {e}", exc_info=True)
+        finally:
+            duration = time.monotonic() - start
+            with self._cond:
+                config.runs += 1
+                config.last_run = time.time()
+                config.last_duration = duration
+                self._running.discard(item)
+                if item in self._rerun and not self._stopped:
+                    # Changes written during the import: import once more after the window
+                    self._rerun.discard(item)
+                    now = time.monotonic()
+                    self._pending[item] = _PendingImport(now, now + config.debounce_seconds)
+                self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source trigger/coalescing counters for the status endpoint"""
+        with self._cond:
+            pending_sources = {source for source, _ in self._pending}
+            running_sources = {source for source, _ in self._running}
+            return {
+                source: {
+                    "debounce_seconds": config.debounce_seconds,
+                    "max_delay_seconds": config.max_delay_seconds,
+                    "triggers": config.triggers,
+                    "coalesced": config.coalesced,
+                    "runs": config.runs,
+                    "failures": config.failures,
+                    "pending": source in pending_sources,
+                    "running": source in running_sources,
+                    "last_run": config.last_run,
+                    "last_duration_seconds": (
+                        round(config.last_duration, 3) if config.last_duration is not None else None
+                    ),
+                }
+                for source, config in self.sources.items()
+            }
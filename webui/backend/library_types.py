@@ -0,0 +1,133 @@
+"""
+Posterizarr Library Types Module
+In-memory map of library name -> library type (movie/show) built from the media
+export tables and the cached media server libraries, used to classify assets
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Unknown library names are looked up again at most this often
+NEGATIVE_TTL_SECONDS = 300
+
+SHOW_TYPES = {"show", "shows", "series", "tvshows", "tvshow"}
+MOVIE_TYPES = {"movie", "movies"}
+
+
+def normalize_library_type(library_type: Optional[str]) -> Optional[str]:
+    """Map export/server library types to "movie" or "show" (other types lowercased)"""
+    if not library_type:
+        return None
+    lib_type_lower = library_type.strip().lower()
+    if lib_type_lower in SHOW_TYPES:
+        return "show"
+    if lib_type_lower in MOVIE_TYPES:
+        return "movie"
+    return lib_type_lower or None
+
+
+class LibraryTypeRegistry:
+    """
+    Library types of all known libraries, loaded with one query per source.
+
+    The map is rebuilt lazily when the media export database or the server
+    libraries database report new data (their data_version changes on import/save).
+    Names that are not found are cached as misses for NEGATIVE_TTL_SECONDS; a miss
+    after that rebuilds the map once, so folders that aren't libraries can't cause
+    a query per file.
+    """
+
+    def __init__(self, media_export_db=None, server_libraries_db=None, negative_ttl: float = NEGATIVE_TTL_SECONDS):
+        self.media_export_db = media_export_db
+        self.server_libraries_db = server_libraries_db
+        self.negative_ttl = negative_ttl
+        self._types: Dict[str, str] = {}
+        self._misses: Dict[str, float] = {}
+        self._versions = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.loads = 0
+
+    def _current_versions(self):
+        return (
+            getattr(self.media_export_db, "data_version", None),
+            getattr(self.server_libraries_db, "data_version", None),
+        )
+
+    def _load(self):
+        types: Dict[str, str] = {}
+        # Media server libraries only fill names the exports don't know
+        if self.server_libraries_db is not None:
+            try:
+                for name, library_type in self.server_libraries_db.get_library_types().items():
+                    normalized = normalize_library_type(library_type)
+                    if normalized:
+                        types[name] = normalized
+            except Exception as e:
+                logger.error(f"[LibraryType] Error loading server library types: {e}")
+        if self.media_export_db is not None:
+            try:
+                for name, library_type in self.media_export_db.get_library_types().items():
+                    normalized = normalize_library_type(library_type)
+                    if normalized:
+                        types[name] = normalized
+            except Exception as e:
+                logger.error(f"[LibraryType] Error loading export library types: {e}")
+
+        self._types = types
+        self._misses = {}
+        self._loaded_at = time.monotonic()
+        self.loads += 1
+        logger.debug(f"[LibraryType] Loaded {len(types)} library types")
+
+    def get(self, library_name: str) -> Optional[str]:
+        """Normalized type ("movie", "show", ...) of a library, or None if unknown"""
+        if not library_name:
+            return None
+        with self._lock:
+            versions = self._current_versions()
+            if versions != self._versions:
+                self._versions = versions
+                self._load()
+
+            library_type = self._types.get(library_name)
+            if library_type is not None:
+                self.hits += 1
+                return library_type
+
+            now = time.monotonic()
+            missed_at = self._misses.get(library_name)
+            if missed_at is not None and now - missed_at < self.negative_ttl:
+                self.negative_hits += 1
+                return None
+
+            # Unknown (or stale miss): reload once per TTL, then cache the result
+            if now - self._loaded_at >= self.negative_ttl:
+                self._load()
+                library_type = self._types.get(library_name)
+                if library_type is not None:
+                    return library_type
+            self._misses[library_name] = now
+            logger.debug(f"[LibraryType] No library type found for '{library_name}'")
+            return None
+
+    def invalidate(self):
+        """Drop the map; the next lookup rebuilds it"""
+        with self._lock:
+            self._versions = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "libraries": len(self._types),
+                "cached_misses": len(self._misses),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "loads": self.loads,
+            }
@@ -0,0 +1,285 @@
+"""
+Posterizarr Log Sinks Module
+Structured (JSON-lines) log output and gzip-rotated log files for the WebUI backend,
+plus readers that understand rotated segments
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import List, Optional
+
+# Size-based rotation defaults for BackendServer.log / FrontendUI.log
+LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB per segment
+LOG_BACKUP_COUNT = 5
+
+# Size-based rotation defaults for the JSON-lines sink
+JSON_LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB per segment
+JSON_LOG_BACKUP_COUNT = 3
+
+# Attribute set on LogRecords that originate from the frontend (/api/logs/ui)
+UI_COMPONENT_ATTR = "ui_component"
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    """Compress the rotated segment and remove the uncompressed original"""
+    with open(source, "rb") as sf, gzip.open(dest, "wb") as df:
+        shutil.copyfileobj(sf, df)
+    os.remove(source)
+
+
+class GzipRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that gzips rotated segments.
+    Segments are named <file>.1.gz (newest) ... <file>.N.gz (oldest).
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        max_bytes: int = LOG_MAX_BYTES,
+        backup_count: int = LOG_BACKUP_COUNT,
+        encoding: str = "utf-8",
+    ):
+        super().__init__(
+            filename,
+            mode="a",
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding=encoding,
+        )
+        self.namer = _gzip_namer
+        self.rotator = _gzip_rotator
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats a LogRecord as a single JSON object per line"""
+
+    def __init__(self, datefmt: str = "%Y-%m-%d %H:%M:%S"):
+        super().__init__(datefmt=datefmt)
+
+    def format(self, record: logging.LogRecord) -> str:
+        ui_component = getattr(record, UI_COMPONENT_ATTR, None)
+
+        entry = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+        }
+
+        if ui_component is not None:
+            entry["source"] = "frontend"
+            entry["component"] = ui_component
+        else:
+            entry["source"] = "backend"
+            entry["component"] = f"{record.name}:{record.funcName}:{record.lineno}"
+            entry["logger"] = record.name
+            entry["function"] = record.funcName
+            entry["line"] = record.lineno
+
+        entry["message"] = record.getMessage()
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ExcludeUIRecordsFilter(logging.Filter):
+    """Drops frontend records so they are not duplicated in text sinks"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not hasattr(record, UI_COMPONENT_ATTR)
+
+
+def create_json_lines_handler(
+    path: Path,
+    level: int,
+    max_bytes: int = JSON_LOG_MAX_BYTES,
+    backup_count: int = JSON_LOG_BACKUP_COUNT,
+) -> logging.Handler:
+    """Create a size-rotated handler that writes JSON-lines records to path"""
+    handler = GzipRotatingFileHandler(
+        path, max_bytes=max_bytes, backup_count=backup_count
+    )
+    handler.setLevel(level)
+    handler.setFormatter(JsonLinesFormatter())
+    return handler
+
+
+def make_ui_log_record(level: str, component: str, message: str) -> logging.LogRecord:
+    """Build a LogRecord for a frontend log entry so it can flow through the logging queue"""
+    levelno = logging.getLevelName(level.upper())
+    if not isinstance(levelno, int):
+        levelno = logging.INFO
+
+    record = logging.LogRecord(
+        name="UI",
+        level=levelno,
+        pathname="",
+        lineno=0,
+        msg=message,
+        args=None,
+        exc_info=None,
+        func=component,
+    )
+    # Keep the level name the frontend sent (e.g. "LOG"), matching FrontendUI.log
+    record.levelname = level.upper()
+    setattr(record, UI_COMPONENT_ATTR, component)
+    return record
+
+
+def format_raw_line(entry: dict) -> str:
+    """Rebuild the human-readable FrontendUI.log line for a structured entry"""
+    prefix = "UI" if entry.get("source") == "frontend" else "BACKEND"
+    return (
+        f"[{entry.get('timestamp', '')}] [{entry.get('level', ''):8}] "
+        f"[{prefix}:{entry.get('component', '')}] - {entry.get('message', '')}"
+    )
+
+
+def rotated_segments(path: Path) -> List[Path]:
+    """Return the existing rotated segments of path, newest first"""
+    segments = []
+    index = 1
+    while True:
+        for candidate in (
+            path.with_name(f"{path.name}.{index}.gz"),
+            path.with_name(f"{path.name}.{index}"),
+        ):
+            if candidate.exists():
+                segments.append(candidate)
+                break
+        else:
+            return segments
+        index += 1
+
+
+def open_log_segment(path: Path, binary: bool = False):
+    """Open a (possibly gzip-compressed) log segment for reading"""
+    if path.suffix == ".gz":
+        if binary:
+            return gzip.open(path, "rb")
+        return gzip.open(path, "rt", encoding="utf-8", errors="ignore")
+    if binary:
+        return open(path, "rb")
+    return open(path, "r", encoding="utf-8", errors="ignore")
+
+
+def read_last_lines(path: Path, count: int, block_size: int = 64 * 1024) -> List[str]:
+    """
+    Return the last `count` lines of an uncompressed file by reading backwards
+    in blocks, so the cost depends on the tail size rather than the file size.
+    Line endings are normalized to "\n".
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+
+    raw_lines = data.splitlines(keepends=True)
+    if position > 0 and raw_lines:
+        # The first line is only partially read
+        raw_lines = raw_lines[1:]
+
+    lines = []
+    for raw in raw_lines[-count:] if count else raw_lines:
+        line = raw.decode("utf-8", errors="ignore")
+        if line.endswith(("\n", "\r")):
+            line = line.rstrip("\r\n") + "\n"
+        lines.append(line)
+    return lines
+
+
+def read_log_tail(
+    path: Path, count: Optional[int], include_rotated: bool = True
+) -> List[str]:
+    """
+    Return the last `count` lines of a log, continuing into rotated segments
+    when the current file holds fewer lines. Only `count` lines are kept in memory.
+    A falsy count returns the whole current segment.
+    """
+    if not count:
+        if not path.exists():
+            return []
+        with open_log_segment(path) as f:
+            return f.readlines()
+
+    lines: deque = deque(maxlen=count)
+    if path.exists():
+        lines.extend(read_last_lines(path, count))
+
+    if include_rotated:
+        for segment in rotated_segments(path):
+            missing = count - len(lines)
+            if missing <= 0:
+                break
+            try:
+                with open_log_segment(segment) as f:
+                    older = deque(f, maxlen=missing)
+            except (OSError, EOFError) as e:
+                logging.getLogger(__name__).warning(
+                    f"Could not read rotated log segment {segment.name}: {e}"
+                )
+                break
+            lines = deque([*older, *lines], maxlen=count)
+
+    return list(lines)
+
+
+def read_rotated_remainder(path: Path, position: int) -> List[str]:
+    """
+    Return the lines written to path after byte `position` that ended up in the
+    newest rotated segment (used by tailers when the file was rotated under them)
+    """
+    segments = rotated_segments(path)
+    if not segments:
+        return []
+    try:
+        with open_log_segment(segments[0], binary=True) as f:
+            f.seek(position)
+            data = f.read()
+    except (OSError, EOFError):
+        return []
+    return data.decode("utf-8", errors="ignore").splitlines()
+
+
+def read_json_lines_tail(path: Path, tail: Optional[int] = None) -> List[dict]:
+    """
+    Read the last `tail` entries from a JSON-lines log file (including rotated segments).
+    Lines that are not valid JSON (e.g. a partially written last line) are skipped.
+    """
+    entries = []
+    for line in read_log_tail(path, tail):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+def parse_entry_timestamp(entry: dict) -> datetime:
+    """Sort key for structured entries (unknown timestamps sort first)"""
+    try:
+        return datetime.strptime(entry.get("timestamp", ""), "%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError):
+        return datetime.min
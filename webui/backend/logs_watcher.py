@@ -8,7 +8,7 @@ Features:
 - Watches for ImageChoices.csv modifications
 - Watches for runtime JSON files (tautulli.json, arr.json, etc.)
 - Watches for Plex export CSVs (PlexLibexport.csv, PlexEpisodeExport.csv)
-- Debounces file changes to avoid duplicate imports
+- Debounces and coalesces file changes (one pending import per file, bounded workers)
 - Thread-safe background monitoring
 - Hybrid event-based + polling approach for reliability
 """
@@ -18,10 +18,10 @@ import time
 import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
-from datetime import datetime
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent
 from runtime_parser import parse_runtime_from_json
+from import_scheduler import ImportScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -57,17 +57,37 @@ class LogsWatcher:
         self.handler: Any = None  # LogsFileHandler instance
         self.is_running = False
 
-        # Debouncing: Track last import times
+        # Debouncing: bursts of events for the same file become a single import.
+        # While a file keeps changing, imports still run at least every max_delay seconds.
         self.lock = threading.RLock()
-        self.last_csv_import: float = 0
-        self.last_json_imports: Dict[str, float] = {}
-        self.last_plex_import: float = 0
-        self.last_other_media_import: float = 0
-        self.debounce_seconds = 2  # Wait 2 seconds before re-importing same file
+        self.debounce_seconds = 2  # Quiet period before importing ImageChoices.csv / runtime JSONs
+        self.export_debounce_seconds = 5  # Plex/OtherMedia exports are written in larger chunks
+        self.scheduler = ImportScheduler(max_workers=2)
+        self.scheduler.register(
+            "csv", self._safe_import_csv, self.debounce_seconds, max_delay_seconds=30
+        )
+        self.scheduler.register(
+            "plex_csv", self._safe_import_plex, self.export_debounce_seconds, max_delay_seconds=60
+        )
+        self.scheduler.register(
+            "other_media_csv",
+            self._safe_import_other_media,
+            self.export_debounce_seconds,
+            max_delay_seconds=60,
+        )
+        self.scheduler.register(
+            "runtime_json", self._safe_import_runtime, self.debounce_seconds
+        )
 
-        # Polling fallback for Windows/Docker reliability
+        # Polling fallback for Windows/Docker reliability. The full file scan only runs
+        # until native filesystem events are confirmed; the interval backs off when idle.
         self.poll_thread: Any = None  # Background polling thread
-        self.poll_interval = 5  # Check every 5 seconds
+        self.poll_interval = 5  # Base interval (seconds) while files are changing
+        self.max_poll_interval = 60  # Idle interval (seconds)
+        self.current_poll_interval = self.poll_interval
+        self.native_events_ok = False  # Set once the observer delivered an event
+        self.events_since_poll = 0
+        self._stop_event = threading.Event()
         self.last_file_mtimes: Dict[str, float] = {}  # Track file modification times
 
         # Track files that existed at startup (to prevent restart duplicates)
@@ -134,6 +154,8 @@ class LogsWatcher:
             )
 
             self.is_running = True
+            self._stop_event.clear()
+            self.scheduler.start()
 
             # Record which files exist at startup (to prevent restart duplicates)
             logger.debug("Recording existing files at startup...")
@@ -160,7 +182,9 @@ class LogsWatcher:
             logger.debug(
                 f"[OK] Polling thread started (alive: {self.poll_thread.is_alive()})"
             )
-            logger.debug(f"  - Poll interval: {self.poll_interval}s")
+            logger.debug(
+                f"  - Poll interval: {self.poll_interval}s (idle: up to {self.max_poll_interval}s)"
+            )
             logger.debug(f"  - Thread ID: {self.poll_thread.ident}")
 
             logger.info("=" * 80)
@@ -199,15 +223,29 @@ class LogsWatcher:
                 logger.debug("Observer thread stopped")
 
             self.is_running = False
+            self._stop_event.set()
+            self.scheduler.stop(wait=False)
             logger.info("LogsWatcher stopped")
 
         except Exception as e:
             logger.error(f"Error stopping LogsWatcher: {e}", exc_info=True)
 
+    def note_native_event(self):
+        """Called by the handler for every filesystem event: native events work"""
+        with self.lock:
+            self.events_since_poll += 1
+            if not self.native_events_ok:
+                self.native_events_ok = True
+                logger.info("Native filesystem events confirmed, file polling paused")
+
     def _poll_files(self):
         """
         Polling thread that checks file modification times.
         This is a fallback for Windows/Docker where watchdog events can be missed.
+
+        While native events are confirmed, only the directory mtime is checked
+        (as a canary for missed events); otherwise the monitored files are scanned.
+        Idle cycles double the interval up to max_poll_interval.
         """
         logger.info("=" * 80)
         logger.info("POLLING THREAD STARTED")
@@ -235,383 +273,336 @@ class LogsWatcher:
         )
 
         poll_count = 0
+        interval = self.poll_interval
+        last_dir_mtime = None
 
         while self.is_running:
             try:
-                if not self.logs_dir.exists():
+                try:
+                    # Canary: a single stat of the directory. Its mtime changes when files
+                    # are created, replaced or removed (not on in-place writes).
+                    dir_mtime = self.logs_dir.stat().st_mtime_ns
+                except FileNotFoundError:
                     if poll_count % 12 == 1:
                         logger.warning(f"Logs directory {self.logs_dir} is temporarily missing (possibly rotating). Waiting...")
-                    time.sleep(self.poll_interval)
+                    poll_count += 1
+                    self._stop_event.wait(self.poll_interval)
                     continue
 
                 poll_count += 1
+                dir_changed = last_dir_mtime is not None and dir_mtime != last_dir_mtime
+                with self.lock:
+                    events_seen = self.events_since_poll
+                    self.events_since_poll = 0
+
+                if dir_changed and not events_seen and self.native_events_ok:
+                    # Give an event that is still on its way a moment to arrive
+                    self._stop_event.wait(1)
+                    with self.lock:
+                        events_seen = self.events_since_poll
+                        self.events_since_poll = 0
+                    if not events_seen:
+                        logger.warning(
+                            "Logs directory changed without filesystem events, falling back to polling"
+                        )
+                        self.native_events_ok = False
+                if self.native_events_ok and not (self.observer and self.observer.is_alive()):
+                    self.native_events_ok = False
 
-                # Log every 12 polls (1 minute if poll_interval is 5s)
-                if poll_count % 12 == 1:
-                    logger.debug(f"Poll cycle #{poll_count} - checking files...")
-
-                # Check CSV file (case-insensitive by scanning directory)
-                csv_found = False
-                try:
-                    for file in self.logs_dir.iterdir():
-                        if file.is_file() and file.name.lower() == "imagechoices.csv":
-                            csv_found = True
-                            try:
-                                mtime = file.stat().st_mtime
-                                last_mtime = self.last_file_mtimes.get("csv", 0)
-
-                                if poll_count % 12 == 1:
-                                    logger.debug(
-                                        f"  CSV: {file.name} (mtime: {mtime}, last: {last_mtime})"
-                                    )
-
-                                # Only trigger import on MODIFICATION (mtime > last_mtime)
-                                # OR if this is a NEW file (didn't exist at startup)
-                                if last_mtime == 0:
-                                    # First detection - check if file existed at startup
-                                    if file.name.lower() in self.files_at_startup:
-                                        # File existed at startup - skip to prevent restart duplicates
-                                        if poll_count % 12 == 1:
-                                            logger.debug(
-                                                f"  [SKIP] {file.name} existed at startup, recording mtime only"
-                                            )
-                                    else:
-                                        # NEW file created after startup - import it!
-                                        logger.info(
-                                            f"POLLING DETECTED: NEW CSV FILE {file.name} created after startup!"
-                                        )
-                                        logger.debug(f"  File mtime: {mtime}")
-                                        logger.debug(
-                                            "  First detection of new file - triggering import"
-                                        )
-                                        self.on_csv_modified()
-                                elif mtime > last_mtime:
-                                    logger.info(f"POLLING DETECTED: CSV modification!")
-                                    logger.debug(f"  File: {file.name}")
-                                    logger.debug(f"  Current mtime: {mtime}")
-                                    logger.debug(f"  Last mtime: {last_mtime}")
-                                    logger.debug(f"  Delta: {mtime - last_mtime}s")
-                                    self.on_csv_modified()
-
-                                self.last_file_mtimes["csv"] = mtime
-                                break  # Found the file, stop checking
-                            except Exception as e:
-                                logger.error(
-                                    f"Error checking CSV mtime: {e}", exc_info=True
-                                )
-
-                    if not csv_found and poll_count % 12 == 1:
-                        logger.debug("  CSV: ImageChoices.csv not found")
-
-                except Exception as e:
-                    logger.error(
-                        f"Error scanning directory for CSV: {e}", exc_info=True
-                    )
+                changed = dir_changed or bool(events_seen)
+                if last_dir_mtime is None or not self.native_events_ok:
+                    # Events not confirmed (yet): stat the monitored files
+                    if poll_count % 12 == 1:
+                        logger.debug(f"Poll cycle #{poll_count} - checking files...")
+                    mtimes_before = dict(self.last_file_mtimes)
+                    self._scan_files(poll_count, json_files)
+                    changed = changed or self.last_file_mtimes != mtimes_before
+                last_dir_mtime = dir_mtime
+
+                # Back off while nothing happens, poll quickly again once files change
+                interval = (
+                    self.poll_interval
+                    if changed
+                    else min(interval * 2, self.max_poll_interval)
+                )
+                self.current_poll_interval = interval
+                self._stop_event.wait(interval)
 
-                # Check Plex CSV files
-                plex_csv_found = False
-                try:
-                    plex_library_csv = self.logs_dir / "PlexLibexport.csv"
-                    plex_episode_csv = self.logs_dir / "PlexEpisodeExport.csv"
+            except Exception as e:
+                logger.error(f"Error in polling thread: {e}", exc_info=True)
+                self._stop_event.wait(self.poll_interval)
 
-                    # Check if at least one Plex CSV exists
-                    if plex_library_csv.exists() or plex_episode_csv.exists():
-                        plex_csv_found = True
-                        # Use the most recent modification time of the two files
-                        max_mtime = 0
-                        if plex_library_csv.exists():
-                            max_mtime = max(max_mtime, plex_library_csv.stat().st_mtime)
-                        if plex_episode_csv.exists():
-                            max_mtime = max(max_mtime, plex_episode_csv.stat().st_mtime)
+        logger.info("Polling thread stopped")
 
-                        last_mtime = self.last_file_mtimes.get("plex_csv", 0)
+    def _scan_files(self, poll_count: int, json_files: list):
+        """Full scan: stat the monitored files and trigger imports for changed ones"""
+        # Check CSV file (case-insensitive by scanning directory)
+        csv_found = False
+        try:
+            for file in self.logs_dir.iterdir():
+                if file.is_file() and file.name.lower() == "imagechoices.csv":
+                    csv_found = True
+                    try:
+                        mtime = file.stat().st_mtime
+                        last_mtime = self.last_file_mtimes.get("csv", 0)
 
                         if poll_count % 12 == 1:
                             logger.debug(
-                                f"  Plex CSVs: (mtime: {max_mtime}, last: {last_mtime})"
+                                f"  CSV: {file.name} (mtime: {mtime}, last: {last_mtime})"
                             )
 
-                        # Only trigger import on MODIFICATION
+                        # Only trigger import on MODIFICATION (mtime > last_mtime)
+                        # OR if this is a NEW file (didn't exist at startup)
                         if last_mtime == 0:
-                            # First detection - check if files existed at startup
-                            if (
-                                "plexlibexport.csv" in self.files_at_startup
-                                or "plexepisodeexport.csv" in self.files_at_startup
-                            ):
+                            # First detection - check if file existed at startup
+                            if file.name.lower() in self.files_at_startup:
+                                # File existed at startup - skip to prevent restart duplicates
                                 if poll_count % 12 == 1:
                                     logger.debug(
-                                        f"  [SKIP] Plex CSVs existed at startup, recording mtime only"
+                                        f"  [SKIP] {file.name} existed at startup, recording mtime only"
                                     )
                             else:
-                                # NEW files created after startup
+                                # NEW file created after startup - import it!
                                 logger.info(
-                                    f"POLLING DETECTED: NEW Plex CSV files created after startup!"
+                                    f"POLLING DETECTED: NEW CSV FILE {file.name} created after startup!"
                                 )
-                                logger.debug(f"  File mtime: {max_mtime}")
-                                self.on_plex_csv_modified()
-                        elif max_mtime > last_mtime:
-                            logger.info(f"POLLING DETECTED: Plex CSV modification!")
-                            logger.debug(f"  Current mtime: {max_mtime}")
+                                logger.debug(f"  File mtime: {mtime}")
+                                logger.debug(
+                                    "  First detection of new file - triggering import"
+                                )
+                                self.on_csv_modified()
+                        elif mtime > last_mtime:
+                            logger.info(f"POLLING DETECTED: CSV modification!")
+                            logger.debug(f"  File: {file.name}")
+                            logger.debug(f"  Current mtime: {mtime}")
                             logger.debug(f"  Last mtime: {last_mtime}")
-                            logger.debug(f"  Delta: {max_mtime - last_mtime}s")
-                            self.on_plex_csv_modified()
+                            logger.debug(f"  Delta: {mtime - last_mtime}s")
+                            self.on_csv_modified()
+
+                        self.last_file_mtimes["csv"] = mtime
+                        break  # Found the file, stop checking
+                    except Exception as e:
+                        logger.error(
+                            f"Error checking CSV mtime: {e}", exc_info=True
+                        )
+
+            if not csv_found and poll_count % 12 == 1:
+                logger.debug("  CSV: ImageChoices.csv not found")
+
+        except Exception as e:
+            logger.error(
+                f"Error scanning directory for CSV: {e}", exc_info=True
+            )
 
-                        self.last_file_mtimes["plex_csv"] = max_mtime
+        # Check Plex CSV files
+        plex_csv_found = False
+        try:
+            plex_library_csv = self.logs_dir / "PlexLibexport.csv"
+            plex_episode_csv = self.logs_dir / "PlexEpisodeExport.csv"
 
-                    if not plex_csv_found and poll_count % 12 == 1:
-                        logger.debug("  Plex CSVs: Not found")
+            # Check if at least one Plex CSV exists
+            if plex_library_csv.exists() or plex_episode_csv.exists():
+                plex_csv_found = True
+                # Use the most recent modification time of the two files
+                max_mtime = 0
+                if plex_library_csv.exists():
+                    max_mtime = max(max_mtime, plex_library_csv.stat().st_mtime)
+                if plex_episode_csv.exists():
+                    max_mtime = max(max_mtime, plex_episode_csv.stat().st_mtime)
 
-                except Exception as e:
-                    logger.error(f"Error checking Plex CSVs: {e}", exc_info=True)
+                last_mtime = self.last_file_mtimes.get("plex_csv", 0)
 
-                # Check OtherMediaServer CSV files
-                other_media_csv_found = False
-                try:
-                    other_media_library_csv = (
-                        self.logs_dir / "OtherMediaServerLibExport.csv"
-                    )
-                    other_media_episode_csv = (
-                        self.logs_dir / "OtherMediaServerEpisodeExport.csv"
+                if poll_count % 12 == 1:
+                    logger.debug(
+                        f"  Plex CSVs: (mtime: {max_mtime}, last: {last_mtime})"
                     )
 
-                    # Check if at least one OtherMedia CSV exists
+                # Only trigger import on MODIFICATION
+                if last_mtime == 0:
+                    # First detection - check if files existed at startup
                     if (
-                        other_media_library_csv.exists()
-                        or other_media_episode_csv.exists()
+                        "plexlibexport.csv" in self.files_at_startup
+                        or "plexepisodeexport.csv" in self.files_at_startup
                     ):
-                        other_media_csv_found = True
-                        # Use the most recent modification time of the two files
-                        max_mtime = 0
-                        if other_media_library_csv.exists():
-                            max_mtime = max(
-                                max_mtime, other_media_library_csv.stat().st_mtime
-                            )
-                        if other_media_episode_csv.exists():
-                            max_mtime = max(
-                                max_mtime, other_media_episode_csv.stat().st_mtime
-                            )
-
-                        last_mtime = self.last_file_mtimes.get("other_media_csv", 0)
-
                         if poll_count % 12 == 1:
                             logger.debug(
-                                f"  OtherMedia CSVs: (mtime: {max_mtime}, last: {last_mtime})"
+                                f"  [SKIP] Plex CSVs existed at startup, recording mtime only"
                             )
+                    else:
+                        # NEW files created after startup
+                        logger.info(
+                            f"POLLING DETECTED: NEW Plex CSV files created after startup!"
+                        )
+                        logger.debug(f"  File mtime: {max_mtime}")
+                        self.on_plex_csv_modified()
+                elif max_mtime > last_mtime:
+                    logger.info(f"POLLING DETECTED: Plex CSV modification!")
+                    logger.debug(f"  Current mtime: {max_mtime}")
+                    logger.debug(f"  Last mtime: {last_mtime}")
+                    logger.debug(f"  Delta: {max_mtime - last_mtime}s")
+                    self.on_plex_csv_modified()
 
-                        # Only trigger import on MODIFICATION
-                        if last_mtime == 0:
-                            # First detection - check if files existed at startup
-                            if (
-                                "othermediaserverlibexport.csv" in self.files_at_startup
-                                or "othermediaserverepisodeexport.csv"
-                                in self.files_at_startup
-                            ):
-                                if poll_count % 12 == 1:
-                                    logger.debug(
-                                        f"  [SKIP] OtherMedia CSVs existed at startup, recording mtime only"
-                                    )
-                            else:
-                                # NEW OtherMedia CSV created after startup - import it!
-                                logger.info(
-                                    f"POLLING DETECTED: NEW OtherMedia CSV created after startup!"
-                                )
-                                logger.debug(f"  File mtime: {max_mtime}")
-                                self.on_other_media_csv_modified()
-                        elif max_mtime > last_mtime:
-                            logger.info(
-                                f"POLLING DETECTED: OtherMedia CSV modification!"
-                            )
-                            logger.debug(f"  Current mtime: {max_mtime}")
-                            logger.debug(f"  Last mtime: {last_mtime}")
-                            logger.debug(f"  Delta: {max_mtime - last_mtime}s")
-                            self.on_other_media_csv_modified()
+                self.last_file_mtimes["plex_csv"] = max_mtime
 
-                        self.last_file_mtimes["other_media_csv"] = max_mtime
+            if not plex_csv_found and poll_count % 12 == 1:
+                logger.debug("  Plex CSVs: Not found")
 
-                    if not other_media_csv_found and poll_count % 12 == 1:
-                        logger.debug("  OtherMedia CSVs: Not found")
+        except Exception as e:
+            logger.error(f"Error checking Plex CSVs: {e}", exc_info=True)
 
-                except Exception as e:
-                    logger.error(f"Error checking OtherMedia CSVs: {e}", exc_info=True)
+        # Check OtherMediaServer CSV files
+        other_media_csv_found = False
+        try:
+            other_media_library_csv = (
+                self.logs_dir / "OtherMediaServerLibExport.csv"
+            )
+            other_media_episode_csv = (
+                self.logs_dir / "OtherMediaServerEpisodeExport.csv"
+            )
 
-                # Check JSON files (case-insensitive by scanning directory)
-                json_found_count = 0
-                try:
-                    for file in self.logs_dir.iterdir():
-                        if file.is_file() and file.suffix.lower() == ".json":
-                            filename_lower = file.name.lower()
-                            # Check if this file matches one of our monitored JSON files
-                            if filename_lower in json_files:
-                                json_found_count += 1
-                                try:
-                                    mtime = file.stat().st_mtime
-                                    last_mtime = self.last_file_mtimes.get(
-                                        filename_lower, 0
-                                    )
+            # Check if at least one OtherMedia CSV exists
+            if (
+                other_media_library_csv.exists()
+                or other_media_episode_csv.exists()
+            ):
+                other_media_csv_found = True
+                # Use the most recent modification time of the two files
+                max_mtime = 0
+                if other_media_library_csv.exists():
+                    max_mtime = max(
+                        max_mtime, other_media_library_csv.stat().st_mtime
+                    )
+                if other_media_episode_csv.exists():
+                    max_mtime = max(
+                        max_mtime, other_media_episode_csv.stat().st_mtime
+                    )
 
-                                    if poll_count % 12 == 1:
-                                        logger.debug(
-                                            f"  JSON: {file.name} (mtime: {mtime}, last: {last_mtime})"
-                                        )
+                last_mtime = self.last_file_mtimes.get("other_media_csv", 0)
 
-                                    # Only trigger import on MODIFICATION (mtime > last_mtime)
-                                    # OR if this is a NEW file (didn't exist at startup)
-                                    if last_mtime == 0:
-                                        # First detection - check if file existed at startup
-                                        if filename_lower in self.files_at_startup:
-                                            # File existed at startup - skip to prevent restart duplicates
-                                            if poll_count % 12 == 1:
-                                                logger.debug(
-                                                    f"  [SKIP] {file.name} existed at startup, recording mtime only"
-                                                )
-                                        else:
-                                            # NEW file created after startup - import it!
-                                            logger.info(
-                                                f"POLLING DETECTED: NEW JSON FILE {file.name} created after startup!"
-                                            )
-                                            logger.debug(f"  File mtime: {mtime}")
-                                            logger.debug(
-                                                "  First detection of new file - triggering import"
-                                            )
-                                            self.on_runtime_json_modified(file.name)
-                                    elif mtime > last_mtime:
-                                        logger.info(
-                                            f"POLLING DETECTED: {file.name} modification!"
-                                        )
-                                        logger.debug(f"  Current mtime: {mtime}")
-                                        logger.debug(f"  Last mtime: {last_mtime}")
-                                        logger.debug(f"  Delta: {mtime - last_mtime}s")
-                                        self.on_runtime_json_modified(file.name)
-
-                                    self.last_file_mtimes[filename_lower] = mtime
-                                except Exception as e:
-                                    logger.error(
-                                        f"Error checking {file.name} mtime: {e}",
-                                        exc_info=True,
-                                    )
+                if poll_count % 12 == 1:
+                    logger.debug(
+                        f"  OtherMedia CSVs: (mtime: {max_mtime}, last: {last_mtime})"
+                    )
 
-                    if poll_count % 12 == 1:
-                        logger.debug(
-                            f"  Found {json_found_count}/{len(json_files)} monitored JSON files"
+                # Only trigger import on MODIFICATION
+                if last_mtime == 0:
+                    # First detection - check if files existed at startup
+                    if (
+                        "othermediaserverlibexport.csv" in self.files_at_startup
+                        or "othermediaserverepisodeexport.csv"
+                        in self.files_at_startup
+                    ):
+                        if poll_count % 12 == 1:
+                            logger.debug(
+                                f"  [SKIP] OtherMedia CSVs existed at startup, recording mtime only"
+                            )
+                    else:
+                        # NEW OtherMedia CSV created after startup - import it!
+                        logger.info(
+                            f"POLLING DETECTED: NEW OtherMedia CSV created after startup!"
                         )
-
-                except Exception as e:
-                    logger.error(
-                        f"Error scanning directory for JSON files: {e}", exc_info=True
+                        logger.debug(f"  File mtime: {max_mtime}")
+                        self.on_other_media_csv_modified()
+                elif max_mtime > last_mtime:
+                    logger.info(
+                        f"POLLING DETECTED: OtherMedia CSV modification!"
                     )
+                    logger.debug(f"  Current mtime: {max_mtime}")
+                    logger.debug(f"  Last mtime: {last_mtime}")
+                    logger.debug(f"  Delta: {max_mtime - last_mtime}s")
+                    self.on_other_media_csv_modified()
 
-                # Sleep until next check
-                time.sleep(self.poll_interval)
+                self.last_file_mtimes["other_media_csv"] = max_mtime
 
-            except Exception as e:
-                logger.error(f"Error in polling thread: {e}", exc_info=True)
-                time.sleep(self.poll_interval)
+            if not other_media_csv_found and poll_count % 12 == 1:
+                logger.debug("  OtherMedia CSVs: Not found")
 
-        logger.info("Polling thread stopped")
+        except Exception as e:
+            logger.error(f"Error checking OtherMedia CSVs: {e}", exc_info=True)
 
-    def on_csv_modified(self):
-        """Handle ImageChoices.csv modification"""
-        with self.lock:
-            current_time = time.time()
-            logger.info("=" * 80)
-            logger.info("CSV MODIFICATION DETECTED")
-            logger.info(f"  File: ImageChoices.csv")
-            logger.info(f"  Timestamp: {datetime.fromtimestamp(current_time)}")
-            logger.debug(f"  on_csv_modified() triggered at {current_time}")
-
-            # Debounce: Skip if we imported recently
-            time_since_last = current_time - self.last_csv_import
-            logger.debug(f"  Last CSV import: {self.last_csv_import}")
-            logger.debug(f"  Time since last import: {time_since_last:.2f}s")
-            logger.debug(f"  Debounce threshold: {self.debounce_seconds}s")
-
-            if time_since_last < self.debounce_seconds:
-                logger.warning(f"DEBOUNCED: Skipping CSV import")
+        # Check JSON files (case-insensitive by scanning directory)
+        json_found_count = 0
+        try:
+            for file in self.logs_dir.iterdir():
+                if file.is_file() and file.suffix.lower() == ".json":
+                    filename_lower = file.name.lower()
+                    # Check if this file matches one of our monitored JSON files
+                    if filename_lower in json_files:
+                        json_found_count += 1
+                        try:
+                            mtime = file.stat().st_mtime
+                            last_mtime = self.last_file_mtimes.get(
+                                filename_lower, 0
+                            )
+
+                            if poll_count % 12 == 1:
+                                logger.debug(
+                                    f"  JSON: {file.name} (mtime: {mtime}, last: {last_mtime})"
+                                )
+
+                            # Only trigger import on MODIFICATION (mtime > last_mtime)
+                            # OR if this is a NEW file (didn't exist at startup)
+                            if last_mtime == 0:
+                                # First detection - check if file existed at startup
+                                if filename_lower in self.files_at_startup:
+                                    # File existed at startup - skip to prevent restart duplicates
+                                    if poll_count % 12 == 1:
+                                        logger.debug(
+                                            f"  [SKIP] {file.name} existed at startup, recording mtime only"
+                                        )
+                                else:
+                                    # NEW file created after startup - import it!
+                                    logger.info(
+                                        f"POLLING DETECTED: NEW JSON FILE {file.name} created after startup!"
+                                    )
+                                    logger.debug(f"  File mtime: {mtime}")
+                                    logger.debug(
+                                        "  First detection of new file - triggering import"
+                                    )
+                                    self.on_runtime_json_modified(file.name)
+                            elif mtime > last_mtime:
+                                logger.info(
+                                    f"POLLING DETECTED: {file.name} modification!"
+                                )
+                                logger.debug(f"  Current mtime: {mtime}")
+                                logger.debug(f"  Last mtime: {last_mtime}")
+                                logger.debug(f"  Delta: {mtime - last_mtime}s")
+                                self.on_runtime_json_modified(file.name)
+
+                            self.last_file_mtimes[filename_lower] = mtime
+                        except Exception as e:
+                            logger.error(
+                                f"Error checking {file.name} mtime: {e}",
+                                exc_info=True,
+                            )
+
+            if poll_count % 12 == 1:
                 logger.debug(
-                    f"  Reason: Last import was {time_since_last:.2f}s ago (need {self.debounce_seconds}s)"
+                    f"  Found {json_found_count}/{len(json_files)} monitored JSON files"
                 )
-                logger.info("=" * 80)
-                return
 
-            self.last_csv_import = current_time
-            logger.info(
-                f"[OK] Debounce check passed (time since last: {time_since_last:.2f}s)"
+        except Exception as e:
+            logger.error(
+                f"Error scanning directory for JSON files: {e}", exc_info=True
             )
 
-            try:
-                logger.info("Triggering CSV import in background thread...")
-                logger.debug("  Creating thread...")
-                thread = threading.Thread(
-                    target=self._safe_import_csv, daemon=True, name="CSVImport"
-                )
-                thread.start()
-                logger.info(
-                    f"CSV import thread started: {thread.name} (ID: {thread.ident})"
-                )
-                logger.info("=" * 80)
 
-            except Exception as e:
-                logger.error("=" * 80)
-                logger.error("ERROR handling CSV modification")
-                logger.error(f"  Error: {e}", exc_info=True)
-                logger.error("=" * 80)
+    def on_csv_modified(self):
+        """Handle ImageChoices.csv modification"""
+        if self.scheduler.trigger("csv"):
+            logger.info(f"CSV modification detected, import scheduled in {self.debounce_seconds}s")
+        else:
+            logger.debug("CSV modification coalesced into pending import")
 
     def on_runtime_json_modified(self, json_filename: str):
         """Handle runtime JSON file modification"""
-        with self.lock:
-            current_time = time.time()
-            logger.info("=" * 80)
-            logger.info("JSON MODIFICATION DETECTED")
-            logger.info(f"  File: {json_filename}")
-            logger.info(f"  Timestamp: {datetime.fromtimestamp(current_time)}")
-            logger.debug(f"  on_runtime_json_modified() triggered at {current_time}")
-
-            # Debounce: Skip if we imported this file recently
-            last_import = self.last_json_imports.get(json_filename, 0)
-            time_since_last = current_time - last_import
-
-            logger.debug(f"  Last import of {json_filename}: {last_import}")
-            logger.debug(f"  Time since last import: {time_since_last:.2f}s")
-            logger.debug(f"  Debounce threshold: {self.debounce_seconds}s")
-
-            if time_since_last < self.debounce_seconds:
-                logger.warning(f"DEBOUNCED: Skipping {json_filename} import")
-                logger.debug(
-                    f"  Reason: Last import was {time_since_last:.2f}s ago (need {self.debounce_seconds}s)"
-                )
-                logger.info("=" * 80)
-                return
-
-            self.last_json_imports[json_filename] = current_time
+        if self.scheduler.trigger("runtime_json", json_filename):
             logger.info(
-                f"[OK] Debounce check passed (time since last: {time_since_last:.2f}s)"
+                f"{json_filename} modification detected, import scheduled in {self.debounce_seconds}s"
             )
+        else:
+            logger.debug(f"{json_filename} modification coalesced into pending import")
 
-            try:
-                logger.info(
-                    f"Triggering runtime import for {json_filename} in background thread..."
-                )
-                logger.debug(f"  JSON path: {self.logs_dir / json_filename}")
-                logger.debug("  Creating thread...")
-                thread = threading.Thread(
-                    target=self._safe_import_runtime,
-                    args=(json_filename,),
-                    daemon=True,
-                    name=f"RuntimeImport-{json_filename}",
-                )
-                thread.start()
-                logger.info(
-                    f"[OK] Runtime import thread started: {thread.name} (ID: {thread.ident})"
-                )
-                logger.info("=" * 80)
-
-            except Exception as e:
-                logger.error("=" * 80)
-                logger.error(
-                    f"[ERROR] ERROR handling runtime JSON modification for {json_filename}"
-                )
-                logger.error(f"  Error: {e}", exc_info=True)
-                logger.error("=" * 80)
     def _safe_import_csv(self):
         """Thread-safe CSV import wrapper"""
         thread_id = threading.get_ident()
@@ -656,101 +647,21 @@ class LogsWatcher:
 
     def on_plex_csv_modified(self):
         """Handle Plex CSV modification (both PlexLibexport.csv and PlexEpisodeExport.csv)"""
-        with self.lock:
-            current_time = time.time()
-            logger.info("=" * 80)
-            logger.info("PLEX CSV MODIFICATION DETECTED")
-            logger.info(f"  Files: PlexLibexport.csv / PlexEpisodeExport.csv")
-            logger.info(f"  Timestamp: {datetime.fromtimestamp(current_time)}")
-            logger.debug(f"  on_plex_csv_modified() triggered at {current_time}")
-
-            # Debounce: Skip if we imported recently
-            time_since_last = current_time - self.last_plex_import
-            logger.debug(f"  Last Plex CSV import: {self.last_plex_import}")
-            logger.debug(f"  Time since last import: {time_since_last:.2f}s")
-            logger.debug(f"  Debounce threshold: {self.debounce_seconds}s")
-
-            if time_since_last < self.debounce_seconds:
-                logger.warning(f"DEBOUNCED: Skipping Plex CSV import")
-                logger.debug(
-                    f"  Reason: Last import was {time_since_last:.2f}s ago (need {self.debounce_seconds}s)"
-                )
-                logger.info("=" * 80)
-                return
-
-            self.last_plex_import = current_time
+        if self.scheduler.trigger("plex_csv"):
             logger.info(
-                f"[OK] Debounce check passed (time since last: {time_since_last:.2f}s)"
+                f"Plex CSV modification detected, import scheduled in {self.export_debounce_seconds}s"
             )
-
-            try:
-                logger.info("Triggering Plex CSV import in background thread...")
-                logger.debug("  Creating thread...")
-                thread = threading.Thread(
-                    target=self._safe_import_plex, daemon=True, name="PlexCSVImport"
-                )
-                thread.start()
-                logger.info(
-                    f"Plex CSV import thread started: {thread.name} (ID: {thread.ident})"
-                )
-                logger.info("=" * 80)
-
-            except Exception as e:
-                logger.error("=" * 80)
-                logger.error("ERROR handling Plex CSV modification")
-                logger.error(f"  Error: {e}", exc_info=True)
-                logger.error("=" * 80)
+        else:
+            logger.debug("Plex CSV modification coalesced into pending import")
 
     def on_other_media_csv_modified(self):
         """Handle OtherMediaServer CSV modification (both Library and Episode exports)"""
-        with self.lock:
-            current_time = time.time()
-            logger.info("=" * 80)
-            logger.info("OTHERMEDIA CSV MODIFICATION DETECTED")
+        if self.scheduler.trigger("other_media_csv"):
             logger.info(
-                f"  Files: OtherMediaServerLibExport.csv / OtherMediaServerEpisodeExport.csv"
+                f"OtherMedia CSV modification detected, import scheduled in {self.export_debounce_seconds}s"
             )
-            logger.info(f"  Timestamp: {datetime.fromtimestamp(current_time)}")
-            logger.debug(f"  on_other_media_csv_modified() triggered at {current_time}")
-
-            # Debounce: Skip if we imported recently
-            time_since_last = current_time - self.last_other_media_import
-            logger.debug(f"  Last OtherMedia CSV import: {self.last_other_media_import}")
-            logger.debug(f"  Time since last import: {time_since_last:.2f}s")
-            logger.debug(f"  Debounce threshold: {self.debounce_seconds}s")
-
-            if time_since_last < self.debounce_seconds:
-                logger.warning(f"DEBOUNCED: Skipping OtherMedia CSV import")
-                logger.debug(
-                    f"  Reason: Last import was {time_since_last:.2f}s ago (need {self.debounce_seconds}s)"
-                )
-                logger.info("=" * 80)
-                return
-
-            self.last_other_media_import = current_time
-            logger.info(
-                f"[OK] Debounce check passed (time since last: {time_since_last:.2f}s)"
-            )
-
-            try:
-                logger.info("Triggering OtherMedia CSV import in background thread...")
-                logger.debug("  Creating thread...")
-                thread = threading.Thread(
-                    target=self._safe_import_other_media,
-                    daemon=True,
-                    name="OtherMediaCSVImport",
-                )
-                thread.start()
-                logger.info(
-                    f"OtherMedia CSV import thread started: {thread.name} (ID: {thread.ident})"
-                )
-                logger.info("=" * 80)
-
-            except Exception as e:
-                logger.error("=" * 80)
-                logger.error("ERROR handling OtherMedia CSV modification")
-                logger.error(f"  Error: {e}", exc_info=True)
-                logger.error("=" * 80)
+        else:
+            logger.debug("OtherMedia CSV modification coalesced into pending import")
 
     def _safe_import_plex(self):
         """Thread-safe Plex CSV import wrapper"""
@@ -775,6 +686,10 @@ class LogsWatcher:
                 logger.info(f"  Duration: {elapsed:.2f}s")
                 logger.info(f"  Stats: {results['library_count']} libraries, {results['episode_count']} episodes")
                 logger.info("=" * 80)
+
+                if self.db and results["library_count"]:
+                    # Folders without an id tag get their ids from the new export
+                    self.db.fill_ids_from_media_export()
             else:
                 logger.error(
                     f"[Thread {thread_id}] [ERROR] Plex CSV import failed: media_export_db_instance is None"
@@ -810,6 +725,10 @@ class LogsWatcher:
                 logger.info(f"  Duration: {elapsed:.2f}s")
                 logger.info(f"  Stats: {results['library_count']} libraries, {results['episode_count']} episodes")
                 logger.info("=" * 80)
+
+                if self.db and results["library_count"]:
+                    # Folders without an id tag get their ids from the new export
+                    self.db.fill_ids_from_media_export()
             else:
                 logger.error(
                     f"[Thread {thread_id}] [ERROR] OtherMedia CSV import failed: media_export_db_instance is None"
@@ -925,6 +844,7 @@ class LogsFileHandler(FileSystemEventHandler):
 
     def on_modified(self, event):
         """Handle file modification events"""
+        self.watcher.note_native_event()
         if event.is_directory:
             return
 
@@ -958,7 +878,11 @@ class LogsFileHandler(FileSystemEventHandler):
             logger.error(f"[ERROR] Error processing modification event for {event.src_path}: {e}", exc_info=True)
 
     def on_created(self, event):
-        """Handle file creation events (treat as modification)"""
+        """
+        Handle file creation events (treat as modification). The import runs after
+        the debounce window, so the file has time to be fully written.
+        """
+        self.watcher.note_native_event()
         if event.is_directory:
             logger.debug(f"EVENT: Directory creation (ignored): {event.src_path}")
             return
@@ -976,18 +900,10 @@ class LogsFileHandler(FileSystemEventHandler):
             # Check if it's a file we're interested in
             if filename == self.CSV_FILE:
                 logger.info(f"[OK] File matches monitored CSV: {filename}")
-                logger.debug("Waiting 0.5s for file to be fully written...")
-                # Give the file a moment to be fully written
-                time.sleep(0.5)
-                logger.debug("File write buffer complete, triggering import")
                 self.watcher.on_csv_modified()
 
             elif filename in (self.PLEX_LIBRARY_CSV, self.PLEX_EPISODE_CSV):
                 logger.info(f"[OK] File matches monitored Plex CSV: {filename}")
-                logger.debug("Waiting 0.5s for file to be fully written...")
-                # Give the file a moment to be fully written
-                time.sleep(0.5)
-                logger.debug("File write buffer complete, triggering import")
                 self.watcher.on_plex_csv_modified()
 
             elif filename in (
@@ -995,18 +911,10 @@ class LogsFileHandler(FileSystemEventHandler):
                 self.OTHER_MEDIA_EPISODE_CSV,
             ):
                 logger.info(f"[OK] File matches monitored OtherMedia CSV: {filename}")
-                logger.debug("Waiting 0.5s for file to be fully written...")
-                # Give the file a moment to be fully written
-                time.sleep(0.5)
-                logger.debug("File write buffer complete, triggering import")
                 self.watcher.on_other_media_csv_modified()
 
             elif filename.lower() in self.RUNTIME_JSON_FILES:
                 logger.info(f"[OK] File matches monitored JSON: {filename}")
-                logger.debug("Waiting 0.5s for file to be fully written...")
-                # Give the file a moment to be fully written
-                time.sleep(0.5)
-                logger.debug("File write buffer complete, triggering import")
                 self.watcher.on_runtime_json_modified(filename)
 
             else:
@@ -17,7 +17,7 @@ except ImportError:
     from defaults import setup_default_images
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 import json
@@ -59,6 +59,50 @@ try:
     from .queue_manager import QueueManager
 except ImportError:
     from queue_manager import QueueManager
+try:
+    from .config_service import ConfigService
+except ImportError:
+    from config_service import ConfigService
+try:
+    from .run_events import RunEventBroadcaster
+except ImportError:
+    from run_events import RunEventBroadcaster
+try:
+    from .db_pool import backup_database, close_all_pools
+except ImportError:
+    from db_pool import backup_database, close_all_pools
+try:
+    from .async_db import run_db, shutdown_db_executor
+except ImportError:
+    from async_db import run_db, shutdown_db_executor
+try:
+    from .log_sinks import (
+        ExcludeUIRecordsFilter,
+        GzipRotatingFileHandler,
+        create_json_lines_handler,
+        format_raw_line,
+        make_ui_log_record,
+        open_log_segment,
+        parse_entry_timestamp,
+        read_json_lines_tail,
+        read_log_tail,
+        read_rotated_remainder,
+        rotated_segments,
+    )
+except ImportError:
+    from log_sinks import (
+        ExcludeUIRecordsFilter,
+        GzipRotatingFileHandler,
+        create_json_lines_handler,
+        format_raw_line,
+        make_ui_log_record,
+        open_log_segment,
+        parse_entry_timestamp,
+        read_json_lines_tail,
+        read_log_tail,
+        read_rotated_remainder,
+        rotated_segments,
+    )
 
 try:
     from dotenv import load_dotenv
@@ -297,10 +341,12 @@ queue_manager = QueueManager(QUEUE_DB_PATH)
 # Global lock for process management
 process_lock = threading.RLock()
 
-# Clear UILogs on startup - remove all log files
+# Clear UILogs on startup - remove all log files (including gzipped rotated segments)
 import glob
 
-for log_file in glob.glob(str(UI_LOGS_DIR / "*.log")):
+for log_file in glob.glob(str(UI_LOGS_DIR / "*.log")) + glob.glob(
+    str(UI_LOGS_DIR / "*.log.*.gz")
+):
     try:
         os.remove(log_file)
         pass  # Silent - no console output
@@ -317,9 +363,14 @@ LOG_LEVEL_MAP = {
 }
 
 WEBUI_SETTINGS_PATH = UI_LOGS_DIR / "webui_settings.json"
+UI_JSON_LOG_PATH = UI_LOGS_DIR / "FrontendUI.jsonl"
 
 # Global queue listener for thread-safe logging
 queue_listener = None
+# QueueHandler feeding the listener (also used to route frontend entries)
+ui_queue_handler = None
+# Whether the structured JSON-lines sink (FrontendUI.jsonl) is active
+ui_json_log_enabled = False
 
 
 def load_webui_settings():
@@ -328,6 +379,7 @@ def load_webui_settings():
         "log_level": "INFO",
         "theme": "dark",
         "auto_refresh_interval": 180,
+        "structured_logs": False,
     }
 
     try:
@@ -371,6 +423,14 @@ def load_log_level_config():
     return env_level
 
 
+def load_structured_logs_config() -> bool:
+    """Check whether the JSON-lines log sink is enabled (webui_settings.json or env)"""
+    env_value = os.getenv("WEBUI_STRUCTURED_LOGS")
+    if env_value is not None:
+        return env_value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(load_webui_settings().get("structured_logs", False))
+
+
 def save_log_level_config(level: str):
     """DEPRECATED: Use save_webui_settings instead. Kept for backward compatibility."""
     try:
@@ -389,6 +449,7 @@ def initialize_webui_settings():
             "log_level": "INFO",
             "theme": "dark",
             "auto_refresh_interval": 180,
+            "structured_logs": False,
         }
         try:
             WEBUI_SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -411,10 +472,8 @@ LOG_LEVEL = LOG_LEVEL_MAP.get(LOG_LEVEL_ENV, logging.INFO)
 # Remove any existing handlers first
 logging.root.handlers.clear()
 
-# Create file handler for BackendServer.log
-file_handler = logging.FileHandler(
-    UI_LOGS_DIR / "BackendServer.log", mode="w", encoding="utf-8"
-)
+# Create size-rotated file handler for BackendServer.log (rotated segments are gzipped)
+file_handler = GzipRotatingFileHandler(UI_LOGS_DIR / "BackendServer.log")
 file_handler.setLevel(LOG_LEVEL)
 file_handler.setFormatter(
     logging.Formatter(
@@ -481,8 +540,8 @@ else:
 
 
 def setup_backend_ui_logger():
-    """Setup backend logger to also write to FrontendUI.log"""
-    global queue_listener
+    """Setup backend logger to also write to FrontendUI.log (and optionally FrontendUI.jsonl)"""
+    global queue_listener, ui_queue_handler, ui_json_log_enabled
     logger.info("Initializing backend UI logger")
     try:
         # Create UILogs directory if not exists
@@ -499,11 +558,9 @@ def setup_backend_ui_logger():
         else:
             logger.debug("No existing FrontendUI.log to clear")
 
-        # Create File Handler for FrontendUI.log with thread-safe queue
+        # Create size-rotated File Handler for FrontendUI.log with thread-safe queue
         logger.debug(f"Creating file handler for: {backend_log_path}")
-        backend_ui_file_handler = logging.FileHandler(
-            backend_log_path, encoding="utf-8", mode="w"
-        )
+        backend_ui_file_handler = GzipRotatingFileHandler(backend_log_path)
         backend_ui_file_handler.setLevel(LOG_LEVEL)  # Use configurable log level
         backend_ui_file_handler.setFormatter(
             logging.Formatter(
@@ -511,18 +568,37 @@ def setup_backend_ui_logger():
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
+        # Frontend entries are written to FrontendUI.log by the /api/logs/ui endpoints
+        backend_ui_file_handler.addFilter(ExcludeUIRecordsFilter())
         logger.debug("File handler formatter configured")
 
+        listener_handlers = [backend_ui_file_handler]
+
+        # Optional structured JSON-lines sink with size-based rotation
+        if load_structured_logs_config():
+            for old_json_log in UI_LOGS_DIR.glob(f"{UI_JSON_LOG_PATH.name}*"):
+                try:
+                    old_json_log.unlink()
+                except OSError as e:
+                    logger.warning(f"Could not remove old {old_json_log.name}: {e}")
+
+            listener_handlers.append(
+                create_json_lines_handler(UI_JSON_LOG_PATH, LOG_LEVEL)
+            )
+            ui_json_log_enabled = True
+            logger.info(f"Structured JSON-lines log enabled: {UI_JSON_LOG_PATH}")
+
         # Use QueueHandler for thread-safe logging
         from queue import Queue
         from logging.handlers import QueueHandler, QueueListener
 
         log_queue = Queue(-1)  # Unlimited queue size
         queue_handler = QueueHandler(log_queue)
+        ui_queue_handler = queue_handler
 
         # Start queue listener in background thread
         queue_listener = QueueListener(
-            log_queue, backend_ui_file_handler, respect_handler_level=True
+            log_queue, *listener_handlers, respect_handler_level=True
         )
         queue_listener.start()
         logger.debug("Queue listener started for thread-safe logging")
@@ -583,6 +659,11 @@ except ImportError as e:
     logger.warning(f"Config mapper not available: {e}. Using grouped config structure.")
     logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
 
+# Cached config.json snapshots (grouped and flattened), reloaded when the file changes
+config_service = ConfigService(
+    CONFIG_PATH, flatten=flatten_config if CONFIG_MAPPER_AVAILABLE else None
+)
+
 # Import scheduler module
 try:
     logger.debug("Attempting to import scheduler module")
@@ -655,7 +736,11 @@ except ImportError as e:
 try:
     logger.debug("Attempting to import runtime_database and runtime_parser modules")
     from runtime_database import runtime_db
-    from runtime_parser import parse_runtime_from_log, save_runtime_to_db
+    from runtime_parser import (
+        parse_runtime_from_log,
+        save_runtime_to_db,
+        save_live_run_to_db,
+    )
 
     RUNTIME_DB_AVAILABLE = True
     logger.info("Runtime database module loaded successfully")
@@ -695,6 +780,46 @@ except ImportError as e:
     )
     logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
 
+# Import library types module
+try:
+    logger.debug("Attempting to import library_types module")
+    from library_types import LibraryTypeRegistry
+
+    LIBRARY_TYPES_AVAILABLE = True
+    logger.info("Library types module loaded successfully")
+except ImportError as e:
+    LIBRARY_TYPES_AVAILABLE = False
+    logger.warning(
+        f"Library types not available: {e}. Asset types will be guessed from folder names."
+    )
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
+# Import retention module
+try:
+    logger.debug("Attempting to import retention module")
+    from retention import RetentionPolicy, apply_retention
+
+    RETENTION_AVAILABLE = True
+    logger.info("Retention module loaded successfully")
+except ImportError as e:
+    RETENTION_AVAILABLE = False
+    logger.warning(
+        f"Retention not available: {e}. History databases will not be pruned automatically."
+    )
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
+# Import metrics export module
+try:
+    logger.debug("Attempting to import metrics_export module")
+    from metrics_export import iter_ndjson_gz, parse_bound
+
+    METRICS_EXPORT_AVAILABLE = True
+    logger.info("Metrics export module loaded successfully")
+except ImportError as e:
+    METRICS_EXPORT_AVAILABLE = False
+    logger.warning(f"Metrics export not available: {e}")
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
 logger.info("Module loading completed")
 logger.debug(f"Config Mapper: {CONFIG_MAPPER_AVAILABLE}")
 logger.debug(f"Scheduler: {SCHEDULER_AVAILABLE}")
@@ -704,6 +829,9 @@ logger.debug(f"Config Database: {CONFIG_DATABASE_AVAILABLE}")
 logger.debug(f"Runtime Database: {RUNTIME_DB_AVAILABLE}")
 logger.debug(f"Logs Watcher: {LOGS_WATCHER_AVAILABLE}")
 logger.debug(f"Media Export Database: {MEDIA_EXPORT_DB_AVAILABLE}")
+logger.debug(f"Library Types: {LIBRARY_TYPES_AVAILABLE}")
+logger.debug(f"Retention: {RETENTION_AVAILABLE}")
+logger.debug(f"Metrics Export: {METRICS_EXPORT_AVAILABLE}")
 
 current_process: Optional[subprocess.Popen] = None
 current_mode: Optional[str] = None
@@ -713,12 +841,21 @@ db: Optional["ImageChoicesDB"] = None
 config_db: Optional["ConfigDB"] = None
 media_export_db: Optional["MediaExportDatabase"] = None
 server_libraries_db: Optional["ServerLibrariesDB"] = None
+library_type_registry: Optional["LibraryTypeRegistry"] = None
 
 # Initialize cache variables early to prevent race conditions
 cache_refresh_task = None
 cache_refresh_running = False
 cache_scan_in_progress = False
 
+# Scheduled retention (history pruning + compaction)
+retention_task: Optional[asyncio.Task] = None
+retention_lock = asyncio.Lock()
+last_retention_report: Optional[dict] = None
+RETENTION_INITIAL_DELAY_SECONDS = 600
+# Retry delay when a scheduled retention finds a Posterizarr run in progress
+RETENTION_RETRY_SECONDS = 900
+
 
 def check_directory_permissions(
     directory: Path, directory_name: str = "directory"
@@ -1110,8 +1247,8 @@ def determine_media_type(filename: str, library_folder: str = None) -> str:
 
 def get_library_type_from_db(library_folder: str) -> Optional[str]:
     """
-    Get library type (movie/show) from database by library folder name
-    Uses a cache to avoid repeated database lookups
+    Get library type (movie/show) by library folder name from the library type
+    registry (export tables + media server libraries, cached in memory)
 
     Args:
         library_folder: The library folder name (e.g., "TestMovies", "TestSerien")
@@ -1119,58 +1256,16 @@ def get_library_type_from_db(library_folder: str) -> Optional[str]:
     Returns:
         "movie" or "show", or None if not found
     """
-    # Use a simple module-level cache
-    if not hasattr(get_library_type_from_db, "cache"):
-        get_library_type_from_db.cache = {}
-
-    # Check cache first
-    if library_folder in get_library_type_from_db.cache:
-        cached_type = get_library_type_from_db.cache[library_folder]
-        logger.debug(f"[LibraryType] Cache hit for '{library_folder}': {cached_type}")
-        return cached_type
-
-    # Silence warnings for 'Collections' folder and cache the result as None
-    if library_folder.lower() == "collections":
-        get_library_type_from_db.cache[library_folder] = None
+    # 'Collections' is never a library
+    if not library_folder or library_folder.lower() == "collections":
         return None
 
-    logger.debug(
-        f"[LibraryType] Cache miss for '{library_folder}', querying database..."
-    )
-
-    # Use the global media_export_db instance, do not create a new one
-    db_instance = media_export_db
-
-    if db_instance:
-        try:
-            library_type = db_instance.lookup_library_type_by_name(library_folder)
-            if library_type:
-                # Normalize the library type to match the expected "movie" or "show"
-                lib_type_lower = library_type.lower()
-                normalized_type = None
-                if lib_type_lower in ["show", "shows", "series", "tvshows", "tvshow"]:
-                    normalized_type = "show"
-                elif lib_type_lower in ["movie", "movies"]:
-                    normalized_type = "movie"
-                else:
-                    normalized_type = lib_type_lower
-
-                # Cache the result
-                get_library_type_from_db.cache[library_folder] = normalized_type
-                logger.info(
-                    f"[LibraryType] Database lookup for '{library_folder}': {normalized_type} (cached, DB was '{library_type}')"
-                )
-                return normalized_type
-            else:
-                logger.warning(
-                    f"[LibraryType] No library type found in database for '{library_folder}'"
-                )
-        except Exception as e:
-            logger.error(
-                f"[LibraryType] Error looking up library type for '{library_folder}': {e}"
-            )
+    if library_type_registry is None:
+        return None
 
-    return None
+    library_type = library_type_registry.get(library_folder)
+    logger.debug(f"[LibraryType] '{library_folder}': {library_type}")
+    return library_type
 
 def cleanup_outdated_assets():
     """Asset cleanup"""
@@ -2069,10 +2164,58 @@ async def get_script_version():
         "is_update_available": is_update_available,  # Boolean for update availability
     }
 
+def is_posterizarr_run_active() -> bool:
+    """True while a manual, scheduled or externally started Posterizarr run is in progress"""
+    if current_process and current_process.poll() is None:
+        return True
+    if SCHEDULER_AVAILABLE and scheduler and scheduler.is_running:
+        process = scheduler.current_process
+        if process and process.poll() is None:
+            return True
+    return RUNNING_FILE.exists()
+
+
+async def run_retention(full_vacuum: Optional[bool] = None) -> dict:
+    """Apply the retention policy from webui_settings.json (one run at a time)"""
+    global last_retention_report
+    async with retention_lock:
+        policy = RetentionPolicy.from_settings(load_webui_settings())
+        report = await run_db(
+            apply_retention,
+            media_export_db if MEDIA_EXPORT_DB_AVAILABLE else None,
+            runtime_db if RUNTIME_DB_AVAILABLE else None,
+            policy,
+            None,
+            full_vacuum,
+        )
+        last_retention_report = report
+        return report
+
+
+async def retention_loop():
+    """Run retention shortly after startup and then every interval_hours"""
+    await asyncio.sleep(RETENTION_INITIAL_DELAY_SECONDS)
+    while True:
+        policy = RetentionPolicy.from_settings(load_webui_settings())
+        delay = max(policy.interval_hours, 1) * 3600
+        if policy.enabled:
+            if is_posterizarr_run_active():
+                # Pruning and compaction compete with the run's imports for the databases
+                logger.info("Posterizarr run in progress, postponing retention")
+                delay = RETENTION_RETRY_SECONDS
+            else:
+                try:
+                    await run_retention()
+                except Exception as e:
+                    logger.error(f"Scheduled retention failed: {e}", exc_info=True)
+        await asyncio.sleep(delay)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup and shutdown"""
-    global scheduler, db, config_db, media_export_db, logs_watcher, server_libraries_db
+    global scheduler, db, config_db, media_export_db, logs_watcher, server_libraries_db, retention_task
+    global library_type_registry
 
     logger.info("Starting Posterizarr Web UI Backend")
 
@@ -2163,7 +2306,7 @@ async def lifespan(app: FastAPI):
 
             # Check if database has any records
             try:
-                record_count = len(db.get_all_choices())
+                record_count = db.count_choices()
                 logger.info(
                     f"Database ready: {IMAGECHOICES_DB_PATH} ({record_count} records)"
                 )
@@ -2192,6 +2335,10 @@ async def lifespan(app: FastAPI):
             "Server libraries database module not available, skipping initialization"
         )
 
+    # Library name -> type map for asset classification (rebuilt after imports)
+    if LIBRARY_TYPES_AVAILABLE:
+        library_type_registry = LibraryTypeRegistry(media_export_db, server_libraries_db)
+
     # Initialize and start logs watcher if available
     logs_watcher = None
     if LOGS_WATCHER_AVAILABLE and DATABASE_AVAILABLE and RUNTIME_DB_AVAILABLE:
@@ -2222,6 +2369,12 @@ async def lifespan(app: FastAPI):
         elif not RUNTIME_DB_AVAILABLE:
             logger.info("Runtime database not available, skipping logs watcher")
 
+    # Start the run event producer (live run metrics + SSE status stream)
+    try:
+        run_event_broadcaster.start()
+    except Exception as e:
+        logger.error(f"Failed to start run event producer: {e}")
+
     # Initialize and start scheduler if available
     if SCHEDULER_AVAILABLE:
         try:
@@ -2234,6 +2387,10 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Scheduler module not available, skipping scheduler initialization")
 
+    # Schedule retention for the history databases (export runs, runtime stats)
+    if RETENTION_AVAILABLE:
+        retention_task = asyncio.create_task(retention_loop())
+
     yield
 
     # Shutdown
@@ -2257,6 +2414,15 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping queue listener: {e}")
 
+    if retention_task:
+        retention_task.cancel()
+
+    # Stop the run event producer (SSE)
+    try:
+        await run_event_broadcaster.stop()
+    except Exception as e:
+        logger.error(f"Error stopping run event producer: {e}")
+
     # Stop background cache refresh
     stop_cache_refresh_background()
 
@@ -2281,6 +2447,20 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error closing config database: {e}")
 
+    # Let running DB calls finish before the pools are closed
+    try:
+        shutdown_db_executor()
+    except Exception as e:
+        logger.error(f"Error stopping database executor: {e}")
+
+    # Close pooled SQLite connections (checkpoints the WAL files)
+    try:
+        queue_manager.close()
+        close_all_pools()
+        logger.info("Database connection pools closed")
+    except Exception as e:
+        logger.error(f"Error closing database connection pools: {e}")
+
     logger.info("Shutting down Posterizarr Web UI Backend")
 
 
@@ -2554,11 +2734,10 @@ async def get_config(request: Request):
     try:
         # Check if Auth is enabled in the file directly
         auth_enabled = False
-        if CONFIG_PATH.exists():
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                c = json.load(f)
-                webui = c.get("WebUI", {})
-                auth_enabled = str(webui.get("basicAuthEnabled", False)).lower() in ["true", "1", "yes"]
+        c = config_service.get()
+        if c is not None:
+            webui = c.get("WebUI", {})
+            auth_enabled = str(webui.get("basicAuthEnabled", False)).lower() in ["true", "1", "yes"]
 
         # 1. Check for API Key presence
         api_key = request.query_params.get("api_key") or request.headers.get("X-API-Key")
@@ -2602,11 +2781,10 @@ async def get_config(request: Request):
         logger.error(f"Security check error: {sec_err}")
 
     try:
-        if not CONFIG_PATH.exists():
+        grouped_config = config_service.get()
+        if grouped_config is None:
             raise HTTPException(status_code=404, detail="Config file not found")
 
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            grouped_config = json.load(f)
         # Get onboarding_completed from DB
         # Default to False if config_db is missing or failed to load, to ensure fresh installs see the modal
         onboarding_completed = False
@@ -2619,7 +2797,7 @@ async def get_config(request: Request):
         # Merge API keys correctly into the final response
 
         if CONFIG_MAPPER_AVAILABLE:
-            flat_config = flatten_config(grouped_config)
+            flat_config = config_service.get_flat()
 
             display_names_dict = {}
             for key in flat_config.keys():
@@ -2677,12 +2855,10 @@ async def backup_config():
 async def export_blueprint():
     """Export the grouped config.json minus sensitive data"""
     try:
-        if not CONFIG_PATH.exists():
+        export_data = config_service.get_copy()
+        if export_data is None:
             raise HTTPException(status_code=404, detail="Config not found")
             
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            export_data = json.load(f)
-            
         # Remove sensitive sections completely
         for section in ["ApiPart", "PlexPart", "JellyfinPart", "EmbyPart", "Notification", "WebUI"]:
             export_data.pop(section, None)
@@ -2713,10 +2889,7 @@ async def import_blueprint(request: Request):
             shutil.copy2(CONFIG_PATH, backup_path)
             
         # 2. Load current config
-        current_config = {}
-        if CONFIG_PATH.exists():
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                current_config = json.load(f)
+        current_config = config_service.get_copy() or {}
                 
         # 3. Deep merge
         def deep_merge(source, destination):
@@ -2733,6 +2906,7 @@ async def import_blueprint(request: Request):
         # 4. Save
         with open(CONFIG_PATH, "w", encoding="utf-8") as f:
             json.dump(new_config, f, indent=4, ensure_ascii=False)
+        config_service.invalidate()
             
         # 5. Sync to database if available
         try:
@@ -2758,16 +2932,8 @@ async def update_config(data: ConfigUpdate):
     try:
         # Load current config to detect changes
         logger.debug("Loading current config to detect changes...")
-        current_config = {}
-        if CONFIG_PATH.exists():
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                current_config = json.load(f)
-
-        # Flatten current config if needed for comparison
-        if CONFIG_MAPPER_AVAILABLE and current_config:
-            current_flat = flatten_config(current_config)
-        else:
-            current_flat = current_config
+        # Flattened when the config mapper is available (read-only snapshot)
+        current_flat = config_service.get_flat() or {}
 
         # Check if basicAuthPassword is being updated
         if "basicAuthPassword" in data.config:
@@ -2840,6 +3006,7 @@ async def update_config(data: ConfigUpdate):
             logger.debug("Saving config as grouped structure (no mapper)...")
             with open(CONFIG_PATH, "w", encoding="utf-8") as f:
                 json.dump(data.config, f, indent=2, ensure_ascii=False)
+        config_service.invalidate()
 
         # Update config database
         if CONFIG_DATABASE_AVAILABLE and config_db:
@@ -4350,13 +4517,11 @@ async def perform_plex_action(request: PlexActionRequest):
     """
     logger.info(f"Plex Action Request: {request.action} for key={request.rating_key}, lib={request.library_name}")
 
-    if not CONFIG_PATH.exists():
+    config = config_service.get()
+    if config is None:
         raise HTTPException(status_code=404, detail="Config file not found")
 
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
-
         # Robust Config Loading
         # 1. Try Root level (Flat structure)
         plex_url = config.get("PlexUrl")
@@ -4483,7 +4648,8 @@ async def perform_jellyfin_emby_action(request: JellyfinEmbyActionRequest):
     """
     logger.info(f"Jellyfin/Emby Action Request: {request.action} for id={request.media_id}")
 
-    if not CONFIG_PATH.exists():
+    config = config_service.get()
+    if config is None:
         raise HTTPException(status_code=404, detail="Config file not found")
 
     # 1. Load Config & Determine Server
@@ -4492,8 +4658,6 @@ async def perform_jellyfin_emby_action(request: JellyfinEmbyActionRequest):
     server_type = None
 
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
 
         # Helper to check nested dicts safely
         def get_val(key, section_name):
@@ -5045,6 +5209,13 @@ def get_last_log_lines(count=25, mode=None, log_file=None):
     return []
 
 
+def forward_ui_log_to_structured_sink(level: str, component: str, message: str):
+    """Route a frontend log entry through the logging queue into FrontendUI.jsonl"""
+    if not ui_json_log_enabled or ui_queue_handler is None:
+        return
+    ui_queue_handler.handle(make_ui_log_record(level, component, message))
+
+
 @app.post("/api/logs/ui")
 async def receive_ui_log(log_entry: UILogEntry):
     """
@@ -5071,6 +5242,8 @@ async def receive_ui_log(log_entry: UILogEntry):
         with open(ui_log_path, "a", encoding="utf-8") as f:
             f.write(log_line)
 
+        forward_ui_log_to_structured_sink(level, component, message)
+
         return {"success": True}
 
     except Exception as e:
@@ -5106,6 +5279,11 @@ async def receive_ui_logs_batch(batch: UILogBatch):
         with open(ui_log_path, "a", encoding="utf-8") as f:
             f.writelines(log_lines)
 
+        for log_entry in batch.logs:
+            forward_ui_log_to_structured_sink(
+                log_entry.level, log_entry.component, log_entry.message
+            )
+
         return {"success": True, "count": len(batch.logs)}
 
     except Exception as e:
@@ -5481,9 +5659,11 @@ async def get_upload_diagnostics():
     return diagnostics
 
 
-@app.get("/api/status")
-async def get_status():
-    """Get script status with last log lines from appropriate log file"""
+def _collect_run_state() -> dict:
+    """
+    Poll the manual/scheduler processes and determine the effective run state.
+    Cleans up finished processes. Does not read any log content.
+    """
     global current_process, current_mode, current_start_time
 
     with process_lock:
@@ -5635,16 +5815,6 @@ async def get_status():
 
             active_log = newest_log if newest_log else "Scriptlog.log"
 
-        # Get last 25 log lines from the active log file
-        last_logs = get_last_log_lines(25, log_file=active_log)
-
-        # Check for "already running" warning
-        already_running = False
-        for line in last_logs[-5:]:  # Check last 5 lines
-            if "Another Posterizarr instance already running" in line:
-                already_running = True
-                break
-
         # Determine PID to show
         display_pid = None
         if manual_is_running:
@@ -5658,18 +5828,112 @@ async def get_status():
             "running": is_running,
             "manual_running": manual_is_running,
             "scheduler_running": scheduler_is_running,
-            "scheduler_is_executing": scheduler_is_running,
-            "last_logs": last_logs,
-            "script_exists": SCRIPT_PATH.exists(),
-            "config_exists": CONFIG_PATH.exists(),
             "pid": display_pid,
             "current_mode": effective_mode,
             "active_log": active_log,
-            "already_running_detected": already_running,
             "running_file_exists": running_file_exists,
             "start_time": current_start_time if is_running else None,
         }
 
+
+@app.get("/api/status")
+async def get_status():
+    """Get script status with last log lines from appropriate log file"""
+    run_state = _collect_run_state()
+    active_log = run_state["active_log"]
+
+    # Get last 25 log lines from the active log file
+    last_logs = get_last_log_lines(25, log_file=active_log)
+
+    # Check for "already running" warning
+    already_running = False
+    for line in last_logs[-5:]:  # Check last 5 lines
+        if "Another Posterizarr instance already running" in line:
+            already_running = True
+            break
+
+    return {
+        "running": run_state["running"],
+        "manual_running": run_state["manual_running"],
+        "scheduler_running": run_state["scheduler_running"],
+        "scheduler_is_executing": run_state["scheduler_running"],
+        "last_logs": last_logs,
+        "script_exists": SCRIPT_PATH.exists(),
+        "config_exists": CONFIG_PATH.exists(),
+        "pid": run_state["pid"],
+        "current_mode": run_state["current_mode"],
+        "active_log": active_log,
+        "already_running_detected": already_running,
+        "running_file_exists": run_state["running_file_exists"],
+        "start_time": run_state["start_time"],
+    }
+
+
+def _scheduler_event_status() -> Optional[dict]:
+    """Scheduler fields pushed to dashboards (same shape as /api/dashboard/all)"""
+    if not (SCHEDULER_AVAILABLE and scheduler):
+        return None
+    scheduler_status = scheduler.get_status()
+    return {
+        "success": True,
+        "enabled": scheduler_status.get("enabled", False),
+        "running": scheduler_status.get("running", False),
+        "is_executing": scheduler_status.get("is_executing", False),
+        "schedules": scheduler_status.get("schedules", []),
+        "next_run": scheduler_status.get("next_run"),
+        "timezone": scheduler_status.get("timezone"),
+    }
+
+
+def _persist_finished_run(last_status: dict, tracker) -> None:
+    """Save the live-parsed metrics of a finished run to runtime_stats (runs in a worker thread)"""
+    if not RUNTIME_DB_AVAILABLE:
+        return
+    mode = (last_status or {}).get("current_mode") or "normal"
+    save_live_run_to_db(tracker.to_runtime_entry(mode), LOGS_DIR, tracker.started_at)
+
+
+# One shared producer for all dashboards listening on /api/events/status.
+# It is started at startup so live run metrics are tracked even without clients.
+run_event_broadcaster = RunEventBroadcaster(
+    state_provider=_collect_run_state,
+    log_resolver=lambda log_name: LOGS_DIR / log_name,
+    scheduler_provider=_scheduler_event_status,
+    on_run_finished=_persist_finished_run,
+)
+
+
+@app.get("/api/runtime-stats/live")
+async def get_live_runtime_stats():
+    """
+    Live metrics of the current (or last) run, maintained incrementally from the
+    script log: items processed, assets created per type, errors, fallbacks and
+    items per minute
+    """
+    status = run_event_broadcaster.last_status or {}
+    return {
+        "success": True,
+        "running": bool(status.get("running")),
+        "mode": status.get("current_mode"),
+        "metrics": run_event_broadcaster.tracker.snapshot(),
+    }
+
+
+@app.get("/api/events/status")
+async def stream_run_events(request: Request):
+    """
+    Server-Sent Events stream of run status transitions, live progress
+    counters parsed from the active log, and scheduler changes.
+
+    Events: "status", "progress", "scheduler", "ping" (keep-alive)
+    """
+    return StreamingResponse(
+        run_event_broadcaster.stream(request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.delete("/api/running-file")
 async def delete_running_file():
     """Delete the Posterizarr.Running file"""
@@ -5867,7 +6131,7 @@ async def get_runtime_summary(days: int = Query(30, ge=1, le=365)):
                 "summary": {},
             }
 
-        summary = runtime_db.get_runtime_stats_summary(days=days)
+        summary = await run_db(runtime_db.get_runtime_stats_summary, days=days)
 
         return {
             "success": True,
@@ -5894,7 +6158,10 @@ async def cleanup_old_runtime_entries(days: int = Query(90, ge=30, le=365)):
                 "message": "Runtime database not available",
             }
 
-        deleted_count = runtime_db.delete_old_entries(days=days)
+        # Explicitly deleted runs also leave the summary totals (unlike retention)
+        deleted_count = await run_db(
+            runtime_db.delete_old_entries, days=days, batch_size=5000, keep_rollup=False
+        )
 
         return {
             "success": True,
@@ -5907,6 +6174,41 @@ async def cleanup_old_runtime_entries(days: int = Query(90, ge=30, le=365)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/api/database/retention")
+async def get_retention_status():
+    """Get the retention policy and the report of the last retention run"""
+    if not RETENTION_AVAILABLE:
+        return {"success": False, "message": "Retention not available"}
+
+    policy = RetentionPolicy.from_settings(load_webui_settings())
+    return {
+        "success": True,
+        "policy": policy.to_dict(),
+        "running": retention_lock.locked(),
+        "last_report": last_retention_report,
+    }
+
+
+@app.post("/api/database/retention/run")
+async def run_retention_now(
+    vacuum: bool = Query(False, description="Run the one-time full VACUUM that enables incremental auto_vacuum"),
+):
+    """Prune the export and runtime history now and compact the databases"""
+    if not RETENTION_AVAILABLE:
+        return {"success": False, "message": "Retention not available"}
+    if retention_lock.locked():
+        return {"success": False, "message": "Retention is already running"}
+    if is_posterizarr_run_active():
+        return {"success": False, "message": "Posterizarr is running, try again when the run has finished"}
+
+    try:
+        report = await run_retention(full_vacuum=True if vacuum else None)
+        return {"success": True, "report": report}
+    except Exception as e:
+        logger.error(f"Error running retention: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @app.post("/api/runtime-history/migrate")
 async def migrate_runtime_data_from_logs():
     """
@@ -6087,6 +6389,46 @@ async def import_json_runtime_data():
         logger.error(f"Error importing JSON runtime data: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.get("/api/runtime-history/export")
+async def export_runtime_metrics(
+    include: Literal["all", "runs", "assets"] = Query("all"),
+    since: Optional[str] = Query(None, description="ISO date/time, inclusive"),
+    until: Optional[str] = Query(None, description="ISO date/time, exclusive"),
+):
+    """
+    Stream the run history and/or the asset history as gzip-compressed NDJSON
+    (one JSON object per line, "type" is "meta", "run" or "asset")
+
+    Both tables are read in keyset chunks, so the export runs in constant
+    memory regardless of how much history is stored.
+    """
+    if not METRICS_EXPORT_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Metrics export not available")
+    bounds = {}
+    for name, value in (("since", since), ("until", until)):
+        try:
+            bounds[name] = parse_bound(value)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid {name} timestamp")
+
+    export_runs = include in ("all", "runs") and RUNTIME_DB_AVAILABLE and runtime_db
+    export_assets = include in ("all", "assets") and DATABASE_AVAILABLE and db
+    if not export_runs and not export_assets:
+        raise HTTPException(status_code=503, detail="Database not available")
+
+    filename = f"posterizarr-metrics-{datetime.now().strftime('%Y%m%d-%H%M%S')}.ndjson.gz"
+    return StreamingResponse(
+        iter_ndjson_gz(
+            runtime_db=runtime_db if export_runs else None,
+            imagechoices_db=db if export_assets else None,
+            since=bounds["since"],
+            until=bounds["until"],
+        ),
+        media_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @app.get("/api/analytics/providers")
 async def get_provider_stats(days: int = Query(30, ge=7, le=365)):
     """Get provider source statistics over time"""
@@ -6094,8 +6436,8 @@ async def get_provider_stats(days: int = Query(30, ge=7, le=365)):
         if not DATABASE_AVAILABLE or not db:
              return {"success": False, "stats": [], "error": "Database not available"}
 
-        # Use the new method in database.py
-        stats = db.get_provider_stats_by_date(days)
+        # Read from the provider_daily rollup in database.py
+        stats = await run_db(db.get_provider_stats_by_date, days)
         return {"success": True, "stats": stats}
     except Exception as e:
         logger.error(f"Error getting provider stats: {e}")
@@ -6118,7 +6460,7 @@ async def get_plex_export_statistics():
                 "message": "Plex export database not available",
             }
 
-        stats = media_export_db.get_statistics()
+        stats = await run_db(media_export_db.get_statistics)
 
         return {
             "success": True,
@@ -6142,7 +6484,7 @@ async def get_plex_export_runs():
                 "message": "Plex export database not available",
             }
 
-        runs = media_export_db.get_all_runs()
+        runs = await run_db(media_export_db.get_all_runs)
 
         return {
             "success": True,
@@ -6157,14 +6499,21 @@ async def get_plex_export_runs():
 
 @app.get("/api/plex-export/library")
 async def get_plex_library_data(
-    run_timestamp: Optional[str] = None, limit: Optional[int] = None
+    run_timestamp: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    cursor: Optional[str] = None,
+    library_name: Optional[str] = None,
+    root_foldername: Optional[str] = None,
 ):
     """
     Get Plex library export data
 
     Args:
         run_timestamp: Optional specific run to query (default: latest)
-        limit: Optional limit on number of results
+        limit: Optional page size (keyset pagination; default: all rows)
+        cursor: next_cursor of the previous page
+        library_name: Only items of this library
+        root_foldername: Only items with this root folder name
     """
     try:
         if not MEDIA_EXPORT_DB_AVAILABLE or not media_export_db:
@@ -6173,15 +6522,33 @@ async def get_plex_library_data(
                 "message": "Plex export database not available",
             }
 
-        data = media_export_db.get_library_data(run_timestamp, limit)
+        filters = {
+            column: value
+            for column, value in (
+                ("library_name", library_name),
+                ("root_foldername", root_foldername),
+            )
+            if value
+        }
+        page = await run_db(
+            media_export_db.get_export_page,
+            "plex_library_export",
+            run_timestamp,
+            limit,
+            cursor,
+            filters,
+        )
 
         return {
             "success": True,
-            "data": data,
-            "count": len(data),
+            "data": page["data"],
+            "count": len(page["data"]),
             "run_timestamp": run_timestamp or "latest",
+            "next_cursor": page["next_cursor"],
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting Plex library data: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -6189,14 +6556,17 @@ async def get_plex_library_data(
 
 @app.get("/api/plex-export/episodes")
 async def get_plex_episode_data(
-    run_timestamp: Optional[str] = None, limit: Optional[int] = None
+    run_timestamp: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    cursor: Optional[str] = None,
 ):
     """
     Get Plex episode export data
 
     Args:
         run_timestamp: Optional specific run to query (default: latest)
-        limit: Optional limit on number of results
+        limit: Optional page size (keyset pagination; default: all rows)
+        cursor: next_cursor of the previous page
     """
     try:
         if not MEDIA_EXPORT_DB_AVAILABLE or not media_export_db:
@@ -6205,15 +6575,20 @@ async def get_plex_episode_data(
                 "message": "Plex export database not available",
             }
 
-        data = media_export_db.get_episode_data(run_timestamp, limit)
+        page = await run_db(
+            media_export_db.get_export_page, "plex_episode_export", run_timestamp, limit, cursor
+        )
 
         return {
             "success": True,
-            "data": data,
-            "count": len(data),
+            "data": page["data"],
+            "count": len(page["data"]),
             "run_timestamp": run_timestamp or "latest",
+            "next_cursor": page["next_cursor"],
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting Plex episode data: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -6231,7 +6606,10 @@ async def import_plex_csvs():
                 "message": "Plex export database not available",
             }
 
-        results = media_export_db.import_latest_csvs()
+        results = await run_db(media_export_db.import_latest_csvs)
+        if db and results["library_count"]:
+            # Folders without an id tag get their ids from the new export
+            await run_db(db.fill_ids_from_media_export)
 
         return {
             "success": True,
@@ -6244,6 +6622,23 @@ async def import_plex_csvs():
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/api/plex-export/import-progress")
+async def get_plex_export_import_progress():
+    """
+    Progress of the running (or last) Plex CSV import per table
+    """
+    if not MEDIA_EXPORT_DB_AVAILABLE or not media_export_db:
+        return {
+            "success": False,
+            "message": "Plex export database not available",
+        }
+
+    return {
+        "success": True,
+        "progress": media_export_db.get_import_progress("plex"),
+    }
+
+
 # =========================================================================
 # OtherMedia (Jellyfin/Emby) Export Endpoints
 # =========================================================================
@@ -6259,7 +6654,7 @@ async def get_other_media_statistics():
                 "message": "OtherMedia export database not available",
             }
 
-        stats = media_export_db.get_other_statistics()
+        stats = await run_db(media_export_db.get_other_statistics)
 
         return {"success": True, "statistics": stats}
 
@@ -6278,7 +6673,7 @@ async def get_other_media_runs():
                 "message": "OtherMedia export database not available",
             }
 
-        runs = media_export_db.get_other_all_runs()
+        runs = await run_db(media_export_db.get_other_all_runs)
 
         return {"success": True, "runs": runs, "count": len(runs)}
 
@@ -6289,14 +6684,21 @@ async def get_other_media_runs():
 
 @app.get("/api/other-media-export/library")
 async def get_other_media_library_data(
-    run_timestamp: Optional[str] = None, limit: Optional[int] = None
+    run_timestamp: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    cursor: Optional[str] = None,
+    library_name: Optional[str] = None,
+    root_foldername: Optional[str] = None,
 ):
     """
     Get OtherMedia library export data
 
     Args:
         run_timestamp: Optional specific run to query (default: latest)
-        limit: Optional limit on number of results
+        limit: Optional page size (keyset pagination; default: all rows)
+        cursor: next_cursor of the previous page
+        library_name: Only items of this library
+        root_foldername: Only items with this root folder name
     """
     try:
         if not MEDIA_EXPORT_DB_AVAILABLE or not media_export_db:
@@ -6305,18 +6707,33 @@ async def get_other_media_library_data(
                 "message": "OtherMedia export database not available",
             }
 
-        data = media_export_db.get_other_library_data(run_timestamp)
-
-        if limit:
-            data = data[:limit]
+        filters = {
+            column: value
+            for column, value in (
+                ("library_name", library_name),
+                ("root_foldername", root_foldername),
+            )
+            if value
+        }
+        page = await run_db(
+            media_export_db.get_export_page,
+            "other_media_library_export",
+            run_timestamp,
+            limit,
+            cursor,
+            filters,
+        )
 
         return {
             "success": True,
-            "data": data,
-            "count": len(data),
+            "data": page["data"],
+            "count": len(page["data"]),
             "run_timestamp": run_timestamp or "latest",
+            "next_cursor": page["next_cursor"],
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting OtherMedia library data: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -6324,14 +6741,17 @@ async def get_other_media_library_data(
 
 @app.get("/api/other-media-export/episodes")
 async def get_other_media_episode_data(
-    run_timestamp: Optional[str] = None, limit: Optional[int] = None
+    run_timestamp: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    cursor: Optional[str] = None,
 ):
     """
     Get OtherMedia episode export data
 
     Args:
         run_timestamp: Optional specific run to query (default: latest)
-        limit: Optional limit on number of results
+        limit: Optional page size (keyset pagination; default: all rows)
+        cursor: next_cursor of the previous page
     """
     try:
         if not MEDIA_EXPORT_DB_AVAILABLE or not media_export_db:
@@ -6340,15 +6760,20 @@ async def get_other_media_episode_data(
                 "message": "OtherMedia export database not available",
             }
 
-        data = media_export_db.get_other_episode_data(run_timestamp, limit)
+        page = await run_db(
+            media_export_db.get_export_page, "other_media_episode_export", run_timestamp, limit, cursor
+        )
 
         return {
             "success": True,
-            "data": data,
-            "count": len(data),
+            "data": page["data"],
+            "count": len(page["data"]),
             "run_timestamp": run_timestamp or "latest",
+            "next_cursor": page["next_cursor"],
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting OtherMedia episode data: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -6366,7 +6791,10 @@ async def import_other_media_csvs():
                 "message": "OtherMedia export database not available",
             }
 
-        results = media_export_db.import_other_latest_csvs()
+        results = await run_db(media_export_db.import_other_latest_csvs)
+        if db and results["library_count"]:
+            # Folders without an id tag get their ids from the new export
+            await run_db(db.fill_ids_from_media_export)
 
         return {
             "success": True,
@@ -6386,6 +6814,23 @@ async def import_other_media_csvs():
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/api/other-media-export/import-progress")
+async def get_other_export_import_progress():
+    """
+    Progress of the running (or last) OtherMedia CSV import per table
+    """
+    if not MEDIA_EXPORT_DB_AVAILABLE or not media_export_db:
+        return {
+            "success": False,
+            "message": "OtherMedia export database not available",
+        }
+
+    return {
+        "success": True,
+        "progress": media_export_db.get_import_progress("other"),
+    }
+
+
 @app.post("/api/tmdb/search-posters")
 async def search_tmdb_posters(request: TMDBSearchRequest):
     """
@@ -6441,15 +6886,13 @@ async def search_tmdb_posters(request: TMDBSearchRequest):
 
     try:
         # Load config to get TMDB token
-        if not CONFIG_PATH.exists():
+        grouped_config = config_service.get()
+        if grouped_config is None:
             raise HTTPException(status_code=404, detail="Config file not found")
 
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            grouped_config = json.load(f)
-
         # Convert grouped config to flat structure
         if CONFIG_MAPPER_AVAILABLE:
-            flat_config = flatten_config(grouped_config)
+            flat_config = config_service.get_flat()
             tmdb_token = flat_config.get("tmdbtoken")
             preferred_language_order = flat_config.get("PreferredLanguageOrder", "")
             preferred_season_language_order = flat_config.get(
@@ -8040,9 +8483,7 @@ async def get_log_content(log_name: str, tail: int = 100):
         raise HTTPException(status_code=404, detail="Log file not found")
 
     try:
-        with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
-            return {"content": lines[-tail:] if tail else lines}
+        return {"content": read_log_tail(log_path, tail)}
     except Exception as e:
         logger.error(f"Error reading log: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -8057,6 +8498,14 @@ async def get_unified_ui_logs(tail: int = 500):
     try:
         ui_log_path = UI_LOGS_DIR / "FrontendUI.log"
 
+        # Structured sink: plain field access instead of regex parsing
+        if ui_json_log_enabled and UI_JSON_LOG_PATH.exists():
+            entries = read_json_lines_tail(UI_JSON_LOG_PATH, tail)
+            for entry in entries:
+                entry["raw"] = format_raw_line(entry)
+            entries.sort(key=parse_entry_timestamp)
+            return {"logs": entries, "total": len(entries), "total_all": len(entries)}
+
         if not ui_log_path.exists():
             return {"logs": [], "total": 0, "message": "No UI logs available yet"}
 
@@ -8065,8 +8514,8 @@ async def get_unified_ui_logs(tail: int = 500):
 
         logs = []
 
-        with open(ui_log_path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
+        # Only the requested tail is read (continuing into rotated segments)
+        lines = read_log_tail(ui_log_path, tail)
 
         # Parse each log line
         # Backend format: [TIMESTAMP] [LEVEL] [BACKEND:module:function:line] - MESSAGE
@@ -8208,15 +8657,19 @@ async def websocket_logs(
     try:
         # Send initial logs (increased to 100 lines)
         if log_path.exists():
-            with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()[-100:]
-                for line in lines:
-                    stripped = line.strip()
-                    if stripped:  # Only send non-empty lines
-                        await websocket.send_json({"type": "log", "content": stripped})
+            for line in read_log_tail(log_path, 100, include_rotated=False):
+                stripped = line.strip()
+                if stripped:  # Only send non-empty lines
+                    await websocket.send_json({"type": "log", "content": stripped})
 
         # Monitor log file for changes with dynamic log file switching
-        last_position = log_path.stat().st_size if log_path.exists() else 0
+        if log_path.exists():
+            log_stat = log_path.stat()
+            last_position = log_stat.st_size
+            last_inode = log_stat.st_ino
+        else:
+            last_position = 0
+            last_inode = None
         last_mode = current_mode
         current_log_file = log_file  # Track current log file being watched
 
@@ -8255,7 +8708,13 @@ async def websocket_logs(
                     log_path = LOGS_DIR / new_log_file
                     if not log_path.exists():
                         log_path = UI_LOGS_DIR / new_log_file
-                    last_position = log_path.stat().st_size if log_path.exists() else 0
+                    if log_path.exists():
+                        log_stat = log_path.stat()
+                        last_position = log_stat.st_size
+                        last_inode = log_stat.st_ino
+                    else:
+                        last_position = 0
+                        last_inode = None
 
                     # Notify client about log file change
                     await websocket.send_json(
@@ -8277,14 +8736,27 @@ async def websocket_logs(
             # Monitor current log file
             if log_path.exists():
                 try:
-                    current_size = log_path.stat().st_size
-
-                    # Handle log file truncation/rotation
-                    if current_size < last_position:
+                    log_stat = log_path.stat()
+                    current_size = log_stat.st_size
+
+                    # Handle size-based rotation: flush what was written to the
+                    # old file (now the newest rotated segment) before restarting
+                    if last_inode is not None and log_stat.st_ino != last_inode:
+                        for line in read_rotated_remainder(log_path, last_position):
+                            stripped = line.strip()
+                            if stripped:
+                                await websocket.send_json(
+                                    {"type": "log", "content": stripped}
+                                )
+                        last_position = 0
+                        logger.info(f"Log file {log_path.name} was rotated")
+                    # Handle log file truncation
+                    elif current_size < last_position:
                         last_position = 0
                         logger.info(
                             f"Log file {log_path.name} was truncated or rotated"
                         )
+                    last_inode = log_stat.st_ino
 
                     if current_size > last_position:
                         with open(
@@ -8747,6 +9219,7 @@ async def bulk_delete_posters(request: BulkDeleteRequest):
     try:
         deleted = []
         failed = []
+        start_time = time.perf_counter()
 
         for path in request.paths:
             try:
@@ -8777,13 +9250,17 @@ async def bulk_delete_posters(request: BulkDeleteRequest):
                 file_path.unlink()
                 deleted.append(path)
                 logger.info(f"Deleted poster: {file_path}")
-
-                # Delete corresponding database entries
-                delete_db_entries_for_asset(path)
             except Exception as e:
                 failed.append({"path": path, "error": str(e)})
                 logger.error(f"Error deleting poster {path}: {e}")
 
+        files_seconds = time.perf_counter() - start_time
+
+        # Delete corresponding database entries in one transaction
+        db_start = time.perf_counter()
+        db_deleted = await run_db(delete_db_entries_for_assets, deleted) if deleted else 0
+        db_seconds = time.perf_counter() - db_start
+
         # Invalidate cache to reflect changes immediately
         asset_cache["last_scanned"] = 0
 
@@ -8791,6 +9268,11 @@ async def bulk_delete_posters(request: BulkDeleteRequest):
             "success": True,
             "deleted": deleted,
             "failed": failed,
+            "db_entries_deleted": db_deleted,
+            "timing": {
+                "files_seconds": round(files_seconds, 3),
+                "database_seconds": round(db_seconds, 3),
+            },
             "message": f"Successfully deleted {len(deleted)} poster(s). {len(failed)} failed.",
         }
     except Exception as e:
@@ -8855,6 +9337,7 @@ async def bulk_delete_backgrounds(request: BulkDeleteRequest):
     try:
         deleted = []
         failed = []
+        start_time = time.perf_counter()
 
         for path in request.paths:
             try:
@@ -8885,13 +9368,17 @@ async def bulk_delete_backgrounds(request: BulkDeleteRequest):
                 file_path.unlink()
                 deleted.append(path)
                 logger.info(f"Deleted background: {file_path}")
-
-                # Delete corresponding database entries
-                delete_db_entries_for_asset(path)
             except Exception as e:
                 failed.append({"path": path, "error": str(e)})
                 logger.error(f"Error deleting background {path}: {e}")
 
+        files_seconds = time.perf_counter() - start_time
+
+        # Delete corresponding database entries in one transaction
+        db_start = time.perf_counter()
+        db_deleted = await run_db(delete_db_entries_for_assets, deleted) if deleted else 0
+        db_seconds = time.perf_counter() - db_start
+
         # Invalidate cache to reflect changes immediately
         asset_cache["last_scanned"] = 0
 
@@ -8899,6 +9386,11 @@ async def bulk_delete_backgrounds(request: BulkDeleteRequest):
             "success": True,
             "deleted": deleted,
             "failed": failed,
+            "db_entries_deleted": db_deleted,
+            "timing": {
+                "files_seconds": round(files_seconds, 3),
+                "database_seconds": round(db_seconds, 3),
+            },
             "message": f"Successfully deleted {len(deleted)} background(s). {len(failed)} failed.",
         }
     except Exception as e:
@@ -8963,6 +9455,7 @@ async def bulk_delete_seasons(request: BulkDeleteRequest):
     try:
         deleted = []
         failed = []
+        start_time = time.perf_counter()
 
         for path in request.paths:
             try:
@@ -8993,13 +9486,17 @@ async def bulk_delete_seasons(request: BulkDeleteRequest):
                 file_path.unlink()
                 deleted.append(path)
                 logger.info(f"Deleted season: {file_path}")
-
-                # Delete corresponding database entries
-                delete_db_entries_for_asset(path)
             except Exception as e:
                 failed.append({"path": path, "error": str(e)})
                 logger.error(f"Error deleting season {path}: {e}")
 
+        files_seconds = time.perf_counter() - start_time
+
+        # Delete corresponding database entries in one transaction
+        db_start = time.perf_counter()
+        db_deleted = await run_db(delete_db_entries_for_assets, deleted) if deleted else 0
+        db_seconds = time.perf_counter() - db_start
+
         # Invalidate cache to reflect changes immediately
         asset_cache["last_scanned"] = 0
 
@@ -9007,6 +9504,11 @@ async def bulk_delete_seasons(request: BulkDeleteRequest):
             "success": True,
             "deleted": deleted,
             "failed": failed,
+            "db_entries_deleted": db_deleted,
+            "timing": {
+                "files_seconds": round(files_seconds, 3),
+                "database_seconds": round(db_seconds, 3),
+            },
             "message": f"Successfully deleted {len(deleted)} season(s). {len(failed)} failed.",
         }
     except Exception as e:
@@ -9071,6 +9573,7 @@ async def bulk_delete_titlecards(request: BulkDeleteRequest):
     try:
         deleted = []
         failed = []
+        start_time = time.perf_counter()
 
         for path in request.paths:
             try:
@@ -9101,13 +9604,17 @@ async def bulk_delete_titlecards(request: BulkDeleteRequest):
                 file_path.unlink()
                 deleted.append(path)
                 logger.info(f"Deleted titlecard: {file_path}")
-
-                # Delete corresponding database entries
-                delete_db_entries_for_asset(path)
             except Exception as e:
                 failed.append({"path": path, "error": str(e)})
                 logger.error(f"Error deleting titlecard {path}: {e}")
 
+        files_seconds = time.perf_counter() - start_time
+
+        # Delete corresponding database entries in one transaction
+        db_start = time.perf_counter()
+        db_deleted = await run_db(delete_db_entries_for_assets, deleted) if deleted else 0
+        db_seconds = time.perf_counter() - db_start
+
         # Invalidate cache to reflect changes immediately
         asset_cache["last_scanned"] = 0
 
@@ -9115,6 +9622,11 @@ async def bulk_delete_titlecards(request: BulkDeleteRequest):
             "success": True,
             "deleted": deleted,
             "failed": failed,
+            "db_entries_deleted": db_deleted,
+            "timing": {
+                "files_seconds": round(files_seconds, 3),
+                "database_seconds": round(db_seconds, 3),
+            },
             "message": f"Successfully deleted {len(deleted)} titlecard(s). {len(failed)} failed.",
         }
     except Exception as e:
@@ -9499,6 +10011,14 @@ async def get_folder_view_browse(path: Optional[str] = Query(None)):
         logger.exception("Full traceback:")
         return {"success": False, "error": str(e), "items": []}
 
+# imagechoices columns needed to build the recent assets list
+RECENT_ASSET_COLUMNS = [
+    "Title", "Type", "Rootfolder", "LibraryName", "Language", "TextTruncated",
+    "DownloadSource", "FavProviderLink", "Manual", "LogoSource", "LogoLanguage",
+    "LogoTextFallback",
+]
+
+
 @app.get("/api/recent-assets")
 async def get_recent_assets():
     """
@@ -9521,8 +10041,12 @@ async def get_recent_assets():
         except Exception as e:
             logger.warning(f"Could not import CSV to database: {e}")
 
-        # Get all assets from database (already sorted by id DESC - newest first)
-        db_records = db.get_all_choices()
+        # Get all assets from database (already sorted by id DESC - newest first),
+        # only the columns used below
+        page = await run_db(
+            db.query_choices, columns=RECENT_ASSET_COLUMNS, limit=None
+        )
+        db_records = page["items"]
 
         logger.info(f"Found {len(db_records)} total assets in database")
 
@@ -10251,6 +10775,9 @@ async def get_logs_watcher_status():
             "logs_dir": str(logs_watcher.logs_dir),
             "debounce_seconds": logs_watcher.debounce_seconds,
             "poll_interval": logs_watcher.poll_interval,
+            "current_poll_interval": logs_watcher.current_poll_interval,
+            "native_events": logs_watcher.native_events_ok,
+            "imports": logs_watcher.scheduler.stats(),
             "monitored_files": {
                 "csv": "ImageChoices.csv",
                 "json": sorted(
@@ -10366,22 +10893,18 @@ async def fetch_asset_replacements(request: AssetReplaceRequest):
                         )
                         search_method = "path"
 
-                        with db.lock:
-                            conn = db._get_connection()
-                            try:
-                                cursor = conn.cursor()
-                                cursor.execute(
-                                    """
-                                    SELECT tmdbid, tvdbid, imdbid, Rootfolder
-                                    FROM imagechoices
-                                    WHERE Rootfolder LIKE ?
-                                    LIMIT 1
-                                """,
-                                    (f"%{rootfolder_candidate}%",),
-                                )
-                                db_record = cursor.fetchone()
-                            finally:
-                                conn.close()
+                        # Exact (indexed) folder match first, then the id in the folder name
+                        record = await run_db(db.get_choice_by_rootfolder, rootfolder_candidate)
+                        if record is None:
+                            matches = await run_db(db.find_by_provider_id, rootfolder_candidate, 1)
+                            record = matches[0] if matches else None
+                        if record is not None:
+                            db_record = (
+                                record["tmdbid"],
+                                record["tvdbid"],
+                                record["imdbid"],
+                                record["Rootfolder"],
+                            )
                 # Method 2: Search by title + year (for Manual Mode)
                 if not db_record and search_query_title:
                     logger.info(
@@ -10389,33 +10912,22 @@ async def fetch_asset_replacements(request: AssetReplaceRequest):
                     )
                     search_method = "title"
 
-                    with db.lock:
-                        conn = db._get_connection()
-                        try:
-                            cursor = conn.cursor()
-                            if request.year:
-                                cursor.execute(
-                                    """
-                                    SELECT tmdbid, tvdbid, imdbid, Rootfolder
-                                    FROM imagechoices
-                                    WHERE Rootfolder LIKE ?
-                                    LIMIT 1
-                                """,
-                                    (f"%{search_query_title}%({request.year})%",),
-                                )
-                            else:
-                                cursor.execute(
-                                    """
-                                    SELECT tmdbid, tvdbid, imdbid, Rootfolder
-                                    FROM imagechoices
-                                    WHERE Rootfolder LIKE ?
-                                    LIMIT 1
-                                """,
-                                    (f"%{search_query_title}%",),
-                                )
-                            db_record = cursor.fetchone()
-                        finally:
-                            conn.close()
+                    # Full-text match on the folder name ("Alien (1979) {tmdb-348}")
+                    folder_query = (
+                        f"{search_query_title} {request.year}"
+                        if request.year
+                        else search_query_title
+                    )
+                    matches = await run_db(
+                        db.search_choices, folder_query, 1, "Rootfolder"
+                    )
+                    if matches:
+                        db_record = (
+                            matches[0]["tmdbid"],
+                            matches[0]["tvdbid"],
+                            matches[0]["imdbid"],
+                            matches[0]["Rootfolder"],
+                        )
 
                 # Process database record if found
                 if db_record:
@@ -10455,15 +10967,13 @@ async def fetch_asset_replacements(request: AssetReplaceRequest):
                 logger.debug("Continuing with title-based search...")
 
         # Load config to get API keys and language preferences
-        if not CONFIG_PATH.exists():
+        grouped_config = config_service.get()
+        if grouped_config is None:
             raise HTTPException(status_code=404, detail="Config file not found")
 
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            grouped_config = json.load(f)
-
         # Get API tokens and language preferences - support multiple key name variants
         if CONFIG_MAPPER_AVAILABLE:
-            flat_config = flatten_config(grouped_config)
+            flat_config = config_service.get_flat()
             tmdb_token = flat_config.get("tmdbtoken", "")
             # Support both "tvdbapikey" and "tvdbapi" for TVDB
             tvdb_api_key = flat_config.get("tvdbapikey") or flat_config.get(
@@ -12074,126 +12584,106 @@ async def upload_asset_replacement(
         raise HTTPException(status_code=500, detail="An internal server error occurred.")
 
 
-def delete_db_entries_for_asset(asset_path: str):
+def _asset_entry_match(asset_path: str) -> Optional[tuple]:
     """
-    Delete database entries for a given asset path.
-    Matches entries based on Rootfolder, Type, and filename pattern.
+    Match of the database entries of an asset file for ImageChoicesDB.delete_asset_entries:
+    (Rootfolder, Type values, Title LIKE patterns)
 
     Args:
         asset_path: Path to the asset (e.g., "TestSerien/Show Name (2020)/Season02.jpg")
     """
-    if not DATABASE_AVAILABLE or db is None:
-        logger.debug("Database not available, skipping DB entry deletion")
-        return
-
-    try:
-        # Parse the asset path to extract metadata
-        # Normalize path separators to forward slashes
-        normalized_path = asset_path.replace("\\", "/")
-        path_parts = normalized_path.split("/")
-
-        if len(path_parts) < 2:
-            logger.warning(f"Asset path too short to extract metadata: {asset_path}")
-            return
+    # Normalize path separators to forward slashes
+    normalized_path = asset_path.replace("\\", "/")
+    path_parts = normalized_path.split("/")
 
-        # Extract folder name and filename
-        folder_name = path_parts[1] if len(path_parts) > 1 else ""
-        filename = path_parts[-1] if len(path_parts) > 0 else ""
+    if len(path_parts) < 2:
+        logger.warning(f"Asset path too short to extract metadata: {asset_path}")
+        return None
 
-        # Determine asset type from filename
-        # Note: Database uses different type names than our internal naming
-        # Database types: "Movie", "Movie Background", "Show", "Show Background", "Season", "Episode"
-        is_background = "background" in filename.lower()
-        is_season = re.match(r"^Season(\d+)\.jpg$", filename, re.IGNORECASE)
-        is_episode = re.match(r"^S(\d+)E(\d+)\.jpg$", filename, re.IGNORECASE)
-
-        # Determine the database Type values to search for
-        # For posters/backgrounds, we need to check both Movie and Show types
-        search_types = []
-        if is_season:
-            search_types = ["Season"]
-        elif is_episode:
-            search_types = ["Episode"]
-        elif is_background:
-            search_types = ["Movie Background", "Show Background"]
-        else:
-            # Regular poster - could be Movie or Show or Poster
-            search_types = ["Movie", "Show", "Poster"]
+    # Extract folder name and filename
+    folder_name = path_parts[1] if len(path_parts) > 1 else ""
+    filename = path_parts[-1] if len(path_parts) > 0 else ""
+
+    # Determine asset type from filename
+    # Note: Database uses different type names than our internal naming
+    # Database types: "Movie", "Movie Background", "Show", "Show Background", "Season", "Episode"
+    is_background = "background" in filename.lower()
+    is_season = re.match(r"^Season(\d+)\.jpg$", filename, re.IGNORECASE)
+    is_episode = re.match(r"^S(\d+)E(\d+)\.jpg$", filename, re.IGNORECASE)
+
+    # Determine the database Type values to search for
+    # For posters/backgrounds, we need to check both Movie and Show types
+    title_patterns = []
+    if is_season:
+        # For seasons, find entries with matching season number in title
+        season_num = is_season.group(1)
+        search_types = ["Season"]
+        title_patterns = [
+            f"%Season{season_num}%",
+            f"%Season {season_num}%",
+            f"%Season0{season_num}%",
+        ]
+    elif is_episode:
+        # For episodes, find entries with matching episode pattern in title
+        season_num = is_episode.group(1)
+        episode_num = is_episode.group(2)
+        search_types = ["Episode"]
+        title_patterns = [
+            f"%S{season_num}E{episode_num}%",
+            f"%S0{season_num}E0{episode_num}%",
+        ]
+    elif is_background:
+        search_types = ["Movie Background", "Show Background"]
+    else:
+        # Regular poster - could be Movie or Show or Poster
+        search_types = ["Movie", "Show", "Poster"]
 
-        # Collect all matching entries across all possible type names
-        all_entries = []
+    logger.debug(
+        f"Searching for DB entries: folder={folder_name}, types={search_types}, is_episode={bool(is_episode)}, is_season={bool(is_season)}"
+    )
+    return folder_name, search_types, title_patterns
 
-        logger.debug(
-            f"Searching for DB entries: folder={folder_name}, types={search_types}, is_episode={bool(is_episode)}, is_season={bool(is_season)}"
-        )
 
-        # FIX: Use _get_connection within the lock
-        with db.lock:
-            conn = db._get_connection()
-            try:
-                cursor = conn.cursor()
-
-                for db_type in search_types:
-                    if is_season:
-                        # For seasons, find entries with matching season number in title
-                        season_num = is_season.group(1)
-                        cursor.execute(
-                            """SELECT id, Title, Type FROM imagechoices
-                               WHERE Rootfolder = ? AND Type = ?
-                               AND (Title LIKE ? OR Title LIKE ? OR Title LIKE ?)""",
-                            (
-                                folder_name,
-                                db_type,
-                                f"%Season{season_num}%",
-                                f"%Season {season_num}%",
-                                f"%Season0{season_num}%",
-                            ),
-                        )
-                    elif is_episode:
-                        # For episodes, find entries with matching episode pattern in title
-                        season_num = is_episode.group(1)
-                        episode_num = is_episode.group(2)
-                        pattern1 = f"%S{season_num}E{episode_num}%"
-                        pattern2 = f"%S0{season_num}E0{episode_num}%"
-                        cursor.execute(
-                            """SELECT id, Title, Type FROM imagechoices
-                               WHERE Rootfolder = ? AND Type = ?
-                               AND (Title LIKE ? OR Title LIKE ?)""",
-                            (folder_name, db_type, pattern1, pattern2),
-                        )
-                    else:
-                        # For poster/background, match on Rootfolder + Type only
-                        cursor.execute(
-                            "SELECT id, Title, Type FROM imagechoices WHERE Rootfolder = ? AND Type = ?",
-                            (folder_name, db_type),
-                        )
+def delete_db_entries_for_assets(asset_paths: List[str]) -> int:
+    """
+    Delete database entries for several asset paths in one transaction.
+    Matches entries based on Rootfolder, Type, and filename pattern.
 
-                    # Fetch and extend results for this type
-                    found = cursor.fetchall()
-                    logger.debug(f"Found {len(found)} entries for type {db_type}")
-                    all_entries.extend(found)
-            finally:
-                conn.close()
-
-        if all_entries:
-            for entry in all_entries:
-                record_id = entry["id"]
-                title = entry["Title"]
-                entry_type = entry["Type"]
-                db.delete_choice(record_id)
-                logger.info(
-                    f"Deleted DB entry #{record_id} for deleted asset: {title} ({entry_type})"
-                )
-        else:
-            logger.debug(
-                f"No DB entries found for deleted asset: {filename} in {folder_name}"
-            )
+    Returns:
+        Number of deleted database entries
+    """
+    if not DATABASE_AVAILABLE or db is None:
+        logger.debug("Database not available, skipping DB entry deletion")
+        return 0
 
+    matches = [match for match in map(_asset_entry_match, asset_paths) if match]
+    try:
+        deleted_entries = db.delete_asset_entries(matches)
     except Exception as e:
-        logger.error(f"Error deleting database entries for asset {asset_path}: {e}")
+        logger.error(f"Error deleting database entries for {len(asset_paths)} asset(s): {e}")
         import traceback
 
         logger.error(traceback.format_exc())
+        return 0
+
+    for entry in deleted_entries:
+        logger.info(
+            f"Deleted DB entry #{entry['id']} for deleted asset: {entry['Title']} ({entry['Type']})"
+        )
+    if not deleted_entries:
+        logger.debug(f"No DB entries found for deleted asset(s): {', '.join(asset_paths)}")
+    return len(deleted_entries)
+
+
+def delete_db_entries_for_asset(asset_path: str):
+    """
+    Delete database entries for a given asset path.
+    Matches entries based on Rootfolder, Type, and filename pattern.
+
+    Args:
+        asset_path: Path to the asset (e.g., "TestSerien/Show Name (2020)/Season02.jpg")
+    """
+    delete_db_entries_for_assets([asset_path])
 
 
 async def update_asset_db_entry_as_manual(
@@ -12269,84 +12759,51 @@ async def update_asset_db_entry_as_manual(
         # - For episodes: match on Rootfolder + Type + episode pattern in Title
         # - For poster/background: match on Rootfolder + Type
 
-        existing_entries = []
-        with db.lock:
-            conn = db._get_connection()
-            try:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
+        # Extract season/episode info from filename for more specific matching
+        season_match = re.match(r"^Season(\d+)\.jpg$", filename, re.IGNORECASE)
+        episode_match = re.match(r"^S(\d+)E(\d+)\.jpg$", filename, re.IGNORECASE)
 
-                # Extract season/episode info from filename for more specific matching
-                season_match = re.match(r"^Season(\d+)\.jpg$", filename, re.IGNORECASE)
-                episode_match = re.match(r"^S(\d+)E(\d+)\.jpg$", filename, re.IGNORECASE)
+        title_patterns = []
+        if season_match:
+            # For seasons, find entries with matching season number in title
+            season_num = season_match.group(1)
+            # Also try without leading zero
+            season_num_int = str(int(season_num))
+            logger.info(
+                f"Searching for Season: folder='{final_folder_name}', season_num='{season_num}', season_num_int='{season_num_int}'"
+            )
+            search_types = [asset_type]
+            title_patterns = [
+                f"%Season{season_num}%",
+                f"%Season {season_num}%",
+                f"%Season{season_num_int}%",
+            ]
+        elif episode_match:
+            # For episodes, find entries with matching episode pattern in title
+            season_num = episode_match.group(1)
+            episode_num = episode_match.group(2)
+            search_types = [asset_type]
+            title_patterns = [
+                f"%S{season_num}E{episode_num}%",
+                f"%S0{season_num}E0{episode_num}%",
+            ]
+        elif asset_type == "Poster":
+            # For poster/background, match on Rootfolder + Type
+            search_types = ["Show", "Movie"]
+        elif asset_type == "Background":
+            search_types = ["Show Background", "Movie Background"]
+        else:
+            search_types = [asset_type]
 
-                if season_match:
-                    # For seasons, find entries with matching season number in title
-                    season_num = season_match.group(1)
-                    # Also try without leading zero
-                    season_num_int = str(int(season_num))
-                    logger.info(
-                        f"Searching for Season: folder='{final_folder_name}', season_num='{season_num}', season_num_int='{season_num_int}'"
-                    )
-                    cursor.execute(
-                        """SELECT id, Title, Type FROM imagechoices
-                           WHERE Rootfolder = ? AND Type = ?
-                           AND (Title LIKE ? OR Title LIKE ? OR Title LIKE ? OR Title LIKE ?)""",
-                        (
-                            final_folder_name,
-                            asset_type,
-                            f"%Season{season_num}%",
-                            f"%Season {season_num}%",
-                            f"%Season{season_num_int}%",
-                            f"%Season{season_num_int}%",
-                        ),
-                    )
-                elif episode_match:
-                    # For episodes, find entries with matching episode pattern in title
-                    season_num = episode_match.group(1)
-                    episode_num = episode_match.group(2)
-                    cursor.execute(
-                        """SELECT id, Title FROM imagechoices
-                           WHERE Rootfolder = ? AND Type = ?
-                           AND (Title LIKE ? OR Title LIKE ?)""",
-                        (
-                            final_folder_name,
-                            asset_type,
-                            f"%S{season_num}E{episode_num}%",
-                            f"%S0{season_num}E0{episode_num}%",
-                        ),
-                    )
-                else:
-                    # For poster/background, match on Rootfolder + Type
-                    if asset_type == "Poster":
-                        cursor.execute(
-                            "SELECT id, Title, Type FROM imagechoices WHERE Rootfolder = ? AND Type IN ('Show', 'Movie')",
-                            (final_folder_name,),
-                        )
-                    elif asset_type == "Background":
-                        cursor.execute(
-                            "SELECT id, Title, Type FROM imagechoices WHERE Rootfolder = ? AND Type IN ('Show Background', 'Movie Background')",
-                            (final_folder_name,),
-                        )
-                    else:
-                        cursor.execute(
-                            "SELECT id, Title, Type FROM imagechoices WHERE Rootfolder = ? AND Type = ?",
-                            (final_folder_name, asset_type),
-                        )
+        # Lookup and delete run in one transaction
+        deleted_entries = await run_db(
+            db.delete_asset_entries, [(final_folder_name, search_types, title_patterns)]
+        )
 
-                existing_entries = cursor.fetchall()
-            finally:
-                conn.close()
-
-        if existing_entries:
-            for entry in existing_entries:
-                record_id = entry["id"]
-                old_title = entry["Title"]
-                # sqlite3.Row objects use dictionary-style access, not .get()
-                entry_type = entry["Type"] if "Type" in entry.keys() else asset_type
-                db.delete_choice(record_id)
+        if deleted_entries:
+            for entry in deleted_entries:
                 logger.info(
-                    f"Deleted DB entry #{record_id} for manual replacement: {old_title} ({entry_type})"
+                    f"Deleted DB entry #{entry['id']} for manual replacement: {entry['Title']} ({entry['Type']})"
                 )
             logger.info(
                 f"New entry will be created by CSV import after script completes"
@@ -12794,39 +13251,24 @@ async def trigger_manual_run_internal(request: ManualModeRequest):
 
     logger.info(f"Manual Run process started (PID: {current_process.pid})")
 
-async def _find_and_delete_asset(record_id: int) -> Dict[str, any]:
+def _delete_asset_file(record_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Internal helper to find an asset file by its DB record ID,
-    delete the file, and then delete the DB record.
+    Internal helper to find and delete the asset file of a DB record.
 
     Returns:
-        A dict with status and asset info.
+        A dict with "delete_record" (whether the DB record should be deleted now),
+        "file_deleted", "asset_info" and, if the file could not be deleted, "error".
     """
-    if not DATABASE_AVAILABLE or db is None:
-        logger.warning(f"[DeleteAsset] Database not available (ID: {record_id})")
-        return {"success": False, "error": "Database not available"}
-
-    # Step 1: Get the record from DB
-    record = db.get_choice_by_id(record_id)
-    if not record:
-        logger.warning(f"[DeleteAsset] Record not found in DB (ID: {record_id})")
-        return {"success": False, "error": "Record not found in database"}
-
-    record_dict = dict(record)
+    record_id = record_dict.get("id")
     rootfolder = record_dict.get("Rootfolder")
     library = record_dict.get("LibraryName")
     asset_type = (record_dict.get("Type") or "").lower()
     title = record_dict.get("Title") or ""
 
     if not rootfolder or not library:
-        logger.warning(f"[DeleteAsset] Record missing Rootfolder/LibraryName (ID: {record_id})")
         # Record exists but is invalid, delete it from DB
-        try:
-            db.delete_choice(record_id)
-            logger.info(f"[DeleteAsset] Deleted invalid DB record (ID: {record_id})")
-        except Exception as e_db:
-            logger.error(f"[DeleteAsset] Failed to delete invalid DB record (ID: {record_id}): {e_db}")
-        return {"success": True, "file_deleted": False, "db_deleted": True, "asset_info": title}
+        logger.warning(f"[DeleteAsset] Record missing Rootfolder/LibraryName (ID: {record_id})")
+        return {"delete_record": True, "file_deleted": False, "asset_info": title}
 
     asset_info = f"{library}/{rootfolder} ({title})"
 
@@ -12848,14 +13290,9 @@ async def _find_and_delete_asset(record_id: int) -> Dict[str, any]:
         asset_filename = "poster.jpg"
 
     if not asset_filename:
-        logger.warning(f"[DeleteAsset] Could not determine filename for {asset_info}")
         # We can still delete the DB record
-        try:
-            db.delete_choice(record_id)
-            logger.info(f"[DeleteAsset] Deleted DB record (file not found) (ID: {record_id})")
-        except Exception as e_db:
-            logger.error(f"[DeleteAsset] Failed to delete DB record (ID: {record_id}): {e_db}")
-        return {"success": True, "file_deleted": False, "db_deleted": True, "asset_info": asset_info}
+        logger.warning(f"[DeleteAsset] Could not determine filename for {asset_info}")
+        return {"delete_record": True, "file_deleted": False, "asset_info": asset_info}
 
     # Step 3: Construct file path
     try:
@@ -12864,31 +13301,62 @@ async def _find_and_delete_asset(record_id: int) -> Dict[str, any]:
     except HTTPException as e:
         logger.warning(f"[DeleteAsset] Path traversal blocked or invalid path for {asset_info}: {e.detail}")
         # Delete DB record anyway since it's "orphan" or dangerous
-        db.delete_choice(record_id)
-        return {"success": True, "file_deleted": False, "db_deleted": True, "asset_info": asset_info}
-    file_deleted = False
+        return {"delete_record": True, "file_deleted": False, "asset_info": asset_info}
 
     # Step 4: Delete the file
     try:
         if file_path.exists() and file_path.is_file():
             file_path.unlink()
-            file_deleted = True
             logger.info(f"[DeleteAsset] Successfully deleted asset file: {file_path}")
-        else:
-            logger.warning(f"[DeleteAsset] Asset file not found, skipping delete: {file_path}")
+            return {"delete_record": True, "file_deleted": True, "asset_info": asset_info}
+        logger.warning(f"[DeleteAsset] Asset file not found, skipping delete: {file_path}")
+        return {"delete_record": True, "file_deleted": False, "asset_info": asset_info}
     except Exception as e_file:
         logger.error(f"[DeleteAsset] Error deleting asset file {file_path}: {e_file}")
         # Do NOT proceed to delete DB record if file delete failed
-        return {"success": False, "error": f"Failed to delete file: {e_file}", "asset_info": asset_info}
+        return {
+            "delete_record": False,
+            "file_deleted": False,
+            "error": f"Failed to delete file: {e_file}",
+            "asset_info": asset_info,
+        }
+
+
+async def _find_and_delete_asset(record_id: int) -> Dict[str, any]:
+    """
+    Internal helper to find an asset file by its DB record ID,
+    delete the file, and then delete the DB record.
+
+    Returns:
+        A dict with status and asset info.
+    """
+    if not DATABASE_AVAILABLE or db is None:
+        logger.warning(f"[DeleteAsset] Database not available (ID: {record_id})")
+        return {"success": False, "error": "Database not available"}
+
+    # Step 1: Get the record from DB
+    record = db.get_choice_by_id(record_id)
+    if not record:
+        logger.warning(f"[DeleteAsset] Record not found in DB (ID: {record_id})")
+        return {"success": False, "error": "Record not found in database"}
+
+    result = _delete_asset_file(dict(record))
+    if not result["delete_record"]:
+        return {"success": False, "error": result["error"], "asset_info": result["asset_info"]}
 
     # Step 5: Delete the DB record
     try:
         db.delete_choice(record_id)
         logger.info(f"[DeleteAsset] Successfully deleted DB record (ID: {record_id})")
-        return {"success": True, "file_deleted": file_deleted, "db_deleted": True, "asset_info": asset_info}
+        return {
+            "success": True,
+            "file_deleted": result["file_deleted"],
+            "db_deleted": True,
+            "asset_info": result["asset_info"],
+        }
     except Exception as e_db:
-        logger.error(f"[DeleteAsset] File deleted, but failed to delete DB record (ID: {record_id}): {e_db}")
-        return {"success": False, "error": f"File deleted, but DB delete failed: {e_db}", "asset_info": asset_info}
+        logger.error(f"[DeleteAsset] Failed to delete DB record (ID: {record_id}): {e_db}")
+        return {"success": False, "error": f"DB delete failed: {e_db}", "asset_info": result["asset_info"]}
 
 @app.delete("/api/assets/delete-asset/{record_id}")
 async def delete_asset_and_record(record_id: int):
@@ -12928,31 +13396,61 @@ async def bulk_delete_assets_and_records(request: BulkDeleteAssetsRequest):
     """
     Deletes multiple assets: files from /assets AND the
     corresponding records from the imagechoices database.
+    Records are read and deleted in one batch each.
     """
     logger.info("=" * 60)
     logger.info(f"BULK ASSET DELETE REQUEST: {len(request.record_ids)} items")
 
-    deleted_count = 0
+    if not DATABASE_AVAILABLE or db is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+
     failed_items = []
+    record_ids_to_delete = []
+    start_time = time.perf_counter()
 
+    records = await run_db(db.get_choices_by_ids, request.record_ids)
     for record_id in request.record_ids:
+        record = records.get(record_id)
+        if record is None:
+            failed_items.append({"id": record_id, "error": "Record not found in database"})
+            logger.warning(f"Bulk delete failed for ID {record_id}: Record not found in database")
+            continue
         try:
-            result = await _find_and_delete_asset(record_id)
-            if result["success"]:
-                deleted_count += 1
+            result = _delete_asset_file(dict(record))
+            if result["delete_record"]:
+                record_ids_to_delete.append(record_id)
             else:
                 failed_items.append({"id": record_id, "error": result.get("error", "Unknown error")})
                 logger.warning(f"Bulk delete failed for ID {record_id}: {result.get('error')}")
         except Exception as e:
             failed_items.append({"id": record_id, "error": str(e)})
             logger.error(f"Unexpected error in bulk delete for ID {record_id}: {e}", exc_info=True)
+    files_seconds = time.perf_counter() - start_time
+
+    # Delete all DB records in one transaction
+    db_start = time.perf_counter()
+    deleted_count = 0
+    try:
+        if record_ids_to_delete:
+            await run_db(db.delete_choices, record_ids_to_delete)
+        deleted_count = len(record_ids_to_delete)
+    except Exception as e_db:
+        logger.error(f"Bulk delete: files deleted, but DB delete failed: {e_db}")
+        failed_items.extend(
+            {"id": record_id, "error": f"File deleted, but DB delete failed: {e_db}"}
+            for record_id in record_ids_to_delete
+        )
+    db_seconds = time.perf_counter() - db_start
 
     # Trigger cache refresh in background *after* all deletes are done
     if deleted_count > 0:
         threading.Thread(target=scan_and_cache_assets, daemon=True).start()
         logger.info(f"Bulk delete complete, triggering cache refresh.")
 
-    logger.info(f"Bulk delete summary: {deleted_count} deleted, {len(failed_items)} failed.")
+    logger.info(
+        f"Bulk delete summary: {deleted_count} deleted, {len(failed_items)} failed "
+        f"(files {files_seconds:.3f}s, database {db_seconds:.3f}s)."
+    )
     logger.info("=" * 60)
 
     return {
@@ -12960,6 +13458,10 @@ async def bulk_delete_assets_and_records(request: BulkDeleteAssetsRequest):
         "deleted_count": deleted_count,
         "failed_count": len(failed_items),
         "failed_items": failed_items,
+        "timing": {
+            "files_seconds": round(files_seconds, 3),
+            "database_seconds": round(db_seconds, 3),
+        },
         "message": f"Deleted {deleted_count} assets. {len(failed_items)} failed."
     }
 
@@ -12994,7 +13496,7 @@ async def get_assets_overview():
 
     try:
         # Get all records from database
-        records = db.get_all_choices()
+        records = await run_db(db.get_all_choices)
 
         # Create a fast lookup map from the asset cache
         logger.debug("Creating fast asset lookup map from cache for overview...")
@@ -13020,43 +13522,41 @@ async def get_assets_overview():
         primary_provider = None
 
         try:
-            if CONFIG_PATH.exists():
-                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-
-                    # Check ApiPart for Language Orders
-                    api_part = config.get("ApiPart", {})
-
-                    # 1. Main Poster Language
-                    lang_order = api_part.get("PreferredLanguageOrder", [])
-                    if lang_order and len(lang_order) > 0:
-                        primary_language = lang_order[0]
-
-                    # 2. Background Language (Fallback to Main if empty or "PleaseFillMe")
-                    bg_lang_order = api_part.get("PreferredBackgroundLanguageOrder", [])
-                    if bg_lang_order and len(bg_lang_order) > 0 and bg_lang_order[0].lower() != "pleasefillme":
-                        primary_background_language = bg_lang_order[0]
-                    else:
-                        primary_background_language = primary_language
+            config = config_service.get()
+            if config is not None:
+                # Check ApiPart for Language Orders
+                api_part = config.get("ApiPart", {})
+
+                # 1. Main Poster Language
+                lang_order = api_part.get("PreferredLanguageOrder", [])
+                if lang_order and len(lang_order) > 0:
+                    primary_language = lang_order[0]
+
+                # 2. Background Language (Fallback to Main if empty or "PleaseFillMe")
+                bg_lang_order = api_part.get("PreferredBackgroundLanguageOrder", [])
+                if bg_lang_order and len(bg_lang_order) > 0 and bg_lang_order[0].lower() != "pleasefillme":
+                    primary_background_language = bg_lang_order[0]
+                else:
+                    primary_background_language = primary_language
 
-                    # 3. Season Language (Fallback to Main if empty or "PleaseFillMe")
-                    season_lang_order = api_part.get("PreferredSeasonLanguageOrder", [])
-                    if season_lang_order and len(season_lang_order) > 0 and season_lang_order[0].lower() != "pleasefillme":
-                        primary_season_language = season_lang_order[0]
-                    else:
-                        primary_season_language = primary_language
+                # 3. Season Language (Fallback to Main if empty or "PleaseFillMe")
+                season_lang_order = api_part.get("PreferredSeasonLanguageOrder", [])
+                if season_lang_order and len(season_lang_order) > 0 and season_lang_order[0].lower() != "pleasefillme":
+                    primary_season_language = season_lang_order[0]
+                else:
+                    primary_season_language = primary_language
 
-                    # 4. Title Card Language (Fallback to Main if empty or "PleaseFillMe")
-                    tc_lang_order = api_part.get("PreferredTCLanguageOrder", [])
-                    if tc_lang_order and len(tc_lang_order) > 0 and tc_lang_order[0].lower() != "pleasefillme":
-                        primary_titlecard_language = tc_lang_order[0]
-                    else:
-                        primary_titlecard_language = primary_language
+                # 4. Title Card Language (Fallback to Main if empty or "PleaseFillMe")
+                tc_lang_order = api_part.get("PreferredTCLanguageOrder", [])
+                if tc_lang_order and len(tc_lang_order) > 0 and tc_lang_order[0].lower() != "pleasefillme":
+                    primary_titlecard_language = tc_lang_order[0]
+                else:
+                    primary_titlecard_language = primary_language
 
-                    # Get FavProvider from ApiPart
-                    fav_provider = api_part.get("FavProvider", "")
-                    if fav_provider:
-                        primary_provider = fav_provider.lower()
+                # Get FavProvider from ApiPart
+                fav_provider = api_part.get("FavProvider", "")
+                if fav_provider:
+                    primary_provider = fav_provider.lower()
 
         except Exception as e:
             logger.warning(f"Could not read config: {e}")
@@ -13225,20 +13725,100 @@ async def get_assets_overview():
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/imagechoices")
-async def get_all_imagechoices():
-    """Get all image choice records"""
+async def get_all_imagechoices(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    library: Optional[str] = None,
+    type: Optional[str] = None,
+    language: Optional[str] = None,
+    manual: Optional[bool] = None,
+    created_from: Optional[str] = None,
+    created_to: Optional[str] = None,
+    sort: str = "id",
+    order: str = "desc",
+    fields: Optional[str] = None,
+):
+    """
+    Get image choice records.
+
+    Without query parameters all records are returned as a list (legacy behaviour).
+    With any of cursor/limit/filters/sort/fields the result is paginated:
+    {"items": [...], "next_cursor": ..., "has_more": ..., "total": ...}.
+    Pass next_cursor back as `cursor` to fetch the next page. `total` is only
+    included on the first page.
+    """
     if not DATABASE_AVAILABLE or db is None:
         raise HTTPException(status_code=503, detail="Database not available")
 
+    filters = {
+        "library": library,
+        "asset_type": type,
+        "language": language,
+        "manual": manual,
+        "created_from": created_from,
+        "created_to": created_to,
+    }
+    paginated = (
+        cursor is not None
+        or limit is not None
+        or fields is not None
+        or sort != "id"
+        or order != "desc"
+        or any(value is not None for value in filters.values())
+    )
+
     try:
-        records = db.get_all_choices()
-        # Convert sqlite3.Row to dict
-        return [dict(record) for record in records]
+        if not paginated:
+            records = await run_db(db.get_all_choices)
+            # Convert sqlite3.Row to dict
+            return [dict(record) for record in records]
+
+        columns = [c.strip() for c in fields.split(",") if c.strip()] if fields else None
+        try:
+            page = await run_db(
+                db.query_choices,
+                columns=columns,
+                sort=sort,
+                order=order,
+                limit=limit or 100,
+                cursor=cursor,
+                **filters,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        response = {"success": True, **page, "limit": limit or 100}
+        if cursor is None:
+            response["total"] = await run_db(db.count_choices, **filters)
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching image choices: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/api/imagechoices/search")
+async def search_imagechoices(
+    q: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=100)
+):
+    """
+    Ranked prefix/token search over titles and folder names. Provider id
+    patterns ("{tmdb-123}", "[tvdb-456]", "imdb-tt0078748") are looked up directly.
+    """
+    if not DATABASE_AVAILABLE or db is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+
+    try:
+        results = await run_db(db.find_by_provider_id, q, limit)
+        if not results:
+            results = await run_db(db.search_choices, q, limit)
+        return {"success": True, "results": results, "count": len(results)}
+    except Exception as e:
+        logger.error(f"Error searching image choices: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @app.get("/api/imagechoices/{title}")
 async def get_imagechoice_by_title(title: str):
     """Get image choice by title"""
@@ -13246,7 +13826,7 @@ async def get_imagechoice_by_title(title: str):
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        record = db.get_choice_by_title(title)
+        record = await run_db(db.get_choice_by_title, title)
         if record is None:
             raise HTTPException(status_code=404, detail="Record not found")
         return dict(record)
@@ -13440,7 +14020,7 @@ async def import_imagechoices_csv():
         )
 
     try:
-        stats = db.import_from_csv(csv_path)
+        stats = db.import_from_csv(csv_path, full=True)
         return {
             "message": "CSV import completed",
             "stats": {
@@ -13559,6 +14139,21 @@ def _sanitize_db_file(db_path: Path):
     try:
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
+        # Full-text indexes hold tokens of the unsanitized text - drop them (and
+        # their sync triggers) from the copy; the app rebuilds them when needed
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND sql LIKE 'CREATE VIRTUAL TABLE%'"
+        )
+        for (virtual_table,) in cursor.fetchall():
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='trigger' AND sql LIKE ?",
+                (f"%{virtual_table}%",),
+            )
+            for (trigger,) in cursor.fetchall():
+                cursor.execute(f'DROP TRIGGER IF EXISTS "{trigger}"')
+            cursor.execute(f'DROP TABLE IF EXISTS "{virtual_table}"')
+        conn.commit()
+
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
         tables = [r[0] for r in cursor.fetchall() if r[0] != 'sqlite_sequence']
         
@@ -13654,7 +14249,6 @@ def _create_support_zip_blocking(staging_dir_path: Path, zip_file_path: Path) ->
 
         # 2. Copy Log Folders
         # Define ignore patterns
-        ignore_patterns_default = shutil.ignore_patterns('*.pyc', '__pycache__', '.DS_Store')
         # For LOGS_DIR and ROTATED_LOGS_DIR, also ignore .json files
         ignore_patterns_logs = shutil.ignore_patterns('*.pyc', '__pycache__', '.DS_Store', '*.json')
 
@@ -13681,8 +14275,18 @@ def _create_support_zip_blocking(staging_dir_path: Path, zip_file_path: Path) ->
                 UI_LOGS_DIR,
                 staging_dir_path / "UILogs",
                 dirs_exist_ok=True,
-                ignore=ignore_patterns_default # Use default ignore pattern
+                # Rotated .gz segments are expanded below so they can be sanitized
+                ignore=shutil.ignore_patterns('*.pyc', '__pycache__', '.DS_Store', '*.gz')
             )
+            # Expand rotated segments (FrontendUI.log.1.gz -> FrontendUI.1.log)
+            for current_log in list(UI_LOGS_DIR.glob("*.log")) + list(UI_LOGS_DIR.glob("*.jsonl")):
+                for segment_index, segment in enumerate(rotated_segments(current_log), start=1):
+                    target = staging_dir_path / "UILogs" / f"{current_log.stem}.{segment_index}{current_log.suffix}"
+                    try:
+                        with open_log_segment(segment, binary=True) as src, open(target, "wb") as dst:
+                            shutil.copyfileobj(src, dst)
+                    except (OSError, EOFError) as e:
+                        logger.warning(f"[SupportZip] Could not expand rotated log {segment.name}: {e}")
             logger.info("[SupportZip] Copied UILogs directory")
 
         # 3. Copy Databases
@@ -13694,7 +14298,7 @@ def _create_support_zip_blocking(staging_dir_path: Path, zip_file_path: Path) ->
         ]:
             src_db = DATABASE_DIR / db_name
             if src_db.exists():
-                shutil.copy2(src_db, db_staging_dir / db_name)
+                backup_database(src_db, db_staging_dir / db_name)
                 logger.debug(f"[SupportZip] Copied DB: {db_name}")
 
         # 3b. Sanitize all copied logs and databases recursively
@@ -13710,7 +14314,7 @@ def _create_support_zip_blocking(staging_dir_path: Path, zip_file_path: Path) ->
                 if suffix == '.db':
                     logger.debug(f"[SupportZip] Sanitizing database file: {file_path.name}")
                     _sanitize_db_file(file_path)
-                elif suffix in ['.log', '.txt', '.json'] or (suffix == '.csv' and file_path.name.lower() == 'imagechoices.csv'):
+                elif suffix in ['.log', '.jsonl', '.txt', '.json'] or (suffix == '.csv' and file_path.name.lower() == 'imagechoices.csv'):
                     logger.debug(f"[SupportZip] Sanitizing text file: {file_path.name}")
                     _sanitize_text_file(file_path)
 
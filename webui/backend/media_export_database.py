@@ -3,14 +3,24 @@ Database module for Media Server export data tracking
 Handles media library export data (Plex, Jellyfin, Emby) with run history
 """
 
+import base64
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
 import csv
+import hashlib
+import json
 import os
 import threading
+import time
+
+try:
+    from .db_pool import get_pool
+except ImportError:
+    from db_pool import get_pool
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +37,166 @@ DATABASE_DIR = BASE_DIR / "database"
 DB_PATH = DATABASE_DIR / "media_export.db"
 LOGS_DIR = BASE_DIR / "Logs"
 
+# Export tables store one row per item *version*. valid_from/valid_to are export_runs ids:
+# a version is part of every run of its source from valid_from up to (not including)
+# valid_to, and valid_to IS NULL marks the current version. A run only writes the items
+# that are new or changed and closes the ones that disappeared.
+# columns: data columns in CSV import order; key: columns identifying an item;
+# order: sort columns of the readers (keyset pagination appends id)
+EXPORT_TABLES = {
+    "plex_library_export": {
+        "source": "plex",
+        "key": ("rating_key",),
+        "columns": (
+            "run_timestamp", "library_name", "library_type", "library_language",
+            "title", "resolution", "original_title", "season_names", "season_numbers",
+            "season_rating_keys", "year", "tvdbid", "imdbid", "tmdbid", "rating_key",
+            "path", "root_foldername", "extra_folder", "multiple_versions",
+            "plex_poster_url", "plex_background_url", "plex_season_urls", "labels",
+        ),
+        "order": ("title",),
+    },
+    "plex_episode_export": {
+        "source": "plex",
+        "key": ("show_name", "season_number"),
+        "columns": (
+            "run_timestamp", "show_name", "type", "tvdbid", "tmdbid",
+            "library_name", "season_number", "episodes", "title",
+            "rating_keys", "plex_titlecard_urls", "resolutions",
+        ),
+        "order": ("show_name", "season_number"),
+    },
+    "other_media_library_export": {
+        "source": "other",
+        "key": ("media_id",),
+        "columns": (
+            "run_timestamp", "library_name", "library_type", "library_language",
+            "media_id", "title", "original_title", "year", "resolution",
+            "imdbid", "tmdbid", "tvdbid", "path", "root_foldername",
+            "extra_folder", "other_media_poster_url", "other_media_background_url", "labels",
+        ),
+        "order": ("library_name", "title"),
+    },
+    "other_media_episode_export": {
+        "source": "other",
+        "key": ("show_name", "season_number"),
+        "columns": (
+            "run_timestamp", "show_name", "type", "tvdbid", "tmdbid", "imdbid",
+            "library_name", "season_number", "episodes", "title",
+            "rating_keys", "other_media_titlecard_urls", "resolutions",
+        ),
+        "order": ("show_name", "season_number"),
+    },
+}
+
+# Columns declared NOT NULL (title only in the library tables)
+_NOT_NULL_COLUMNS = {"run_timestamp", "title", "show_name"}
+
+# Columns the library readers can filter on (indexed)
+LIBRARY_FILTER_COLUMNS = ("library_name", "root_foldername")
+
+# CSV header of each data column after run_timestamp, and the headers of which at
+# least one must be non-empty for a row to be imported
+CSV_FIELDS = {
+    "plex_library_export": {
+        "fields": (
+            "Library Name", "Library Type", "Library Language", "title", "Resolution",
+            "originalTitle", "SeasonNames", "SeasonNumbers", "SeasonRatingKeys", "year",
+            "tvdbid", "imdbid", "tmdbid", "ratingKey", "Path", "RootFoldername",
+            "extraFolder", "MultipleVersions", "PlexPosterUrl", "PlexBackgroundUrl",
+            "PlexSeasonUrls", "Labels",
+        ),
+        "required": ("title", "ratingKey"),
+    },
+    "plex_episode_export": {
+        "fields": (
+            "Show Name", "Type", "tvdbid", "tmdbid", "Library Name", "Season Number",
+            "Episodes", "Title", "RatingKeys", "PlexTitleCardUrls", "Resolutions",
+        ),
+        "required": ("Show Name", "Season Number"),
+    },
+    "other_media_library_export": {
+        "fields": (
+            "Library Name", "Library Type", "Library Language", "Id", "title",
+            "originalTitle", "year", "Resolution", "imdbid", "tmdbid", "tvdbid", "Path",
+            "RootFoldername", "extraFolder", "OtherMediaServerPosterUrl",
+            "OtherMediaServerBackgroundUrl", "Labels",
+        ),
+        "required": ("title", "Id"),
+    },
+    "other_media_episode_export": {
+        "fields": (
+            "Show Name", "Type", "tvdbid", "tmdbid", "imdbid", "Library Name",
+            "Season Number", "Episodes", "Title", "RatingKeys",
+            "OtherMediaServerTitleCardUrls", "Resolutions",
+        ),
+        "required": ("Show Name", "Season Number"),
+    },
+}
+
+# Streaming import: records per transaction, and keys per current-version lookup
+# (stays below SQLite's default bound parameter limit of 999)
+IMPORT_CHUNK_SIZE = 2000
+IMPORT_LOOKUP_BATCH = 500
+
+
+def _export_table_ddl(table: str, name: Optional[str] = None) -> str:
+    """CREATE TABLE statement for an export table (name: create it under another name)"""
+    spec = EXPORT_TABLES[table]
+    columns = [
+        f"{column} TEXT NOT NULL"
+        if column in _NOT_NULL_COLUMNS and not (column == "title" and table.endswith("episode_export"))
+        else f"{column} TEXT"
+        for column in spec["columns"]
+    ]
+    return f"""
+        CREATE TABLE IF NOT EXISTS {name or table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            {", ".join(columns)},
+            valid_from INTEGER,
+            valid_to INTEGER,
+            row_hash TEXT,
+            created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+            updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+            UNIQUE({", ".join(spec["key"])}, valid_from)
+        )
+    """
+
+
+def _order_expressions(table: str) -> List[str]:
+    """
+    Sort expressions of a table. Nullable columns are wrapped in IFNULL so keyset
+    comparisons never see NULL; the current-run indexes use the same expressions.
+    """
+    return [
+        column if column in _NOT_NULL_COLUMNS and not (column == "title" and table.endswith("episode_export"))
+        else f"IFNULL({column}, '')"
+        for column in EXPORT_TABLES[table]["order"]
+    ]
+
+
+def encode_cursor(values: list) -> str:
+    """Opaque keyset pagination cursor (sort values + id of the last row of a page)"""
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """Decode a cursor from encode_cursor(); raises ValueError if it is malformed"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _row_hash(record: tuple) -> str:
+    """Content hash of an export record, ignoring its run_timestamp (first value)"""
+    return hashlib.sha1(
+        json.dumps(record[1:], ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
 
 class MediaExportDatabase:
     """Database handler for media server export data"""
@@ -34,13 +204,18 @@ class MediaExportDatabase:
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
         self.lock = threading.RLock()  # Thread-safety lock
+        # Per-table state of the running/last CSV import (see get_import_progress)
+        self.import_progress: Dict[str, Dict] = {}
+        # Incremented after every import; lets caches (library types) notice new data
+        self.data_version = 0
         self.init_database()
 
-    def _get_connection(self):
-        """Helper to create a new connection"""
-        conn = sqlite3.connect(self.db_path, timeout=10)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _get_connection(self, readonly: bool = False):
+        """
+        Get a pooled connection (WAL mode). Readers don't take self.lock;
+        conn.close() returns the connection to the pool.
+        """
+        return get_pool(self.db_path).connection(readonly=readonly)
 
     def init_database(self):
         """Initialize the database and create tables if they don't exist"""
@@ -56,151 +231,37 @@ class MediaExportDatabase:
                 conn = self._get_connection()
                 cursor = conn.cursor()
 
-                # Create plex_library_export table
-                logger.debug("Creating plex_library_export table if not exists...")
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS plex_library_export (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        run_timestamp TEXT NOT NULL,
-                        library_name TEXT,
-                        library_type TEXT,
-                        library_language TEXT,
-                        title TEXT NOT NULL,
-                        resolution TEXT,
-                        original_title TEXT,
-                        season_names TEXT,
-                        season_numbers TEXT,
-                        season_rating_keys TEXT,
-                        year TEXT,
-                        tvdbid TEXT,
-                        imdbid TEXT,
-                        tmdbid TEXT,
-                        rating_key TEXT UNIQUE,
-                        path TEXT,
-                        root_foldername TEXT,
-                        extra_folder TEXT,
-                        multiple_versions TEXT,
-                        plex_poster_url TEXT,
-                        plex_background_url TEXT,
-                        plex_season_urls TEXT,
-                        labels TEXT,
-                        created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                        updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
-                    )
-                """
-                )
+                for table in EXPORT_TABLES:
+                    logger.debug(f"Creating {table} table if not exists...")
+                    cursor.execute(_export_table_ddl(table))
 
-                # Create plex_episode_export table
-                logger.debug("Creating plex_episode_export table if not exists...")
                 cursor.execute(
                     """
-                    CREATE TABLE IF NOT EXISTS plex_episode_export (
+                    CREATE TABLE IF NOT EXISTS export_runs (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         run_timestamp TEXT NOT NULL,
-                        show_name TEXT NOT NULL,
-                        type TEXT,
-                        tvdbid TEXT,
-                        tmdbid TEXT,
-                        library_name TEXT,
-                        season_number TEXT,
-                        episodes TEXT,
-                        title TEXT,
-                        rating_keys TEXT,
-                        plex_titlecard_urls TEXT,
-                        resolutions TEXT,
+                        source TEXT NOT NULL,
                         created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                        updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                        UNIQUE(show_name, season_number)
+                        library_count INTEGER,
+                        episode_count INTEGER,
+                        total_episodes INTEGER,
+                        UNIQUE(source, run_timestamp)
                     )
                 """
                 )
 
-                # Create other_media_library_export table (Jellyfin/Emby)
-                logger.debug("Creating other_media_library_export table if not exists...")
+                # Latest run per source, moved forward by every import
                 cursor.execute(
                     """
-                    CREATE TABLE IF NOT EXISTS other_media_library_export (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    CREATE TABLE IF NOT EXISTS export_latest_run (
+                        source TEXT PRIMARY KEY,
+                        run_id INTEGER NOT NULL,
                         run_timestamp TEXT NOT NULL,
-                        library_name TEXT,
-                        library_type TEXT,
-                        library_language TEXT,
-                        media_id TEXT UNIQUE,
-                        title TEXT NOT NULL,
-                        original_title TEXT,
-                        year TEXT,
-                        resolution TEXT,
-                        imdbid TEXT,
-                        tmdbid TEXT,
-                        tvdbid TEXT,
-                        path TEXT,
-                        root_foldername TEXT,
-                        extra_folder TEXT,
-                        other_media_poster_url TEXT,
-                        other_media_background_url TEXT,
-                        labels TEXT,
-                        created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
                         updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
                     )
                 """
                 )
 
-                # Create other_media_episode_export table (Jellyfin/Emby)
-                logger.debug("Creating other_media_episode_export table if not exists...")
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS other_media_episode_export (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        run_timestamp TEXT NOT NULL,
-                        show_name TEXT NOT NULL,
-                        type TEXT,
-                        tvdbid TEXT,
-                        tmdbid TEXT,
-                        imdbid TEXT,
-                        library_name TEXT,
-                        season_number TEXT,
-                        episodes TEXT,
-                        title TEXT,
-                        rating_keys TEXT,
-                        other_media_titlecard_urls TEXT,
-                        resolutions TEXT,
-                        created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                        updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                        UNIQUE(show_name, season_number)
-                    )
-                """
-                )
-
-                # Create index for faster queries
-                logger.debug("Creating indexes...")
-                cursor.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_library_run ON plex_library_export(run_timestamp)"
-                )
-                cursor.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_library_tmdbid ON plex_library_export(tmdbid)"
-                )
-                cursor.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_other_library_run ON other_media_library_export(run_timestamp)"
-                )
-                cursor.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_other_library_tmdbid ON other_media_library_export(tmdbid)"
-                )
-                cursor.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_episode_run ON plex_episode_export(run_timestamp)"
-                )
-                cursor.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_episode_tmdbid ON plex_episode_export(tmdbid)"
-                )
-
-                # New Index for library name lookup
-                cursor.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_library_name ON plex_library_export(library_name)"
-                )
-                cursor.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_other_library_name ON other_media_library_export(library_name)"
-                )
-
                 conn.commit()
                 conn.close()
 
@@ -208,6 +269,9 @@ class MediaExportDatabase:
 
             # Run migration to remove duplicates from old schema
             self._migrate_remove_duplicates()
+            # Then convert one-row-per-item tables to run versions
+            self._migrate_run_versions()
+            self._migrate_latest_run()
 
             logger.info("=" * 60)
 
@@ -219,6 +283,590 @@ class MediaExportDatabase:
         """Close connection - No longer needed as connections are per-function."""
         pass
 
+    @staticmethod
+    def _create_indexes(cursor):
+        logger.debug("Creating indexes...")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_library_run ON plex_library_export(run_timestamp)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_library_tmdbid ON plex_library_export(tmdbid)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_other_library_run ON other_media_library_export(run_timestamp)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_other_library_tmdbid ON other_media_library_export(tmdbid)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_episode_run ON plex_episode_export(run_timestamp)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_episode_tmdbid ON plex_episode_export(tmdbid)"
+        )
+        # Library name lookups (latest type of a library); supersedes idx_*library_name
+        cursor.execute("DROP INDEX IF EXISTS idx_library_name")
+        cursor.execute("DROP INDEX IF EXISTS idx_other_library_name")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_library_name_run ON plex_library_export(library_name, run_timestamp)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_other_library_name_run ON other_media_library_export(library_name, run_timestamp)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_library_root_folder ON plex_library_export(root_foldername)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_other_library_root_folder ON other_media_library_export(root_foldername)"
+        )
+        # Current versions (valid_to IS NULL = latest run) in reader order, so latest-run
+        # pages are index range scans. Supersedes the plain valid_to indexes.
+        for table, prefix in (
+            ("plex_library_export", "library"),
+            ("plex_episode_export", "episode"),
+            ("other_media_library_export", "other_library"),
+            ("other_media_episode_export", "other_episode"),
+        ):
+            cursor.execute(f"DROP INDEX IF EXISTS idx_{prefix}_valid_to")
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{prefix}_current "
+                f"ON {table}(valid_to, {', '.join(_order_expressions(table))})"
+            )
+
+    def _migrate_run_versions(self):
+        """
+        Migration: rebuild export tables from one row per item (overwritten on every
+        run) to run versions. Each existing row becomes a version that starts at its
+        run and ends at the next run of its source (or stays current for the latest run).
+        """
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                legacy_tables = []
+                for table in EXPORT_TABLES:
+                    cursor.execute(f"PRAGMA table_info({table})")
+                    if "valid_from" not in {row["name"] for row in cursor.fetchall()}:
+                        legacy_tables.append(table)
+
+                if legacy_tables:
+                    logger.info("Running migration: Converting media export tables to run versions...")
+
+                    # Register existing runs in chronological order (ids increase with time)
+                    timestamps = set()
+                    for table in legacy_tables:
+                        cursor.execute(f"SELECT DISTINCT run_timestamp FROM {table}")  # nosec B608
+                        source = EXPORT_TABLES[table]["source"]
+                        timestamps.update((ts, source) for (ts,) in cursor.fetchall() if ts)
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO export_runs (run_timestamp, source) VALUES (?, ?)",
+                        sorted(timestamps),
+                    )
+
+                    for table in legacy_tables:
+                        spec = EXPORT_TABLES[table]
+                        columns = ", ".join(("id",) + spec["columns"] + ("created_at", "updated_at"))
+                        source_columns = ", ".join(
+                            f"t.{column}"
+                            for column in ("id",) + spec["columns"] + ("created_at", "updated_at")
+                        )
+                        cursor.execute(_export_table_ddl(table, f"{table}_versions"))
+                        cursor.execute(
+                            f"""
+                            INSERT INTO {table}_versions ({columns}, valid_from, valid_to)
+                            SELECT {source_columns}, r.id,
+                                   (SELECT MIN(n.id) FROM export_runs n
+                                    WHERE n.source = r.source AND n.id > r.id)
+                            FROM {table} t
+                            JOIN export_runs r ON r.source = ? AND r.run_timestamp = t.run_timestamp
+                        """,  # nosec B608
+                            (spec["source"],),
+                        )
+                        migrated = cursor.rowcount
+
+                        cursor.execute(
+                            f"SELECT id, {', '.join(spec['columns'])} FROM {table}_versions"  # nosec B608
+                        )
+                        cursor.executemany(
+                            f"UPDATE {table}_versions SET row_hash = ? WHERE id = ?",  # nosec B608
+                            [(_row_hash(tuple(row)[1:]), row[0]) for row in cursor.fetchall()],
+                        )
+
+                        cursor.execute(f"DROP TABLE {table}")
+                        cursor.execute(f"ALTER TABLE {table}_versions RENAME TO {table}")
+                        logger.info(f"  - {table}: {migrated} records migrated")
+
+                self._create_indexes(cursor)
+                conn.commit()
+                conn.close()
+                if legacy_tables:
+                    logger.info("✓ Run version migration complete")
+
+            except Exception as e:
+                logger.error(f"Error during run version migration: {e}")
+                logger.exception("Full traceback:")
+                if 'conn' in locals():
+                    try:
+                        conn.rollback()
+                        conn.close()
+                    except Exception as re:
+                        logger.error(f"Rollback failed: {re}")
+                # Don't raise - let the app continue with whatever schema exists
+
+    def _migrate_latest_run(self):
+        """
+        Migration: add the per-run item counts to export_runs and fill the
+        latest-run pointer from the stored runs
+        """
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                cursor.execute("PRAGMA table_info(export_runs)")
+                existing = {row["name"] for row in cursor.fetchall()}
+                for column in ("library_count", "episode_count", "total_episodes"):
+                    if column not in existing:
+                        cursor.execute(f"ALTER TABLE export_runs ADD COLUMN {column} INTEGER")
+
+                # SQLite returns the run_timestamp of the MAX(id) row
+                cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO export_latest_run (source, run_id, run_timestamp)
+                    SELECT source, MAX(id), run_timestamp FROM export_runs GROUP BY source
+                """
+                )
+                if cursor.rowcount > 0:
+                    logger.info(f"Latest-run pointer initialized for {cursor.rowcount} source(s)")
+
+                conn.commit()
+                conn.close()
+            except Exception as e:
+                logger.error(f"Error during latest run migration: {e}")
+                if 'conn' in locals():
+                    conn.rollback()
+                    conn.close()
+
+    @staticmethod
+    def _get_or_create_run(cursor, source: str, run_timestamp: str) -> int:
+        cursor.execute(
+            "INSERT OR IGNORE INTO export_runs (run_timestamp, source) VALUES (?, ?)",
+            (run_timestamp, source),
+        )
+        cursor.execute(
+            "SELECT id FROM export_runs WHERE source = ? AND run_timestamp = ?",
+            (source, run_timestamp),
+        )
+        return cursor.fetchone()[0]
+
+    def _store_run_versions(
+        self,
+        table: str,
+        run_timestamp: str,
+        records: Iterable[tuple],
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Record one import run of an export table. Only new or changed items get a new
+        version; versions of items missing from the run are closed.
+
+        Records are consumed as a stream: each chunk is compared against the current
+        versions of its own keys and written in its own transaction, so memory and
+        lock hold times stay bounded for large libraries. The latest-run pointer
+        moves only after the last chunk.
+
+        Args:
+            table: Export table name (key of EXPORT_TABLES)
+            run_timestamp: Run the records belong to
+            records: Tuples in EXPORT_TABLES[table]["columns"] order (any iterable)
+            chunk_size: Records per transaction
+            progress: Called with the running counts after every chunk
+
+        Returns:
+            Counts of rows, written, unchanged and removed items
+        """
+        spec = EXPORT_TABLES[table]
+        columns = spec["columns"]
+        key_columns = spec["key"]
+        key_positions = [columns.index(column) for column in key_columns]
+        counts = {"rows": 0, "written": 0, "unchanged": 0, "removed": 0}
+        # Current versions confirmed by this run (everything else is closed at the end)
+        seen_ids = set()
+
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                run_id = self._get_or_create_run(cursor, spec["source"], run_timestamp)
+                # Versions inserted by this import get higher ids (AUTOINCREMENT)
+                cursor.execute(f"SELECT IFNULL(MAX(id), 0) FROM {table}")  # nosec B608
+                last_id_before = cursor.fetchone()[0]
+                conn.commit()
+            finally:
+                conn.close()
+
+        records = iter(records)
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+            counts["rows"] += len(chunk)
+            # Last row wins for duplicate keys (as with the former INSERT OR REPLACE)
+            incoming = {tuple(record[i] for i in key_positions): record for record in chunk}
+            del chunk
+
+            with self.lock:
+                conn = self._get_connection()
+                try:
+                    cursor = conn.cursor()
+                    # Current versions of the chunk's items. The lookup goes through the
+                    # UNIQUE(key..., valid_from) index on the first key column; "+valid_to"
+                    # keeps the planner off the valid_to index (all current rows).
+                    current = {}
+                    first_values = list({key[0] for key in incoming})
+                    for i in range(0, len(first_values), IMPORT_LOOKUP_BATCH):
+                        batch = first_values[i:i + IMPORT_LOOKUP_BATCH]
+                        cursor.execute(
+                            f"""
+                            SELECT id, valid_from, row_hash, {", ".join(key_columns)}
+                            FROM {table}
+                            WHERE +valid_to IS NULL AND {key_columns[0]} IN ({", ".join("?" * len(batch))})
+                        """,  # nosec B608
+                            batch,
+                        )
+                        current.update((tuple(row)[3:], tuple(row)[:3]) for row in cursor.fetchall())
+
+                    to_insert = []
+                    to_close = []
+                    for key, record in incoming.items():
+                        row_hash = _row_hash(record)
+                        existing = current.get(key)
+                        if existing is not None:
+                            if existing[2] == row_hash:
+                                seen_ids.add(existing[0])
+                                continue
+                            to_close.append(existing)
+                            seen_ids.discard(existing[0])
+                        to_insert.append((*record, run_id, row_hash))
+
+                    self._close_versions(cursor, table, run_id, to_close)
+                    cursor.executemany(
+                        f"""
+                        INSERT INTO {table} ({", ".join(columns)}, valid_from, row_hash)
+                        VALUES ({", ".join("?" * (len(columns) + 2))})
+                    """,  # nosec B608
+                        to_insert,
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    conn.close()
+
+            counts["written"] += len(to_insert)
+            counts["unchanged"] += len(incoming) - len(to_insert)
+            if progress:
+                progress(dict(counts))
+
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                # Items that are not part of this run anymore
+                cursor.execute(
+                    f"SELECT id, valid_from FROM {table} WHERE valid_to IS NULL AND id <= ?",  # nosec B608
+                    (last_id_before,),
+                )
+                removed = [tuple(row) for row in cursor if row[0] not in seen_ids]
+                counts["removed"] = len(removed)
+                for i in range(0, len(removed), chunk_size):
+                    self._close_versions(cursor, table, run_id, removed[i:i + chunk_size])
+
+                # Materialize the run's item counts for the statistics
+                if table.endswith("episode_export"):
+                    cursor.execute(
+                        f"""
+                        SELECT COUNT(*), SUM(
+                            CASE
+                                WHEN episodes IS NOT NULL AND episodes != ''
+                                THEN LENGTH(episodes) - LENGTH(REPLACE(episodes, ',', '')) + 1
+                                ELSE 0
+                            END
+                        ) FROM {table} WHERE valid_to IS NULL
+                    """  # nosec B608
+                    )
+                    item_count, total_episodes = cursor.fetchone()
+                    cursor.execute(
+                        "UPDATE export_runs SET episode_count = ?, total_episodes = ? WHERE id = ?",
+                        (item_count, total_episodes or 0, run_id),
+                    )
+                else:
+                    cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE valid_to IS NULL")  # nosec B608
+                    cursor.execute(
+                        "UPDATE export_runs SET library_count = ? WHERE id = ?",
+                        (cursor.fetchone()[0], run_id),
+                    )
+                cursor.execute(
+                    """
+                    INSERT INTO export_latest_run (source, run_id, run_timestamp) VALUES (?, ?, ?)
+                    ON CONFLICT(source) DO UPDATE SET
+                        run_id = excluded.run_id,
+                        run_timestamp = excluded.run_timestamp,
+                        updated_at = (datetime('now', 'localtime'))
+                    WHERE excluded.run_id >= export_latest_run.run_id
+                """,
+                    (spec["source"], run_id, run_timestamp),
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+
+        self.data_version += 1
+        return counts
+
+    @staticmethod
+    def _close_versions(cursor, table: str, run_id: int, versions: List[tuple]):
+        """
+        Close (id, valid_from, ...) versions at run_id. A version created by this
+        same run (re-import) is deleted instead of closed.
+        """
+        cursor.executemany(
+            f"DELETE FROM {table} WHERE id = ?",  # nosec B608
+            [(version[0],) for version in versions if version[1] == run_id],
+        )
+        cursor.executemany(
+            f"""
+            UPDATE {table}
+            SET valid_to = ?, updated_at = (datetime('now', 'localtime'))
+            WHERE id = ?
+        """,  # nosec B608
+            [(run_id, version[0]) for version in versions if version[1] != run_id],
+        )
+
+    @staticmethod
+    def _get_latest_run(cursor, source: str) -> Optional[sqlite3.Row]:
+        """Latest run of source (run_id, run_timestamp) from the pointer table"""
+        cursor.execute(
+            "SELECT run_id, run_timestamp FROM export_latest_run WHERE source = ?",
+            (source,),
+        )
+        return cursor.fetchone()
+
+    def _run_condition(self, cursor, source: str, run_timestamp: Optional[str]) -> Optional[Tuple[str, list, str]]:
+        """
+        WHERE condition selecting the versions that were part of a run of source
+        (latest run if run_timestamp is None). Returns (sql, params, run_timestamp),
+        or None if the run doesn't exist.
+        """
+        latest = self._get_latest_run(cursor, source)
+        if latest is None:
+            return None
+        if not run_timestamp or run_timestamp == latest["run_timestamp"]:
+            return "valid_to IS NULL", [], latest["run_timestamp"]
+
+        cursor.execute(
+            "SELECT id FROM export_runs WHERE source = ? AND run_timestamp = ?",
+            (source, run_timestamp),
+        )
+        run = cursor.fetchone()
+        if run is None:
+            return None
+        return (
+            "valid_from <= ? AND (valid_to IS NULL OR valid_to > ?)",
+            [run["id"], run["id"]],
+            run_timestamp,
+        )
+
+    def _get_run_rows(
+        self,
+        table: str,
+        run_timestamp: Optional[str],
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        filters: Optional[Dict[str, str]] = None,
+    ) -> Tuple[List[Dict], Optional[str], Optional[str]]:
+        """
+        Rows of table as they were in a run (latest run by default), in reader order.
+
+        Args:
+            table: Export table name
+            run_timestamp: Run to read (default: latest)
+            limit: Page size (None: all rows)
+            after: Cursor of the previous page (keyset pagination)
+            filters: Column equality filters (LIBRARY_FILTER_COLUMNS)
+
+        Returns:
+            (rows, next_cursor, resolved run_timestamp); next_cursor is None on the last page
+        """
+        order = _order_expressions(table)
+        conn = self._get_connection(readonly=True)
+        try:
+            cursor = conn.cursor()
+            condition = self._run_condition(cursor, EXPORT_TABLES[table]["source"], run_timestamp)
+            if condition is None:
+                return [], None, None
+            where, params, resolved_timestamp = condition
+            where = [where]
+
+            for column, value in (filters or {}).items():
+                if column not in LIBRARY_FILTER_COLUMNS:
+                    raise ValueError(f"Unsupported filter: {column}")
+                where.append(f"{column} = ?")
+                params.append(value)
+
+            if after:
+                values = decode_cursor(after, len(order) + 1)
+                where.append(f"({', '.join(order)}, id) > ({', '.join('?' * len(values))})")
+                params.extend(values)
+
+            query = (
+                f"SELECT *, {', '.join(order)} FROM {table} "  # nosec B608
+                f"WHERE {' AND '.join(where)} ORDER BY {', '.join(order)}, id"
+            )
+            if limit:
+                # One extra row tells whether there is a next page
+                query += " LIMIT ?"
+                params.append(limit + 1)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+
+            next_cursor = None
+            if limit and len(rows) > limit:
+                rows = rows[:limit]
+                last = rows[-1]
+                next_cursor = encode_cursor([*tuple(last)[-len(order):], last["id"]])
+
+            results = []
+            for row in rows:
+                record = dict(zip(row.keys()[: -len(order)], tuple(row)[: -len(order)]))
+                # The stored run_timestamp is the run that first saw this version
+                record["run_timestamp"] = resolved_timestamp
+                results.append(record)
+            return results, next_cursor, resolved_timestamp
+        finally:
+            conn.close()
+
+    def get_export_page(
+        self,
+        table: str,
+        run_timestamp: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        filters: Optional[Dict[str, str]] = None,
+    ) -> Dict:
+        """
+        One page of an export table for the API (keyset pagination)
+
+        Returns:
+            {"data": [...], "next_cursor": str or None, "run_timestamp": resolved run}
+        """
+        data, next_cursor, resolved_timestamp = self._get_run_rows(
+            table, run_timestamp, limit, after, filters
+        )
+        return {"data": data, "next_cursor": next_cursor, "run_timestamp": resolved_timestamp}
+
+    def get_export_runs(self, source: str) -> List[Tuple[int, str]]:
+        """(id, run_timestamp) of all stored runs of source ("plex" or "other"), newest first"""
+        conn = self._get_connection(readonly=True)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, run_timestamp FROM export_runs WHERE source = ? ORDER BY id DESC",
+                (source,),
+            )
+            return [(row["id"], row["run_timestamp"]) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    def delete_export_runs(self, source: str, run_ids: List[int], batch_size: int = 5000) -> Dict[str, int]:
+        """
+        Delete runs of source and the item versions that belonged only to those runs.
+        Versions are removed in id ranges of batch_size, each range in its own
+        transaction, so imports can interleave with a large cleanup.
+
+        Returns:
+            Counts of deleted runs and versions
+        """
+        result = {"runs_deleted": 0, "versions_deleted": 0}
+        if not run_ids:
+            return result
+
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                # The current run can't be deleted: its versions are the valid_to IS NULL rows
+                cursor.execute("SELECT MAX(id) FROM export_runs WHERE source = ?", (source,))
+                latest_id = cursor.fetchone()[0]
+                run_ids = [run_id for run_id in run_ids if run_id != latest_id]
+                for i in range(0, len(run_ids), 500):
+                    chunk = run_ids[i:i + 500]
+                    cursor.execute(
+                        f"DELETE FROM export_runs WHERE source = ? AND id IN ({', '.join('?' * len(chunk))})",  # nosec B608
+                        [source, *chunk],
+                    )
+                    result["runs_deleted"] += cursor.rowcount
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+
+        if not result["runs_deleted"]:
+            return result
+
+        for table, spec in EXPORT_TABLES.items():
+            if spec["source"] != source:
+                continue
+            conn = self._get_connection(readonly=True)
+            try:
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT MIN(id), MAX(id) FROM {table} WHERE valid_to IS NOT NULL")  # nosec B608
+                first_id, last_id = cursor.fetchone()
+            finally:
+                conn.close()
+            if first_id is None:
+                continue
+
+            for start in range(first_id - 1, last_id, batch_size):
+                with self.lock:
+                    conn = self._get_connection()
+                    try:
+                        cursor = conn.cursor()
+                        # A closed version is orphaned once no remaining run lies in [valid_from, valid_to)
+                        cursor.execute(
+                            f"""
+                            DELETE FROM {table}
+                            WHERE id > ? AND id <= ? AND valid_to IS NOT NULL
+                              AND NOT EXISTS (
+                                  SELECT 1 FROM export_runs r
+                                  WHERE r.id >= {table}.valid_from AND r.id < {table}.valid_to
+                                    AND r.source = ?
+                              )
+                        """,  # nosec B608
+                            (start, start + batch_size, source),
+                        )
+                        result["versions_deleted"] += cursor.rowcount
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                    finally:
+                        conn.close()
+
+        logger.info(
+            f"Retention ({source}): deleted {result['runs_deleted']} runs, "
+            f"{result['versions_deleted']} item versions"
+        )
+        return result
+
     def _migrate_remove_duplicates(self):
         """
         Migration: Remove duplicate entries from old schema where UNIQUE was (run_timestamp, rating_key)
@@ -516,113 +1164,9 @@ class MediaExportDatabase:
         Returns:
             Number of records imported
         """
-        if not csv_path.exists():
-            logger.error(f"CSV file not found: {csv_path}")
-            return 0
-
-        if run_timestamp is None:
-            run_timestamp = datetime.now().isoformat()
-
-        logger.info(f"Importing PlexLibexport.csv: {csv_path}")
-        logger.debug(f"Run timestamp: {run_timestamp}")
-
-        records_to_insert = []
-        try:
-            with open(csv_path, "r", encoding="utf-8") as f:
-                # Detect delimiter (semicolon or comma)
-                sample = f.read(1024)
-                f.seek(0)
-                delimiter = ";" if ";" in sample else ","
-
-                reader = csv.DictReader(f, delimiter=delimiter)
-
-                for row in reader:
-                    try:
-                        # Remove quotes from values - handle both string and other types
-                        clean_row = {}
-                        for k, v in row.items():
-                            if isinstance(v, str):
-                                clean_row[k] = v.strip('"').strip()
-                            else:
-                                clean_row[k] = str(v).strip() if v is not None else ""
-
-                        # Skip empty rows (check critical fields)
-                        if not clean_row.get("title") and not clean_row.get(
-                            "ratingKey"
-                        ):
-                            logger.debug("Skipping empty row")
-                            continue
-
-                        records_to_insert.append((
-                            run_timestamp,
-                            clean_row.get("Library Name", ""),
-                            clean_row.get("Library Type", ""),
-                            clean_row.get("Library Language", ""),
-                            clean_row.get("title", ""),
-                            clean_row.get("Resolution", ""),
-                            clean_row.get("originalTitle", ""),
-                            clean_row.get("SeasonNames", ""),
-                            clean_row.get("SeasonNumbers", ""),
-                            clean_row.get("SeasonRatingKeys", ""),
-                            clean_row.get("year", ""),
-                            clean_row.get("tvdbid", ""),
-                            clean_row.get("imdbid", ""),
-                            clean_row.get("tmdbid", ""),
-                            clean_row.get("ratingKey", ""),
-                            clean_row.get("Path", ""),
-                            clean_row.get("RootFoldername", ""),
-                            clean_row.get("extraFolder", ""),
-                            clean_row.get("MultipleVersions", ""),
-                            clean_row.get("PlexPosterUrl", ""),
-                            clean_row.get("PlexBackgroundUrl", ""),
-                            clean_row.get("PlexSeasonUrls", ""),
-                            clean_row.get("Labels", ""),
-                        ))
-                    except Exception as e:
-                        logger.warning(f"Error importing row: {e}")
-                        continue
-
-            # Batch insert all records in one transaction
-            if records_to_insert:
-                with self.lock:
-                    conn = self._get_connection()
-                    cursor = conn.cursor()
-                    cursor.executemany(
-                        """
-                        INSERT OR REPLACE INTO plex_library_export (
-                            run_timestamp, library_name, library_type, library_language,
-                            title, resolution, original_title, season_names, season_numbers,
-                            season_rating_keys, year, tvdbid, imdbid, tmdbid, rating_key,
-                            path, root_foldername, extra_folder, multiple_versions,
-                            plex_poster_url, plex_background_url, plex_season_urls, labels,
-                            updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, (datetime('now', 'localtime')))
-                        """,
-                        records_to_insert
-                    )
-                    conn.commit()
-                    conn.close()
-
-                    imported_count = cursor.rowcount
-                    skipped_count = len(records_to_insert) - imported_count
-
-                    logger.info(
-                        f"✓ Imported {imported_count} library records (skipped {skipped_count} duplicates)"
-                    )
-                    return imported_count
-            else:
-                logger.warning("No valid records found in Plex library CSV.")
-                return 0
-
-        except Exception as e:
-            logger.error(f"Error importing library CSV: {e}", exc_info=True)
-            if 'conn' in locals():
-                try:
-                    conn.rollback()
-                    conn.close()
-                except Exception as re:
-                    logger.error(f"Rollback failed: {re}")
-            return 0 # Return 0 on failure
+        return self._import_export_csv(
+            "plex_library_export", csv_path, run_timestamp, "library records", "Plex library CSV"
+        )
 
     def import_episode_csv(
         self, csv_path: Path, run_timestamp: Optional[str] = None
@@ -637,100 +1181,9 @@ class MediaExportDatabase:
         Returns:
             Number of records imported
         """
-        if not csv_path.exists():
-            logger.error(f"CSV file not found: {csv_path}")
-            return 0
-
-        if run_timestamp is None:
-            run_timestamp = datetime.now().isoformat()
-
-        logger.info(f"Importing PlexEpisodeExport.csv: {csv_path}")
-        logger.debug(f"Run timestamp: {run_timestamp}")
-
-        records_to_insert = []
-        try:
-            with open(csv_path, "r", encoding="utf-8") as f:
-                # Detect delimiter (semicolon or comma)
-                sample = f.read(1024)
-                f.seek(0)
-                delimiter = ";" if ";" in sample else ","
-
-                reader = csv.DictReader(f, delimiter=delimiter)
-
-                for row in reader:
-                    try:
-                        # Remove quotes from values - handle both string and other types
-                        clean_row = {}
-                        for k, v in row.items():
-                            if isinstance(v, str):
-                                clean_row[k] = v.strip('"').strip()
-                            else:
-                                clean_row[k] = str(v).strip() if v is not None else ""
-
-                        # Skip empty rows (check critical fields)
-                        if not clean_row.get("Show Name") and not clean_row.get(
-                            "Season Number"
-                        ):
-                            logger.debug("Skipping empty row")
-                            continue
-
-                        records_to_insert.append((
-                            run_timestamp,
-                            clean_row.get("Show Name", ""),
-                            clean_row.get("Type", ""),
-                            clean_row.get("tvdbid", ""),
-                            clean_row.get("tmdbid", ""),
-                            clean_row.get("Library Name", ""),
-                            clean_row.get("Season Number", ""),
-                            clean_row.get("Episodes", ""),
-                            clean_row.get("Title", ""),
-                            clean_row.get("RatingKeys", ""),
-                            clean_row.get("PlexTitleCardUrls", ""),
-                            clean_row.get("Resolutions", ""),
-                        ))
-                    except Exception as e:
-                        logger.warning(f"Error importing row: {e}")
-                        continue
-
-            # Batch insert all records in one transaction
-            if records_to_insert:
-                with self.lock:
-                    conn = self._get_connection()
-                    cursor = conn.cursor()
-                    cursor.executemany(
-                        """
-                        INSERT OR REPLACE INTO plex_episode_export (
-                            run_timestamp, show_name, type, tvdbid, tmdbid,
-                            library_name, season_number, episodes, title,
-                            rating_keys, plex_titlecard_urls, resolutions,
-                            updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, (datetime('now', 'localtime')))
-                        """,
-                        records_to_insert,
-                    )
-                    conn.commit()
-                    conn.close()
-
-                    imported_count = cursor.rowcount
-                    skipped_count = len(records_to_insert) - imported_count
-
-                    logger.info(
-                        f"✓ Imported {imported_count} episode records (skipped {skipped_count} duplicates)"
-                    )
-                    return imported_count
-            else:
-                logger.warning("No valid records found in Plex episode CSV.")
-                return 0
-
-        except Exception as e:
-            logger.error(f"Error importing episode CSV: {e}", exc_info=True)
-            if 'conn' in locals():
-                try:
-                    conn.rollback()
-                    conn.close()
-                except Exception as re:
-                    logger.error(f"Rollback failed: {re}")
-            return 0 # Return 0 on failure
+        return self._import_export_csv(
+            "plex_episode_export", csv_path, run_timestamp, "episode records", "Plex episode CSV"
+        )
 
     def import_other_library_csv(
         self, csv_path: Path, run_timestamp: Optional[str] = None
@@ -745,105 +1198,9 @@ class MediaExportDatabase:
         Returns:
             Number of records imported
         """
-        if not csv_path.exists():
-            logger.error(f"CSV file not found: {csv_path}")
-            return 0
-
-        if run_timestamp is None:
-            run_timestamp = datetime.now().isoformat()
-
-        logger.info(f"Importing OtherMediaServerLibExport.csv: {csv_path}")
-        logger.debug(f"Run timestamp: {run_timestamp}")
-
-        records_to_insert = []
-        try:
-            with open(csv_path, "r", encoding="utf-8") as f:
-                # Detect delimiter (semicolon or comma)
-                sample = f.read(1024)
-                f.seek(0)
-                delimiter = ";" if ";" in sample else ","
-
-                reader = csv.DictReader(f, delimiter=delimiter)
-
-                for row in reader:
-                    try:
-                        # Remove quotes from values - handle both string and other types
-                        clean_row = {}
-                        for k, v in row.items():
-                            if isinstance(v, str):
-                                clean_row[k] = v.strip('"').strip()
-                            else:
-                                clean_row[k] = str(v).strip() if v is not None else ""
-
-                        # Skip empty rows (check critical fields)
-                        if not clean_row.get("title") and not clean_row.get("Id"):
-                            logger.debug("Skipping empty row")
-                            continue
-
-                        records_to_insert.append((
-                            run_timestamp,
-                            clean_row.get("Library Name", ""),
-                            clean_row.get("Library Type", ""),
-                            clean_row.get("Library Language", ""),
-                            clean_row.get("Id", ""),
-                            clean_row.get("title", ""),
-                            clean_row.get("originalTitle", ""),
-                            clean_row.get("year", ""),
-                            clean_row.get("Resolution", ""),
-                            clean_row.get("imdbid", ""),
-                            clean_row.get("tmdbid", ""),
-                            clean_row.get("tvdbid", ""),
-                            clean_row.get("Path", ""),
-                            clean_row.get("RootFoldername", ""),
-                            clean_row.get("extraFolder", ""),
-                            clean_row.get("OtherMediaServerPosterUrl", ""),
-                            clean_row.get("OtherMediaServerBackgroundUrl", ""),
-                            clean_row.get("Labels", ""),
-                        ))
-                    except Exception as e:
-                        logger.warning(f"Error importing row: {e}")
-                        continue
-
-            # Batch insert all records in one transaction
-            if records_to_insert:
-                with self.lock:
-                    conn = self._get_connection()
-                    cursor = conn.cursor()
-                    cursor.executemany(
-                        """
-                        INSERT OR REPLACE INTO other_media_library_export (
-                            run_timestamp, library_name, library_type, library_language,
-                            media_id, title, original_title, year, resolution,
-                            imdbid, tmdbid, tvdbid, path, root_foldername,
-                            extra_folder, other_media_poster_url, other_media_background_url, labels,
-                            updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, (datetime('now', 'localtime')))
-                        """,
-                        records_to_insert,
-                    )
-                    conn.commit()
-                    conn.close()
-
-                    imported_count = cursor.rowcount
-                    skipped_count = len(records_to_insert) - imported_count
-
-                    logger.info(
-                        f"✓ Imported {imported_count} OtherMedia library records (skipped {skipped_count} duplicates)"
-                    )
-                    return imported_count
-            else:
-                logger.warning("No valid records found in OtherMedia library CSV.")
-                return 0
-
-        except Exception as e:
-            logger.error(f"Error importing OtherMedia library CSV: {e}", exc_info=True)
-            if 'conn' in locals():
-                try:
-                    conn.rollback()
-                    conn.close()
-                except Exception as re:
-                    logger.error(f"Rollback failed: {re}")
-            return 0 # Return 0 on failure
+        return self._import_export_csv(
+            "other_media_library_export", csv_path, run_timestamp, "OtherMedia library records", "OtherMedia library CSV"
+        )
 
     def import_other_episode_csv(
         self, csv_path: Path, run_timestamp: Optional[str] = None
@@ -855,6 +1212,70 @@ class MediaExportDatabase:
             csv_path: Path to OtherMediaServerEpisodeExport.csv
             run_timestamp: Optional timestamp for this run (default: current time)
 
+        Returns:
+            Number of records imported
+        """
+        return self._import_export_csv(
+            "other_media_episode_export", csv_path, run_timestamp, "OtherMedia episode records", "OtherMedia episode CSV"
+        )
+
+    @staticmethod
+    def _iter_csv_records(
+        table: str, f, run_timestamp: str, read_chars: List[int]
+    ) -> Iterator[tuple]:
+        """
+        Yield export records from an open CSV file, one row at a time.
+        read_chars[0] is advanced by the characters consumed (for progress).
+        """
+        # Detect delimiter (semicolon or comma)
+        sample = f.read(1024)
+        f.seek(0)
+        delimiter = ";" if ";" in sample else ","
+
+        def lines():
+            for line in f:
+                read_chars[0] += len(line)
+                yield line
+
+        reader = csv.reader(lines(), delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        # Last column wins for duplicate headers (as with csv.DictReader)
+        positions = {name: i for i, name in enumerate(header)}
+        spec = CSV_FIELDS[table]
+        field_positions = [positions.get(field) for field in spec["fields"]]
+        required_positions = [
+            field_positions[spec["fields"].index(field)] for field in spec["required"]
+        ]
+
+        for row in reader:
+            size = len(row)
+            # Remove quotes from values; missing trailing fields are empty
+            values = tuple(
+                row[i].strip('"').strip() if i is not None and i < size else ""
+                for i in field_positions
+            )
+            # Skip empty rows (check critical fields)
+            if not any(
+                i is not None and i < size and row[i].strip('"').strip()
+                for i in required_positions
+            ):
+                continue
+            yield (run_timestamp, *values)
+
+    def _import_export_csv(
+        self,
+        table: str,
+        csv_path: Path,
+        run_timestamp: Optional[str],
+        label: str,
+        source_label: str,
+    ) -> int:
+        """
+        Stream an export CSV into table: rows are parsed lazily and stored in chunks
+        of IMPORT_CHUNK_SIZE (one transaction each), with progress in import_progress.
+
         Returns:
             Number of records imported
         """
@@ -865,95 +1286,72 @@ class MediaExportDatabase:
         if run_timestamp is None:
             run_timestamp = datetime.now().isoformat()
 
-        logger.info(f"Importing OtherMediaServerEpisodeExport.csv: {csv_path}")
+        logger.info(f"Importing {csv_path.name}: {csv_path}")
         logger.debug(f"Run timestamp: {run_timestamp}")
 
-        records_to_insert = []
-        try:
-            with open(csv_path, "r", encoding="utf-8") as f:
-                # Detect delimiter (semicolon or comma)
-                sample = f.read(1024)
-                f.seek(0)
-                delimiter = ";" if ";" in sample else ","
-
-                reader = csv.DictReader(f, delimiter=delimiter)
-
-                for row in reader:
-                    try:
-                        # Remove quotes from values - handle both string and other types
-                        clean_row = {}
-                        for k, v in row.items():
-                            if isinstance(v, str):
-                                clean_row[k] = v.strip('"').strip()
-                            else:
-                                clean_row[k] = str(v).strip() if v is not None else ""
-
-                        # Skip empty rows (check critical fields)
-                        if not clean_row.get("Show Name") and not clean_row.get(
-                            "Season Number"
-                        ):
-                            logger.debug("Skipping empty row")
-                            continue
-
-                        records_to_insert.append((
-                            run_timestamp,
-                            clean_row.get("Show Name", ""),
-                            clean_row.get("Type", ""),
-                            clean_row.get("tvdbid", ""),
-                            clean_row.get("tmdbid", ""),
-                            clean_row.get("imdbid", ""),
-                            clean_row.get("Library Name", ""),
-                            clean_row.get("Season Number", ""),
-                            clean_row.get("Episodes", ""),
-                            clean_row.get("Title", ""),
-                            clean_row.get("RatingKeys", ""),
-                            clean_row.get("OtherMediaServerTitleCardUrls", ""),
-                            clean_row.get("Resolutions", ""),
-                        ))
-                    except Exception as e:
-                        logger.warning(f"Error importing row: {e}")
-                        continue
-
-            # Batch insert all records in one transaction
-            if records_to_insert:
-                with self.lock:
-                    conn = self._get_connection()
-                    cursor = conn.cursor()
-                    cursor.executemany(
-                        """
-                        INSERT OR REPLACE INTO other_media_episode_export (
-                            run_timestamp, show_name, type, tvdbid, tmdbid, imdbid,
-                            library_name, season_number, episodes, title,
-                            rating_keys, other_media_titlecard_urls, resolutions,
-                            updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, (datetime('now', 'localtime')))
-                        """,
-                        records_to_insert,
-                    )
-                    conn.commit()
-                    conn.close()
+        total_chars = max(csv_path.stat().st_size, 1)
+        read_chars = [0]
+        started = time.monotonic()
+        state = {
+            "file": csv_path.name,
+            "run_timestamp": run_timestamp,
+            "rows": 0,
+            "written": 0,
+            "unchanged": 0,
+            "percent": 0.0,
+            "rows_per_second": 0.0,
+            "finished": False,
+        }
+        self.import_progress[table] = state
+
+        def report(counts: Dict[str, int]):
+            elapsed = max(time.monotonic() - started, 1e-6)
+            # Characters vs. bytes: close enough for a progress bar
+            state.update(
+                rows=counts["rows"],
+                written=counts["written"],
+                unchanged=counts["unchanged"],
+                percent=round(min(read_chars[0] / total_chars, 1.0) * 100, 1),
+                rows_per_second=round(counts["rows"] / elapsed, 1),
+            )
+            logger.debug(f"{csv_path.name}: {counts['rows']} rows ({state['percent']}%)")
 
-                    imported_count = cursor.rowcount
-                    skipped_count = len(records_to_insert) - imported_count
+        try:
+            with open(csv_path, "r", encoding="utf-8", newline="") as f:
+                records = self._iter_csv_records(table, f, run_timestamp, read_chars)
+                first = next(records, None)
+                if first is None:
+                    # An empty export must not close every item of the previous run
+                    state.update(percent=100.0, finished=True)
+                    logger.warning(f"No valid records found in {source_label}.")
+                    return 0
+
+                # Only new/changed items are written; versions of removed items are closed
+                stored = self._store_run_versions(
+                    table, run_timestamp, chain((first,), records), progress=report
+                )
 
-                    logger.info(
-                        f"✓ Imported {imported_count} OtherMedia episode records (skipped {skipped_count} duplicates)"
-                    )
-                    return imported_count
-            else:
-                logger.warning("No valid records found in OtherMedia episode CSV.")
-                return 0
+            state.update(percent=100.0, finished=True)
+            logger.info(
+                f"✓ Imported {stored['rows']} {label} "
+                f"({stored['written']} new/changed, {stored['unchanged']} unchanged, "
+                f"{stored['removed']} removed) in {time.monotonic() - started:.1f}s"
+            )
+            return stored["rows"]
 
         except Exception as e:
-            logger.error(f"Error importing OtherMedia episode CSV: {e}", exc_info=True)
-            if 'conn' in locals():
-                try:
-                    conn.rollback()
-                    conn.close()
-                except Exception as re:
-                    logger.error(f"Rollback failed: {re}")
+            state.update(finished=True, error=str(e))
+            logger.error(f"Error importing {source_label}: {e}", exc_info=True)
             return 0 # Return 0 on failure
 
+    def get_import_progress(self, source: Optional[str] = None) -> Dict[str, Dict]:
+        """Progress of the current/last CSV import per table (optionally of one source)"""
+        return {
+            table: dict(state)
+            for table, state in self.import_progress.items()
+            if source is None or EXPORT_TABLES[table]["source"] == source
+        }
+
     def import_latest_csvs(self) -> Dict[str, int]:
         """
         Import the latest Plex CSV files from the Logs directory
@@ -995,190 +1393,51 @@ class MediaExportDatabase:
 
         return results
 
-    def lookup_library_type_by_name(self, library_name: str) -> Optional[str]:
+    def get_library_types(self) -> Dict[str, str]:
         """
-        Lookup library type (movie/show) by library name
-
-        Args:
-            library_name: The library folder name (e.g., "TestMovies", "TestSerien")
-
-        Returns:
-            Library type string ("movie" or "show"), or None if not found
+        Latest library_type of every library name (Plex exports win over
+        Jellyfin/Emby exports for the same name)
         """
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-
-                # Try Plex library export first (latest run)
-                cursor.execute(
-                    """
-                    SELECT library_type
-                    FROM plex_library_export
-                    WHERE library_name = ?
-                    ORDER BY run_timestamp DESC
-                    LIMIT 1
-                    """,
-                    (library_name,),
-                )
-
-                result = cursor.fetchone()
-
-                if result:
-                    conn.close()
-                    return result["library_type"].lower() if result["library_type"] else None
-
-                # Try other media server export (Jellyfin/Emby) if Plex not found
+        types: Dict[str, str] = {}
+        conn = self._get_connection(readonly=True)
+        try:
+            cursor = conn.cursor()
+            for table in ("other_media_library_export", "plex_library_export"):
+                # Bare column with MAX(): library_type of the newest row (idx_*library_name_run)
                 cursor.execute(
-                    """
-                    SELECT library_type
-                    FROM other_media_library_export
-                    WHERE library_name = ?
-                    ORDER BY run_timestamp DESC
-                    LIMIT 1
-                    """,
-                    (library_name,),
+                    f"""
+                    SELECT library_name, library_type, MAX(run_timestamp)
+                    FROM {table}
+                    WHERE library_type IS NOT NULL AND library_type != ''
+                    GROUP BY library_name
+                """  # nosec B608
                 )
-
-                result = cursor.fetchone()
-                conn.close()
-
-                if result:
-                    return result["library_type"].lower() if result["library_type"] else None
-
-                return None
-
-            except Exception as e:
-                logger.error(f"Error looking up library type for {library_name}: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return None
+                types.update((row[0], row[1]) for row in cursor.fetchall() if row[0])
+            return types
+        finally:
+            conn.close()
 
     def get_all_runs(self) -> List[str]:
-        """Get list of all unique run timestamps from both library and episode tables"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    SELECT DISTINCT run_timestamp
-                    FROM (
-                        SELECT run_timestamp FROM plex_library_export
-                        UNION
-                        SELECT run_timestamp FROM plex_episode_export
-                    )
-                    ORDER BY run_timestamp DESC
-                    """
-                )
-
-                runs = [row["run_timestamp"] for row in cursor.fetchall()]
-                conn.close()
-
-                return runs
-
-            except Exception as e:
-                logger.error(f"Error getting runs: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
-
-    def get_library_data(
-        self, run_timestamp: Optional[str] = None, limit: Optional[int] = None
-    ) -> List[Dict]:
-        """
-        Get library export data
-
-        Args:
-            run_timestamp: Optional specific run to query (default: latest)
-            limit: Optional limit on number of results
-
-        Returns:
-            List of library records
-        """
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-
-                if run_timestamp:
-                    query = "SELECT * FROM plex_library_export WHERE run_timestamp = ? ORDER BY title"
-                    params = [run_timestamp]
-                else:
-                    # Get latest run
-                    query = """
-                        SELECT * FROM plex_library_export
-                        WHERE run_timestamp = (SELECT MAX(run_timestamp) FROM plex_library_export)
-                        ORDER BY title
-                    """
-                    params = []
-
-                if limit:
-                    query += " LIMIT ?"
-                    params.append(limit)
-
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
-
-                results = [dict(row) for row in rows]
-                conn.close()
-
-                return results
-
-            except Exception as e:
-                logger.error(f"Error getting library data: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
-
-    def get_episode_data(
-        self, run_timestamp: Optional[str] = None, limit: Optional[int] = None
-    ) -> List[Dict]:
-        """
-        Get episode export data
-
-        Args:
-            run_timestamp: Optional specific run to query (default: latest)
-            limit: Optional limit on number of results
-
-        Returns:
-            List of episode records
-        """
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
+        """Get list of all run timestamps (newest first)"""
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
 
-                if run_timestamp:
-                    query = "SELECT * FROM plex_episode_export WHERE run_timestamp = ? ORDER BY show_name, season_number"
-                    params = [run_timestamp]
-                else:
-                    # Get latest run
-                    query = """
-                        SELECT * FROM plex_episode_export
-                        WHERE run_timestamp = (SELECT MAX(run_timestamp) FROM plex_episode_export)
-                        ORDER BY show_name, season_number
-                    """
-                    params = []
+            cursor.execute(
+                "SELECT run_timestamp FROM export_runs WHERE source = ? ORDER BY id DESC",
+                ("plex",),
+            )
 
-                if limit:
-                    query += " LIMIT ?"
-                    params.append(limit)
+            runs = [row["run_timestamp"] for row in cursor.fetchall()]
+            conn.close()
 
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
+            return runs
 
-                results = [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error getting runs: {e}")
+            if 'conn' in locals():
                 conn.close()
-
-                return results
-
-            except Exception as e:
-                logger.error(f"Error getting episode data: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+            return []
 
     def import_other_latest_csvs(self) -> Dict[str, int]:
         """
@@ -1224,283 +1483,136 @@ class MediaExportDatabase:
         return results
 
     def get_other_all_runs(self) -> List[str]:
-        """Get list of all unique run timestamps from OtherMedia tables"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    SELECT DISTINCT run_timestamp
-                    FROM (
-                        SELECT run_timestamp FROM other_media_library_export
-                        UNION
-                        SELECT run_timestamp FROM other_media_episode_export
-                    )
-                    ORDER BY run_timestamp DESC
-                    """
-                )
-
-                runs = [row["run_timestamp"] for row in cursor.fetchall()]
-                conn.close()
-
-                return runs
-
-            except Exception as e:
-                logger.error(f"Error getting OtherMedia runs: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
-
-    def get_other_library_data(
-        self, run_timestamp: Optional[str] = None, limit: Optional[int] = None
-    ) -> List[Dict]:
-        """
-        Get OtherMedia library data for a specific run or all runs
-
-        Args:
-            run_timestamp: Optional specific run to query (default: latest)
-            limit: Optional limit on number of results
+        """Get list of all OtherMedia run timestamps (newest first)"""
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
 
-        Returns:
-            List of library records
-        """
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
+            cursor.execute(
+                "SELECT run_timestamp FROM export_runs WHERE source = ? ORDER BY id DESC",
+                ("other",),
+            )
 
-                if run_timestamp:
-                    query = """
-                        SELECT * FROM other_media_library_export
-                        WHERE run_timestamp = ?
-                        ORDER BY library_name, title
-                    """
-                    params = [run_timestamp]
-                else:
-                    query = "SELECT * FROM other_media_library_export ORDER BY run_timestamp DESC, library_name, title"
-                    params = []
+            runs = [row["run_timestamp"] for row in cursor.fetchall()]
+            conn.close()
 
-                if limit:
-                    query += " LIMIT ?"
-                    params.append(limit)
+            return runs
 
-                cursor.execute(query, params)
-                results = [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Error getting OtherMedia runs: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return results
-
-            except Exception as e:
-                logger.error(f"Error getting OtherMedia library data: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+            return []
 
-    def get_other_episode_data(
-        self, run_timestamp: Optional[str] = None, limit: Optional[int] = None
-    ) -> List[Dict]:
+    def _latest_run_stats(self, cursor, source: str) -> Dict:
         """
-        Get OtherMedia episode data for a specific run or all runs
-
-        Args:
-            run_timestamp: Optional specific run to query (default: latest)
-            limit: Optional limit on number of results
-
-        Returns:
-            List of episode records
+        Statistics of the latest run of source. Item counts are materialized in
+        export_runs at import time; runs imported before that are counted once.
         """
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-
-                if run_timestamp:
-                    query = """
-                        SELECT * FROM other_media_episode_export
-                        WHERE run_timestamp = ?
-                        ORDER BY show_name, season_number
-                    """
-                    params = [run_timestamp]
-                else:
-                    query = "SELECT * FROM other_media_episode_export ORDER BY run_timestamp DESC, show_name, season_number"
-                    params = []
-
-                if limit:
-                    query += " LIMIT ?"
-                    params.append(limit)
-
-                cursor.execute(query, params)
-                results = [dict(row) for row in cursor.fetchall()]
-                conn.close()
-                return results
+        latest = self._get_latest_run(cursor, source)
+        if latest is None:
+            return {"latest_run": None}
+
+        cursor.execute(
+            "SELECT library_count, episode_count, total_episodes FROM export_runs WHERE id = ?",
+            (latest["run_id"],),
+        )
+        counts = cursor.fetchone()
+        stats = {
+            "latest_run": latest["run_timestamp"],
+            "latest_run_library_count": counts["library_count"] if counts else None,
+            "latest_run_episode_count": counts["episode_count"] if counts else None,
+            "latest_run_total_episodes": counts["total_episodes"] if counts else None,
+        }
 
-            except Exception as e:
-                logger.error(f"Error getting OtherMedia episode data: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+        library_table, episode_table = (
+            table
+            for kind in ("library", "episode")
+            for table, spec in EXPORT_TABLES.items()
+            if spec["source"] == source and table.endswith(f"{kind}_export")
+        )
+        if stats["latest_run_library_count"] is None:
+            cursor.execute(f"SELECT COUNT(*) FROM {library_table} WHERE valid_to IS NULL")  # nosec B608
+            stats["latest_run_library_count"] = cursor.fetchone()[0]
+        if stats["latest_run_episode_count"] is None or stats["latest_run_total_episodes"] is None:
+            # Count actual episodes (sum of episode numbers in latest run)
+            cursor.execute(
+                f"""
+                SELECT COUNT(*), SUM(
+                    CASE
+                        WHEN episodes IS NOT NULL AND episodes != ''
+                        THEN LENGTH(episodes) - LENGTH(REPLACE(episodes, ',', '')) + 1
+                        ELSE 0
+                    END
+                ) FROM {episode_table} WHERE valid_to IS NULL
+                """  # nosec B608
+            )
+            count, total = cursor.fetchone()
+            stats["latest_run_episode_count"] = count
+            stats["latest_run_total_episodes"] = total if total else 0
+        return stats
 
     def get_other_statistics(self) -> Dict:
         """Get OtherMedia database statistics"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-
-                stats = {}
-
-                # Total runs (from both tables)
-                cursor.execute(
-                    """
-                    SELECT COUNT(DISTINCT run_timestamp) FROM (
-                        SELECT run_timestamp FROM other_media_library_export
-                        UNION
-                        SELECT run_timestamp FROM other_media_episode_export
-                    )
-                    """
-                )
-                stats["total_runs"] = cursor.fetchone()[0]
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
 
-                # Total library items
-                cursor.execute("SELECT COUNT(*) FROM other_media_library_export")
-                stats["total_library_records"] = cursor.fetchone()[0]
+            stats = {}
 
-                # Total episode records
-                cursor.execute("SELECT COUNT(*) FROM other_media_episode_export")
-                stats["total_episode_records"] = cursor.fetchone()[0]
+            cursor.execute(
+                "SELECT COUNT(*) FROM export_runs WHERE source = ?", ("other",)
+            )
+            stats["total_runs"] = cursor.fetchone()[0]
 
-                # Latest run timestamp (from both tables)
-                cursor.execute(
-                    """
-                    SELECT MAX(run_timestamp) FROM (
-                        SELECT run_timestamp FROM other_media_library_export
-                        UNION
-                        SELECT run_timestamp FROM other_media_episode_export
-                    )
-                    """
-                )
-                stats["latest_run"] = cursor.fetchone()[0]
+            # Stored item versions (unchanged items are shared between runs)
+            cursor.execute("SELECT COUNT(*) FROM other_media_library_export")
+            stats["total_library_records"] = cursor.fetchone()[0]
 
-                # Items in latest run
-                if stats["latest_run"]:
-                    cursor.execute(
-                        "SELECT COUNT(*) FROM other_media_library_export WHERE run_timestamp = ?",
-                        (stats["latest_run"],),
-                    )
-                    stats["latest_run_library_count"] = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM other_media_episode_export")
+            stats["total_episode_records"] = cursor.fetchone()[0]
 
-                    cursor.execute(
-                        "SELECT COUNT(*) FROM other_media_episode_export WHERE run_timestamp = ?",
-                        (stats["latest_run"],),
-                    )
-                    stats["latest_run_episode_count"] = cursor.fetchone()[0]
+            stats.update(self._latest_run_stats(cursor, "other"))
 
-                    # Count actual episodes (sum of episode numbers in latest run)
-                    cursor.execute(
-                        """
-                        SELECT SUM(
-                            CASE
-                                WHEN episodes IS NOT NULL AND episodes != ''
-                                THEN LENGTH(episodes) - LENGTH(REPLACE(episodes, ',', '')) + 1
-                                ELSE 0
-                            END
-                        ) FROM other_media_episode_export WHERE run_timestamp = ?
-                        """,
-                        (stats["latest_run"],),
-                    )
-                    result = cursor.fetchone()[0]
-                    stats["latest_run_total_episodes"] = result if result else 0
+            conn.close()
+            return stats
 
+        except Exception as e:
+            logger.error(f"Error getting OtherMedia statistics: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return stats
-
-            except Exception as e:
-                logger.error(f"Error getting OtherMedia statistics: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return {}
+            return {}
 
     def get_statistics(self) -> Dict:
         """Get database statistics"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
 
-                stats = {}
+            stats = {}
 
-                # Total runs (from both tables)
-                cursor.execute(
-                    """
-                    SELECT COUNT(DISTINCT run_timestamp) FROM (
-                        SELECT run_timestamp FROM plex_library_export
-                        UNION
-                        SELECT run_timestamp FROM plex_episode_export
-                    )
-                    """
-                )
-                stats["total_runs"] = cursor.fetchone()[0]
+            cursor.execute(
+                "SELECT COUNT(*) FROM export_runs WHERE source = ?", ("plex",)
+            )
+            stats["total_runs"] = cursor.fetchone()[0]
 
-                # Total library items
-                cursor.execute("SELECT COUNT(*) FROM plex_library_export")
-                stats["total_library_records"] = cursor.fetchone()[0]
+            # Stored item versions (unchanged items are shared between runs)
+            cursor.execute("SELECT COUNT(*) FROM plex_library_export")
+            stats["total_library_records"] = cursor.fetchone()[0]
 
-                # Total episode records
-                cursor.execute("SELECT COUNT(*) FROM plex_episode_export")
-                stats["total_episode_records"] = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM plex_episode_export")
+            stats["total_episode_records"] = cursor.fetchone()[0]
 
-                # Latest run timestamp (from both tables)
-                cursor.execute(
-                    """
-                    SELECT MAX(run_timestamp) FROM (
-                        SELECT run_timestamp FROM plex_library_export
-                        UNION
-                        SELECT run_timestamp FROM plex_episode_export
-                    )
-                    """
-                )
-                stats["latest_run"] = cursor.fetchone()[0]
+            stats.update(self._latest_run_stats(cursor, "plex"))
 
-                # Items in latest run
-                if stats["latest_run"]:
-                    cursor.execute(
-                        "SELECT COUNT(*) FROM plex_library_export WHERE run_timestamp = ?",
-                        (stats["latest_run"],),
-                    )
-                    stats["latest_run_library_count"] = cursor.fetchone()[0]
-
-                    cursor.execute(
-                        "SELECT COUNT(*) FROM plex_episode_export WHERE run_timestamp = ?",
-                        (stats["latest_run"],),
-                    )
-                    stats["latest_run_episode_count"] = cursor.fetchone()[0]
-
-                    # Count actual episodes (sum of episode numbers in latest run)
-                    cursor.execute(
-                        """
-                        SELECT SUM(
-                            CASE
-                                WHEN episodes IS NOT NULL AND episodes != ''
-                                THEN LENGTH(episodes) - LENGTH(REPLACE(episodes, ',', '')) + 1
-                                ELSE 0
-                            END
-                        ) FROM plex_episode_export WHERE run_timestamp = ?
-                        """,
-                        (stats["latest_run"],),
-                    )
-                    result = cursor.fetchone()[0]
-                    stats["latest_run_total_episodes"] = result if result else 0
+            conn.close()
+            return stats
 
+        except Exception as e:
+            logger.error(f"Error getting statistics: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return stats
-
-            except Exception as e:
-                logger.error(f"Error getting statistics: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return {}
-
+            return {}
 
 # Global database instance
 # This is created by main.py in the lifespan event
@@ -0,0 +1,171 @@
+"""
+Posterizarr Metrics Export Module
+Streams the run history (runtime_stats) and the asset history (imagechoices) as
+gzip-compressed NDJSON for offline analysis, reading both tables in keyset
+chunks so memory use does not grow with the history
+"""
+
+import json
+import logging
+import zlib
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_SIZE = 2000
+# Flush compressed output roughly every this many bytes of NDJSON
+FLUSH_BYTES = 256 * 1024
+# zlib wbits for a gzip container
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+# Exported columns per record type ("type" field of each line), the timestamp
+# column the since/until range applies to and how that column stores local time
+# (runtime_stats: isoformat with "T", imagechoices: SQLite datetime with a space)
+EXPORT_TABLES = {
+    "run": {
+        "table": "runtime_stats",
+        "time_column": "timestamp",
+        "time_format": datetime.isoformat,
+        "columns": (
+            "id", "timestamp", "mode", "status", "runtime_seconds", "total_images",
+            "posters", "seasons", "backgrounds", "titlecards", "collections",
+            "errors", "fallbacks", "textless", "truncated", "text", "tba_skipped",
+            "jap_chines_skipped", "images_cleared", "folders_cleared",
+            "script_version", "im_version", "start_time", "end_time",
+        ),
+    },
+    "asset": {
+        "table": "imagechoices",
+        "time_column": "created_at",
+        "time_format": lambda value: value.strftime("%Y-%m-%d %H:%M:%S"),
+        "columns": (
+            "id", "created_at", "updated_at", "Type", "LibraryName", "Language",
+            "Fallback", "TextTruncated", "DownloadSource", "Manual",
+        ),
+    },
+}
+
+
+def _existing_columns(conn, table: str, columns: Sequence[str]) -> List[str]:
+    """Export columns that exist in this database (older schemas lack some)"""
+    present = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    return [column for column in columns if column in present]
+
+
+def parse_bound(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a since/until ISO date/time (raises ValueError). Aware values are
+    converted to naive local time, the way both tables store timestamps.
+    """
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def iter_table_rows(
+    database,
+    record_type: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[Dict]:
+    """
+    Yield the rows of one export table in id order as dicts tagged with "type".
+
+    Every chunk is read on its own short-lived connection (id > last id LIMIT
+    chunk_size), so a slow client never holds a read snapshot open for the
+    whole export.
+    """
+    spec = EXPORT_TABLES[record_type]
+    conn = database._get_connection(readonly=True)
+    try:
+        columns = _existing_columns(conn, spec["table"], spec["columns"])
+    finally:
+        conn.close()
+
+    conditions = ["id > ?"]
+    params: List = []
+    # Bounds are formatted like the column so the string comparison (and its
+    # index) orders them correctly
+    if since:
+        conditions.append(f"{spec['time_column']} >= ?")
+        params.append(spec["time_format"](since))
+    if until:
+        conditions.append(f"{spec['time_column']} < ?")
+        params.append(spec["time_format"](until))
+    query = (
+        f"SELECT {', '.join(columns)} FROM {spec['table']} "
+        f"WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?"
+    )
+
+    last_id = 0
+    while True:
+        conn = database._get_connection(readonly=True)
+        try:
+            rows = conn.execute(query, (last_id, *params, chunk_size)).fetchall()
+        finally:
+            conn.close()
+        for row in rows:
+            record = {"type": record_type}
+            record.update(zip(columns, row))
+            yield record
+        if len(rows) < chunk_size:
+            return
+        last_id = rows[-1][0]
+
+
+def iter_ndjson_gz(
+    runtime_db=None,
+    imagechoices_db=None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Gzip-compressed NDJSON stream: a "meta" line with the exported columns,
+    then one "run" line per runtime_stats row and one "asset" line per
+    imagechoices row. Blocking; StreamingResponse runs it in a worker thread.
+    """
+    sources = []
+    if runtime_db is not None:
+        sources.append(("run", runtime_db))
+    if imagechoices_db is not None:
+        sources.append(("asset", imagechoices_db))
+
+    meta = {
+        "type": "meta",
+        "generated_at": datetime.now().isoformat(),
+        "since": since.isoformat() if since else None,
+        "until": until.isoformat() if until else None,
+        "records": {
+            record_type: list(EXPORT_TABLES[record_type]["columns"])
+            for record_type, _ in sources
+        },
+    }
+    compressor = zlib.compressobj(6, zlib.DEFLATED, GZIP_WBITS)
+    buffer: List[str] = [json.dumps(meta, separators=(",", ":"))]
+    buffered = len(buffer[0])
+    counts = dict.fromkeys((record_type for record_type, _ in sources), 0)
+
+    for record_type, database in sources:
+        for record in iter_table_rows(database, record_type, since, until, chunk_size):
+            line = json.dumps(record, separators=(",", ":"), default=str)
+            buffer.append(line)
+            buffered += len(line) + 1
+            counts[record_type] += 1
+            if buffered >= FLUSH_BYTES:
+                data = compressor.compress(("\n".join(buffer) + "\n").encode("utf-8"))
+                buffer, buffered = [], 0
+                if data:
+                    yield data
+
+    if buffer:
+        data = compressor.compress(("\n".join(buffer) + "\n").encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+    logger.info(f"Metrics export finished: {counts}")
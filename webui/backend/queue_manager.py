@@ -1,20 +1,76 @@
 import sqlite3
 import json
 import logging
+import time
 from pathlib import Path
 from datetime import datetime
-from threading import Lock
+from threading import RLock
+
+try:
+    from .db_pool import get_pool
+except ImportError:
+    from db_pool import get_pool
 
 logger = logging.getLogger("QueueManager")
 
+# Ids per IN (...) list (SQLite's default variable limit is 999)
+MAX_IN_PARAMS = 500
+# Completed items stay visible in the queue this long, then move to the archive
+ARCHIVE_COMPLETED_AFTER_HOURS = 24
+ARCHIVE_INTERVAL_SECONDS = 600
+ARCHIVE_MAX_ITEMS = 10000
+
+QUEUE_COLUMNS = (
+    "id, asset_path, source_type, source_data, overlay_params, status, "
+    "error_message, created_at, updated_at"
+)
+
+
+def _chunks(ids):
+    for start in range(0, len(ids), MAX_IN_PARAMS):
+        yield ids[start:start + MAX_IN_PARAMS]
+
+
+def _row_to_item(row):
+    item = dict(row)
+    if item['overlay_params']:
+        try:
+            item['overlay_params'] = json.loads(item['overlay_params'])
+        except json.JSONDecodeError:
+            item['overlay_params'] = {}
+    return item
+
+
 class QueueManager:
+    """
+    Asset replacement queue stored in queue.db.
+
+    All operations share one long-lived pooled connection (serialized by the
+    lock), so the SQL statements stay prepared in its statement cache. Pending
+    lookups use the (status, created_at) index and completed items are moved to
+    queue_items_archive after ARCHIVE_COMPLETED_AFTER_HOURS, so queue operations
+    stay proportional to the active items rather than to the whole history.
+    """
+
     def __init__(self, db_path: Path):
         self.db_path = db_path
-        self.lock = Lock()
+        self.lock = RLock()
+        self._conn = None
+        self._last_archive = 0.0
         self._init_db()
 
     def _get_connection(self):
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+        # Held for the lifetime of the manager; callers must hold self.lock
+        if self._conn is None:
+            self._conn = get_pool(self.db_path).connection(row_factory=sqlite3.Row)
+        return self._conn
+
+    def close(self):
+        """Give the persistent connection back to the pool (e.g. on shutdown)"""
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def _init_db(self):
         """Initialize the queue database table."""
@@ -23,115 +79,171 @@ class QueueManager:
 
         with self.lock:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS queue_items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    asset_path TEXT NOT NULL,
-                    source_type TEXT NOT NULL, -- 'url' or 'upload' (path to temp file)
-                    source_data TEXT NOT NULL, -- URL or Temp File Path
-                    overlay_params TEXT, -- JSON string of parameters
-                    status TEXT DEFAULT 'pending', -- pending, processing, completed, failed
-                    error_message TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS queue_items (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        asset_path TEXT NOT NULL,
+                        source_type TEXT NOT NULL, -- 'url' or 'upload' (path to temp file)
+                        source_data TEXT NOT NULL, -- URL or Temp File Path
+                        overlay_params TEXT, -- JSON string of parameters
+                        status TEXT DEFAULT 'pending', -- pending, processing, completed, failed
+                        error_message TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_queue_status_created ON queue_items(status, created_at)"
                 )
-            """)
-            conn.commit()
-            conn.close()
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS queue_items_archive (
+                        id INTEGER PRIMARY KEY,
+                        asset_path TEXT NOT NULL,
+                        source_type TEXT NOT NULL,
+                        source_data TEXT NOT NULL,
+                        overlay_params TEXT,
+                        status TEXT,
+                        error_message TEXT,
+                        created_at TIMESTAMP,
+                        updated_at TIMESTAMP,
+                        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+            self.archive_completed()
+            self.requeue_interrupted()
 
     def add_item(self, asset_path, source_type, source_data, overlay_params):
         """Add a new item to the queue."""
         with self.lock:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO queue_items (asset_path, source_type, source_data, overlay_params, status)
-                VALUES (?, ?, ?, ?, 'pending')
-            """, (asset_path, source_type, source_data, json.dumps(overlay_params)))
+            with conn:
+                cursor = conn.execute("""
+                    INSERT INTO queue_items (asset_path, source_type, source_data, overlay_params, status)
+                    VALUES (?, ?, ?, ?, 'pending')
+                """, (asset_path, source_type, source_data, json.dumps(overlay_params)))
             item_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
             logger.info(f"Queue item added: {item_id} ({asset_path})")
             return item_id
 
     def get_queue(self):
-        """Get all items in the queue."""
+        """Get all items in the queue (completed items until they are archived)."""
         with self.lock:
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM queue_items ORDER BY created_at ASC")
-            rows = cursor.fetchall()
-            conn.close()
-
-            queue = []
-            for row in rows:
-                item = dict(row)
-                if item['overlay_params']:
-                    try:
-                        item['overlay_params'] = json.loads(item['overlay_params'])
-                    except json.JSONDecodeError:
-                        item['overlay_params'] = {}
-                queue.append(item)
-            return queue
+            rows = self._get_connection().execute(
+                f"SELECT {QUEUE_COLUMNS} FROM queue_items ORDER BY created_at ASC, id ASC"
+            ).fetchall()
+        return [_row_to_item(row) for row in rows]
 
     def get_pending_items(self):
         """Get only pending items."""
         with self.lock:
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM queue_items WHERE status = 'pending' ORDER BY created_at ASC")
-            rows = cursor.fetchall()
-            conn.close()
-
-            items = []
-            for row in rows:
-                item = dict(row)
-                if item['overlay_params']:
-                    item['overlay_params'] = json.loads(item['overlay_params'])
-                items.append(item)
-            return items
+            rows = self._get_connection().execute(
+                f"SELECT {QUEUE_COLUMNS} FROM queue_items "
+                "WHERE status = 'pending' ORDER BY created_at ASC, id ASC"
+            ).fetchall()
+        return [_row_to_item(row) for row in rows]
 
     def update_status(self, item_id, status, error_message=None):
         """Update the status of an item."""
+        self.update_statuses([(item_id, status, error_message)])
+
+    def update_statuses(self, transitions):
+        """
+        Apply several status transitions in one transaction (bulk operations such
+        as requeue_interrupted; the queue processors write each item's status
+        with update_status as soon as it changes, so a cancelled run loses nothing).
+
+        Args:
+            transitions: (item_id, status, error_message) tuples
+        """
+        if not transitions:
+            return
+
         with self.lock:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE queue_items
-                SET status = ?, error_message = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (status, error_message, item_id))
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.executemany("""
+                    UPDATE queue_items
+                    SET status = ?, error_message = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, [(status, error_message, int(item_id)) for item_id, status, error_message in transitions])
 
-    def delete_item(self, item_id):
-        """Delete an item from the queue."""
+            if (
+                any(status == "completed" for _, status, _ in transitions)
+                and time.monotonic() - self._last_archive >= ARCHIVE_INTERVAL_SECONDS
+            ):
+                self.archive_completed()
+
+    def requeue_interrupted(self) -> int:
+        """
+        Put items left in 'processing' back to 'pending'. Called at startup: the
+        processor runs in this process, so such items were interrupted by a
+        restart or a cancelled task. Returns the number of requeued items.
+        """
+        with self.lock:
+            ids = [
+                row["id"]
+                for row in self._get_connection().execute(
+                    "SELECT id FROM queue_items WHERE status = 'processing'"
+                ).fetchall()
+            ]
+            self.update_statuses([(item_id, "pending", None) for item_id in ids])
+        if ids:
+            logger.info(f"Requeued {len(ids)} interrupted queue items")
+        return len(ids)
+
+    def archive_completed(self, older_than_hours: float = ARCHIVE_COMPLETED_AFTER_HOURS) -> int:
+        """
+        Move completed items older than older_than_hours to queue_items_archive
+        (keeping the newest ARCHIVE_MAX_ITEMS archived items). Returns the number
+        of archived items.
+        """
         with self.lock:
+            self._last_archive = time.monotonic()
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM queue_items WHERE id = ?", (int(item_id),))
-            conn.commit()
-            conn.close()
-            logger.info(f"Queue item deleted: {item_id}")
+            try:
+                with conn:
+                    cutoff = f"-{float(older_than_hours)} hours"
+                    cursor = conn.execute(f"""
+                        INSERT OR REPLACE INTO queue_items_archive ({QUEUE_COLUMNS})
+                        SELECT {QUEUE_COLUMNS} FROM queue_items
+                        WHERE status = 'completed' AND updated_at < datetime('now', ?)
+                    """, (cutoff,))
+                    archived = cursor.rowcount
+                    if archived:
+                        conn.execute("""
+                            DELETE FROM queue_items
+                            WHERE status = 'completed' AND updated_at < datetime('now', ?)
+                        """, (cutoff,))
+                        conn.execute("""
+                            DELETE FROM queue_items_archive
+                            WHERE id <= (
+                                SELECT id FROM queue_items_archive ORDER BY id DESC LIMIT 1 OFFSET ?
+                            )
+                        """, (ARCHIVE_MAX_ITEMS,))
+            except sqlite3.Error as e:
+                logger.error(f"Error archiving completed queue items: {e}")
+                return 0
+            if archived:
+                logger.info(f"Archived {archived} completed queue items")
+            return archived
 
+    def delete_item(self, item_id):
+        """Delete an item from the queue."""
+        self.delete_items([item_id])
 
     def delete_items(self, item_ids):
         """Delete multiple items from the queue."""
         if not item_ids: return
 
         clean_ids = [int(i) for i in item_ids]
-        placeholders = ','.join('?' for _ in clean_ids)
-        query = f"DELETE FROM queue_items WHERE id IN ({placeholders})"
 
         with self.lock:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, clean_ids) # nosec B608
-            conn.commit()
-            conn.close()
+            with conn:
+                for chunk in _chunks(clean_ids):
+                    placeholders = ','.join('?' for _ in chunk)
+                    conn.execute(f"DELETE FROM queue_items WHERE id IN ({placeholders})", chunk)  # nosec B608
             logger.info(f"Queue items deleted: {item_ids}")
 
     def get_items_by_ids(self, item_ids):
@@ -140,45 +252,33 @@ class QueueManager:
             return []
 
         try:
-            clean_ids = [int(i) for i in item_ids]
+            clean_ids = list(dict.fromkeys(int(i) for i in item_ids))
         except (ValueError, TypeError):
             logger.error(f"Invalid item_ids provided to get_items_by_ids: {item_ids}")
             return []
 
-        placeholders = ','.join('?' for _ in clean_ids)
-
-        query = f"SELECT * FROM queue_items WHERE id IN ({placeholders}) AND status = 'pending' ORDER BY created_at ASC"
-
-        with self.lock:
-            try:
+        rows = []
+        try:
+            with self.lock:
                 conn = self._get_connection()
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-
-                cursor.execute(query, clean_ids)  # nosec B608
-                rows = cursor.fetchall()
-                conn.close()
-
-                items = []
-                for row in rows:
-                    item = dict(row)
-                    if item['overlay_params']:
-                        try:
-                            item['overlay_params'] = json.loads(item['overlay_params'])
-                        except json.JSONDecodeError:
-                            item['overlay_params'] = {}
-                    items.append(item)
-                return items
-            except sqlite3.Error as e:
-                logger.error(f"Database error in get_items_by_ids: {e}")
-                return []
+                for chunk in _chunks(clean_ids):
+                    placeholders = ','.join('?' for _ in chunk)
+                    rows.extend(conn.execute(
+                        f"SELECT {QUEUE_COLUMNS} FROM queue_items "
+                        f"WHERE id IN ({placeholders}) AND status = 'pending'",  # nosec B608
+                        chunk,
+                    ).fetchall())
+        except sqlite3.Error as e:
+            logger.error(f"Database error in get_items_by_ids: {e}")
+            return []
+
+        rows.sort(key=lambda row: (row['created_at'] or "", row['id']))
+        return [_row_to_item(row) for row in rows]
 
     def clear_queue(self):
         """Delete all items from the queue."""
         with self.lock:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM queue_items")
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute("DELETE FROM queue_items")
             logger.info("Queue cleared")
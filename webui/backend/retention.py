@@ -0,0 +1,227 @@
+"""
+Posterizarr Retention Module
+Retention and compaction for the history databases: thins out media export runs
+(last N runs, then one run per day / per week), deletes old runtime entries in
+batches and gives the freed pages back to the filesystem with incremental vacuum
+"""
+
+import contextlib
+import logging
+import time
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from .db_pool import get_pool
+except ImportError:
+    from db_pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+EXPORT_SOURCES = ("plex", "other")
+
+# SQLite PRAGMA auto_vacuum values
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+@dataclass
+class RetentionPolicy:
+    """Retention settings ("retention" object in webui_settings.json)"""
+
+    enabled: bool = True
+    interval_hours: float = 24.0
+    # Media export runs: the newest keep_runs, plus the newest run of each day for
+    # keep_daily_days and of each ISO week for keep_weekly_weeks
+    keep_runs: int = 10
+    keep_daily_days: int = 30
+    keep_weekly_weeks: int = 26
+    # Runtime history entries older than this are deleted (0 = keep forever)
+    runtime_keep_days: int = 730
+    batch_size: int = 5000
+    # Allow the one-time full VACUUM that switches a database to incremental
+    # auto_vacuum on scheduled runs (it rewrites the whole file); otherwise it
+    # only runs when requested through /api/database/retention/run?vacuum=true
+    full_vacuum: bool = False
+
+    @classmethod
+    def from_settings(cls, settings: Optional[dict]) -> "RetentionPolicy":
+        values = (settings or {}).get("retention") or {}
+        known = {f.name for f in fields(cls)}
+        policy = cls()
+        for name, value in values.items():
+            if name not in known:
+                continue
+            try:
+                if isinstance(getattr(policy, name), bool):
+                    value = str(value).lower() in ("true", "1", "yes", "on")
+                setattr(policy, name, type(getattr(policy, name))(value))
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring invalid retention setting {name}={value!r}")
+        policy.keep_runs = max(policy.keep_runs, 1)  # the latest run is always kept
+        policy.batch_size = max(policy.batch_size, 100)
+        return policy
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _parse_run_time(run_timestamp: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(run_timestamp)
+    except (TypeError, ValueError):
+        return None
+
+
+def select_runs_to_keep(
+    runs: Iterable[Tuple[int, str]],
+    policy: RetentionPolicy,
+    now: Optional[datetime] = None,
+) -> Set[int]:
+    """
+    Pick the run ids to keep from (id, run_timestamp) pairs: the newest keep_runs,
+    then the newest run per day inside the daily window and per ISO week inside
+    the weekly window. Runs with unparsable timestamps are kept.
+    """
+    now = now or datetime.now()
+    ordered = sorted(runs, key=lambda run: run[0], reverse=True)
+    keep = {run_id for run_id, _ in ordered[: policy.keep_runs]}
+
+    daily_cutoff = now - timedelta(days=policy.keep_daily_days)
+    weekly_cutoff = now - timedelta(weeks=policy.keep_weekly_weeks)
+    seen_days = set()
+    seen_weeks = set()
+    for run_id, run_timestamp in ordered:
+        run_time = _parse_run_time(run_timestamp)
+        if run_time is None:
+            keep.add(run_id)
+            continue
+        if run_time.tzinfo is not None:
+            run_time = run_time.replace(tzinfo=None)
+        day = run_time.date()
+        week = day.isocalendar()[:2]
+        if run_time >= daily_cutoff and day not in seen_days:
+            keep.add(run_id)
+        if run_time >= weekly_cutoff and week not in seen_weeks:
+            keep.add(run_id)
+        seen_days.add(day)
+        seen_weeks.add(week)
+    return keep
+
+
+def _database_size(db_path: Path) -> int:
+    """Size of the main database file (the WAL is transient and not counted)"""
+    try:
+        return db_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def compact_database(db_path: Path, lock=None, full_vacuum: bool = False) -> Optional[int]:
+    """
+    Return free pages of a database to the filesystem and report the reclaimed
+    bytes of the main file. Files already in auto_vacuum=INCREMENTAL mode only
+    run incremental_vacuum. Switching a file to that mode needs one full VACUUM,
+    which only runs with full_vacuum=True; otherwise None is returned.
+
+    lock is the database's write lock; it is held for the whole compaction so
+    writers of this process wait for it instead of running into the busy timeout.
+    """
+    db_path = Path(db_path)
+    with lock if lock is not None else contextlib.nullcontext():
+        size_before = _database_size(db_path)
+        conn = get_pool(db_path).connection(row_factory=None)
+        try:
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if auto_vacuum != AUTO_VACUUM_INCREMENTAL:
+                if not full_vacuum:
+                    return None
+                logger.info(f"{db_path.name}: enabling incremental auto_vacuum (one-time VACUUM)")
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+            else:
+                free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if free_pages:
+                    # executescript steps the pragma to completion; execute() would
+                    # free a single page (it returns no rows to fetch)
+                    conn.executescript("PRAGMA incremental_vacuum;")
+            # Move the pages back from the WAL and truncate it
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        finally:
+            conn.close()
+        return max(size_before - _database_size(db_path), 0)
+
+
+def apply_retention(
+    media_export_db=None,
+    runtime_db=None,
+    policy: Optional[RetentionPolicy] = None,
+    now: Optional[datetime] = None,
+    full_vacuum: Optional[bool] = None,
+) -> Dict:
+    """
+    Apply the retention policy to the media export and runtime databases and
+    compact them. Blocking; call it through run_db() from async code.
+
+    Args:
+        full_vacuum: Allow the one-time VACUUM (see compact_database);
+            None uses policy.full_vacuum
+
+    Returns:
+        Report with deleted runs/versions/entries and reclaimed bytes per database
+        ("full_vacuum_pending" lists databases still waiting for their VACUUM)
+    """
+    policy = policy or RetentionPolicy()
+    if full_vacuum is None:
+        full_vacuum = policy.full_vacuum
+    start = time.monotonic()
+    report: Dict = {
+        "started_at": datetime.now().isoformat(),
+        "policy": policy.to_dict(),
+        "export": {},
+        "runtime": {},
+        "reclaimed_bytes": {},
+        "full_vacuum_pending": [],
+    }
+    compact: List[Tuple[Path, object]] = []
+
+    if media_export_db is not None:
+        for source in EXPORT_SOURCES:
+            runs = media_export_db.get_export_runs(source)
+            keep = select_runs_to_keep(runs, policy, now)
+            expired = [run_id for run_id, _ in runs if run_id not in keep]
+            result = media_export_db.delete_export_runs(source, expired, policy.batch_size)
+            result["runs_kept"] = len(runs) - len(expired)
+            report["export"][source] = result
+        compact.append((Path(media_export_db.db_path), getattr(media_export_db, "lock", None)))
+
+    if runtime_db is not None:
+        deleted = 0
+        if policy.runtime_keep_days > 0:
+            deleted = runtime_db.delete_old_entries(
+                days=policy.runtime_keep_days, batch_size=policy.batch_size
+            )
+        report["runtime"]["entries_deleted"] = deleted
+        compact.append((Path(runtime_db.db_path), getattr(runtime_db, "lock", None)))
+
+    for db_path, lock in compact:
+        try:
+            reclaimed = compact_database(db_path, lock, full_vacuum)
+            if reclaimed is None:
+                report["full_vacuum_pending"].append(db_path.name)
+                reclaimed = 0
+            report["reclaimed_bytes"][db_path.name] = reclaimed
+        except Exception as e:
+            logger.error(f"Error compacting {db_path.name}: {e}")
+            report["reclaimed_bytes"][db_path.name] = 0
+
+    report["total_reclaimed_bytes"] = sum(report["reclaimed_bytes"].values())
+    report["duration_seconds"] = round(time.monotonic() - start, 3)
+    logger.info(
+        f"Retention finished in {report['duration_seconds']}s: "
+        f"{sum(r.get('runs_deleted', 0) for r in report['export'].values())} export runs, "
+        f"{report['runtime'].get('entries_deleted', 0)} runtime entries deleted, "
+        f"{report['total_reclaimed_bytes']} bytes reclaimed"
+    )
+    return report
@@ -0,0 +1,268 @@
+"""
+Posterizarr Run Events Module
+Single-producer push channel (Server-Sent Events) for run status, live progress
+and scheduler changes, shared by all connected dashboards
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from .run_progress import LogTailer, RunProgressTracker
+except ImportError:
+    from run_progress import LogTailer, RunProgressTracker
+
+logger = logging.getLogger(__name__)
+
+# Keys of the run state whose change is reported as a "status" event
+STATUS_KEYS = (
+    "running",
+    "manual_running",
+    "scheduler_running",
+    "pid",
+    "current_mode",
+    "active_log",
+    "running_file_exists",
+    "start_time",
+)
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class RunEventBroadcaster:
+    """
+    Polls the run state once per interval (regardless of how many clients are
+    connected), tails the active log incrementally into a RunProgressTracker, and
+    fans out change events to every subscriber queue. Without start() the producer
+    only runs while clients are connected.
+    """
+
+    def __init__(
+        self,
+        state_provider: Callable[[], Dict],
+        log_resolver: Callable[[str], Path],
+        scheduler_provider: Optional[Callable[[], Optional[Dict]]] = None,
+        on_run_finished: Optional[Callable[[Dict, RunProgressTracker], None]] = None,
+        interval: float = 1.0,
+        idle_interval: float = 3.0,
+        scheduler_interval: float = 5.0,
+        keepalive_interval: float = 15.0,
+    ):
+        self.state_provider = state_provider
+        self.log_resolver = log_resolver
+        self.scheduler_provider = scheduler_provider
+        self.on_run_finished = on_run_finished
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.scheduler_interval = scheduler_interval
+        self.keepalive_interval = keepalive_interval
+
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.task: Optional[asyncio.Task] = None
+        # When started explicitly the producer keeps tracking runs without clients
+        self.always_on = False
+
+        self.tracker = RunProgressTracker()
+        self.tailer: Optional[LogTailer] = None
+
+        self.last_status: Optional[Dict] = None
+        self.last_progress: Optional[Dict] = None
+        self.last_scheduler: Optional[Dict] = None
+
+    # ------------------------------------------------------------------
+    # Subscription handling
+    # ------------------------------------------------------------------
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a new client and start the producer if needed"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+        # Send the current state right away so new clients don't wait for a change
+        for event, data in (
+            ("status", self.last_status),
+            ("progress", self.last_progress),
+            ("scheduler", self.last_scheduler),
+        ):
+            if data is not None:
+                queue.put_nowait((event, data))
+
+        self.subscribers.add(queue)
+        logger.debug(f"Run event subscriber added ({len(self.subscribers)} total)")
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+            logger.info("Run event producer started")
+        return queue
+
+    def start(self):
+        """
+        Keep the producer running even without clients, so live run metrics are
+        tracked (and persisted at the end of a run) whether or not a dashboard is open
+        """
+        self.always_on = True
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+            logger.info("Run event producer started (always on)")
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+        logger.debug(f"Run event subscriber removed ({len(self.subscribers)} left)")
+
+    async def stop(self):
+        """Stop the producer (used on shutdown)"""
+        self.always_on = False
+        if self.task and not self.task.done():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        self.task = None
+
+    def _publish(self, event: str, data: Dict):
+        for queue in list(self.subscribers):
+            if queue.full():
+                # Slow client - drop its oldest event rather than blocking the producer
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait((event, data))
+
+    # ------------------------------------------------------------------
+    # Producer
+    # ------------------------------------------------------------------
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        last_scheduler_check = 0.0
+        last_keepalive = loop.time()
+
+        try:
+            while self.subscribers or self.always_on:
+                now = loop.time()
+
+                # Scheduler state is only interesting to connected dashboards
+                check_scheduler = (
+                    bool(self.subscribers)
+                    and self.scheduler_provider is not None
+                    and now - last_scheduler_check >= self.scheduler_interval
+                )
+                if check_scheduler:
+                    last_scheduler_check = now
+
+                # Process polling and log reads are blocking - keep them off the loop,
+                # but publish from the loop since asyncio queues are not thread-safe
+                try:
+                    events = await asyncio.to_thread(self._collect_events, check_scheduler)
+                except Exception as e:
+                    logger.error(f"Error polling run state for events: {e}")
+                    events = []
+
+                for event, data in events:
+                    self._publish(event, data)
+
+                if now - last_keepalive >= self.keepalive_interval:
+                    last_keepalive = now
+                    self._publish("ping", {})
+
+                # Poll slower while nothing is running and nobody is listening
+                is_running = bool(self.last_status and self.last_status.get("running"))
+                if is_running or self.subscribers:
+                    await asyncio.sleep(self.interval)
+                else:
+                    await asyncio.sleep(self.idle_interval)
+        except asyncio.CancelledError:
+            raise
+        finally:
+            logger.info("Run event producer stopped")
+
+    def _collect_events(self, check_scheduler: bool) -> List[Tuple[str, Dict]]:
+        events: List[Tuple[str, Dict]] = []
+
+        state = self.state_provider()
+        status = {key: state.get(key) for key in STATUS_KEYS}
+
+        previous = self.last_status
+        was_running = bool(previous and previous.get("running"))
+        is_running = bool(status.get("running"))
+
+        # Start (or restart) progress tracking on a new run or log switch
+        if is_running and (
+            not was_running
+            or self.tailer is None
+            or previous.get("active_log") != status.get("active_log")
+        ):
+            log_path = self.log_resolver(status["active_log"])
+            # Ignore lines left in the log by the previous run. If the run was
+            # already going when we first looked, take the whole log.
+            not_before = None
+            if previous is not None and not was_running:
+                not_before = datetime.now() - timedelta(seconds=self.idle_interval + 5)
+            self.tracker.reset(status["active_log"], not_before=not_before)
+            self.tailer = LogTailer(log_path, from_start=True)
+
+        progress_changed = False
+        if self.tailer is not None:
+            progress_changed = self.tracker.feed(self.tailer.read_new_lines())
+
+        if not is_running and was_running:
+            # Run finished - keep the final counters but stop tailing
+            self.tailer = None
+            self.tracker.mark_finished()
+            if self.on_run_finished:
+                try:
+                    self.on_run_finished(previous, self.tracker)
+                except Exception as e:
+                    logger.error(f"Error handling finished run: {e}")
+
+        if status != previous:
+            self.last_status = status
+            events.append(("status", status))
+
+        if progress_changed or (is_running and self.last_progress is None):
+            progress = self.tracker.snapshot()
+            progress["running"] = is_running
+            progress["mode"] = status.get("current_mode")
+            self.last_progress = progress
+            events.append(("progress", progress))
+        elif was_running and not is_running and self.last_progress is not None:
+            self.last_progress = {**self.last_progress, "running": False}
+            events.append(("progress", self.last_progress))
+
+        if check_scheduler:
+            try:
+                scheduler_status = self.scheduler_provider()
+            except Exception as e:
+                logger.error(f"Error polling scheduler for events: {e}")
+                scheduler_status = None
+            if scheduler_status is not None and scheduler_status != self.last_scheduler:
+                self.last_scheduler = scheduler_status
+                events.append(("scheduler", scheduler_status))
+
+        return events
+
+    # ------------------------------------------------------------------
+    # SSE stream
+    # ------------------------------------------------------------------
+
+    async def stream(self, is_disconnected: Callable):
+        """Async generator yielding Server-Sent Events for one client"""
+        queue = self.subscribe()
+        try:
+            # Ask EventSource clients to reconnect after 3s if the stream drops
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    if await is_disconnected():
+                        break
+                    continue
+                yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+        finally:
+            self.unsubscribe(queue)
@@ -0,0 +1,356 @@
+"""
+Posterizarr Run Progress Module
+Incremental log tailing and live progress extraction for running Posterizarr scripts
+"""
+
+import logging
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from .log_sinks import read_rotated_remainder
+except ImportError:
+    from log_sinks import read_rotated_remainder
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single read so a huge backlog never lands in memory at once
+MAX_TAIL_READ_BYTES = 4 * 1024 * 1024
+
+# "[2025-11-25 16:34:18] [INFO]    |L.33500| ..." - leading timestamp of script log lines
+RE_LINE_TIMESTAMP = re.compile(r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]")
+# "Found '123' Items..." (one per library) - announces work to do
+RE_ITEMS_FOUND = re.compile(r"Found '(\d+)' Items")
+# One "Poster" line per processed title; the other asset types only update the current item
+RE_SEARCH_STARTED = re.compile(
+    r"(?:Start (Poster|Background|Season Poster|Title Card) Search|Found Manual (Poster)) for:\s*(.*?)\s*$"
+)
+# "Added: /assets/Movies/Alien (1979) {tmdb-348}/poster.jpg" - asset written for the current item
+RE_ASSET_ADDED = re.compile(r"\|\s*Added: ")
+RE_ASSET_UPLOADED = re.compile(r"\| (?:Poster|Background|Season Poster|TitleCard) successfully uploaded")
+# Fallback decisions logged while searching for artwork
+RE_FALLBACK = re.compile(
+    r"Took \S+ Fallback|Fallback to Show|as (?:TitleCard|Season) Fallback|with text as fallback|Took fallback image",
+    re.IGNORECASE,
+)
+# "--- Processing Library: Movies ---"
+RE_LIBRARY = re.compile(r"Processing Library:\s*(.*?)\s*-*\s*$")
+# Generic "N/M" progress counters (e.g. "Processing assets: 10/200")
+RE_PROGRESS_COUNTER = re.compile(r"([A-Za-z][\w ]*?):\s*(\d+)/(\d+)")
+RE_ERROR = re.compile(r"\[ERROR-HERE\]")
+
+# End-of-run summary lines (same values runtime_parser.parse_runtime_from_log extracts)
+RE_SUMMARY_RUNTIME = re.compile(r"Script execution time:.*?(\d+)h\s*(\d+)m\s*(\d+)s")
+RE_SUMMARY_TOTAL = re.compile(r"Total images (?:downloaded|created):\s*(\d+)")
+RE_SUMMARY_TYPES = re.compile(
+    r"Show/Movie Posters (?:created|downloaded):\s*(\d+).*?"
+    r"Season images (?:created|downloaded):\s*(\d+).*?"
+    r"Background images (?:created|downloaded):\s*(\d+).*?"
+    r"TitleCards (?:created|downloaded):\s*(\d+)"
+)
+RE_SUMMARY_ERRORS = re.compile(r"execution\s+'(\d+)'\s+Errors")
+RE_SUMMARY_FALLBACKS = re.compile(r"'(\d+)'\s+times the script took a fallback image")
+
+# Asset type of the "Start ... Search" line -> created counter
+SEARCH_TYPE_COUNTER = {
+    "Poster": "posters",
+    "Background": "backgrounds",
+    "Season Poster": "seasons",
+    "Title Card": "titlecards",
+}
+
+
+class LogTailer:
+    """
+    Reads only the bytes appended to a log file since the last call.
+    Handles truncation and size-based rotation (inode change).
+    """
+
+    def __init__(self, path: Path, from_start: bool = False):
+        self.path = path
+        self.position = 0
+        self.inode = None
+        if not from_start and path.exists():
+            stat = path.stat()
+            self.position = stat.st_size
+            self.inode = stat.st_ino
+
+    def read_new_lines(self) -> List[str]:
+        """Return complete lines appended since the last call"""
+        if not self.path.exists():
+            return []
+
+        stat = self.path.stat()
+        lines: List[str] = []
+
+        if self.inode is not None and stat.st_ino != self.inode:
+            lines.extend(read_rotated_remainder(self.path, self.position))
+            self.position = 0
+        elif stat.st_size < self.position:
+            self.position = 0
+        self.inode = stat.st_ino
+
+        if stat.st_size <= self.position:
+            return lines
+
+        with open(self.path, "rb") as f:
+            f.seek(self.position)
+            data = f.read(min(stat.st_size - self.position, MAX_TAIL_READ_BYTES))
+
+        # Only consume up to the last newline - a partial line is re-read next time
+        last_newline = data.rfind(b"\n")
+        if last_newline == -1:
+            return lines
+        self.position += last_newline + 1
+        lines.extend(
+            data[: last_newline + 1].decode("utf-8", errors="ignore").splitlines()
+        )
+        return lines
+
+
+class RunProgressTracker:
+    """
+    Maintains live counters for the current run from streamed log lines:
+    items found/processed, assets created per type, uploads, errors, fallbacks
+    and throughput. End-of-run summary lines are captured as well, so the final
+    runtime entry is available without re-reading the log.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self, log_file: Optional[str] = None, not_before: Optional[datetime] = None):
+        """
+        Start tracking a new run. Lines timestamped before `not_before`
+        (left over from the previous run) are ignored.
+        """
+        with self.lock:
+            self.log_file = log_file
+            self.not_before = not_before
+            self.started_at = datetime.now()
+            self.finished_at: Optional[datetime] = None
+            self.first_line_at: Optional[datetime] = None
+            self.last_line_at: Optional[datetime] = None
+            self._skipping = False
+            self._current_type: Optional[str] = None
+            self._last_stamp: Optional[str] = None
+            self._last_time: Optional[datetime] = None
+
+            self.items_total = 0
+            self.items_processed = 0
+            self.created = {"posters": 0, "seasons": 0, "backgrounds": 0, "titlecards": 0}
+            self.uploaded = 0
+            self.errors = 0
+            self.fallbacks = 0
+            self.current_library: Optional[str] = None
+            self.current_item: Optional[str] = None
+            self.counters: Dict[str, Dict[str, int]] = {}
+            self.summary: Dict = {}
+
+    def feed(self, lines: List[str]) -> bool:
+        """Update counters from new log lines. Returns True if anything changed."""
+        changed = False
+        with self.lock:
+            for line in lines:
+                if self._feed_line(line):
+                    changed = True
+        return changed
+
+    def mark_finished(self):
+        with self.lock:
+            self.finished_at = datetime.now()
+
+    def _feed_line(self, line: str) -> bool:
+        match = RE_LINE_TIMESTAMP.match(line)
+        if match:
+            line_time = self._parse_line_time(match.group(1))
+            if line_time:
+                # Continuation lines (no timestamp) follow the previous line's decision
+                self._skipping = bool(self.not_before and line_time < self.not_before)
+                if not self._skipping:
+                    if self.first_line_at is None:
+                        self.first_line_at = line_time
+                    self.last_line_at = line_time
+        if self._skipping:
+            return False
+
+        match = RE_SEARCH_STARTED.search(line)
+        if match:
+            search_type = match.group(1) or match.group(2)
+            self._current_type = SEARCH_TYPE_COUNTER.get(search_type)
+            if search_type == "Poster":
+                self.items_processed += 1
+            self.current_item = match.group(3)
+            return True
+
+        if RE_ASSET_ADDED.search(line):
+            if self._current_type:
+                self.created[self._current_type] += 1
+            return True
+
+        if RE_ASSET_UPLOADED.search(line):
+            self.uploaded += 1
+            return True
+
+        if RE_ERROR.search(line):
+            # The end-of-run summary ("During execution 'N' Errors occurred, ...
+            # where you see [ERROR-HERE].") names the marker too
+            if not self._feed_summary_line(line):
+                self.errors += 1
+            return True
+
+        if RE_FALLBACK.search(line):
+            self.fallbacks += 1
+            return True
+
+        match = RE_ITEMS_FOUND.search(line)
+        if match:
+            self.items_total += int(match.group(1))
+            return True
+
+        match = RE_LIBRARY.search(line)
+        if match:
+            self.current_library = match.group(1)
+            return True
+
+        if self._feed_summary_line(line):
+            return True
+
+        match = RE_PROGRESS_COUNTER.search(line)
+        if match:
+            label = match.group(1).strip()
+            self.counters[label] = {
+                "current": int(match.group(2)),
+                "total": int(match.group(3)),
+            }
+            return True
+
+        return False
+
+    def _parse_line_time(self, stamp: str) -> Optional[datetime]:
+        # Consecutive lines mostly share the same second - skip strptime for those
+        if stamp != self._last_stamp:
+            try:
+                self._last_time = datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S")
+            except ValueError:
+                self._last_time = None
+            self._last_stamp = stamp
+        return self._last_time
+
+    def _feed_summary_line(self, line: str) -> bool:
+        match = RE_SUMMARY_TYPES.search(line)
+        if match:
+            posters, seasons, backgrounds, titlecards = map(int, match.groups())
+            self.summary.update(
+                posters=posters,
+                seasons=seasons,
+                backgrounds=backgrounds,
+                titlecards=titlecards,
+            )
+            return True
+
+        match = RE_SUMMARY_TOTAL.search(line)
+        if match:
+            self.summary["total_images"] = int(match.group(1))
+            return True
+
+        match = RE_SUMMARY_RUNTIME.search(line)
+        if match:
+            hours, minutes, seconds = map(int, match.groups())
+            self.summary["runtime_seconds"] = hours * 3600 + minutes * 60 + seconds
+            self.summary["runtime_formatted"] = f"{hours}h {minutes}m {seconds}s"
+            return True
+
+        match = RE_SUMMARY_ERRORS.search(line)
+        if match:
+            self.summary["errors"] = int(match.group(1))
+            return True
+
+        match = RE_SUMMARY_FALLBACKS.search(line)
+        if match:
+            self.summary["fallbacks"] = int(match.group(1))
+            return True
+
+        return False
+
+    def _elapsed_seconds(self) -> float:
+        if self.first_line_at and self.last_line_at and self.last_line_at > self.first_line_at:
+            return (self.last_line_at - self.first_line_at).total_seconds()
+        end = self.finished_at or datetime.now()
+        return max((end - self.started_at).total_seconds(), 0.0)
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            percent = None
+            if self.items_total:
+                percent = round(min(self.items_processed / self.items_total, 1.0) * 100, 1)
+
+            elapsed = self._elapsed_seconds()
+            items_per_minute = (
+                round(self.items_processed / (elapsed / 60), 2) if elapsed >= 1 else None
+            )
+
+            return {
+                "log_file": self.log_file,
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "finished_at": (
+                    self.finished_at.isoformat(timespec="seconds")
+                    if self.finished_at
+                    else None
+                ),
+                "elapsed_seconds": int(elapsed),
+                "items_total": self.items_total,
+                "items_processed": self.items_processed,
+                "items_per_minute": items_per_minute,
+                "percent": percent,
+                "created": dict(self.created),
+                "total_created": sum(self.created.values()),
+                "uploaded": self.uploaded,
+                "errors": self.errors,
+                "fallbacks": self.fallbacks,
+                "current_library": self.current_library,
+                "current_item": self.current_item,
+                "counters": dict(self.counters),
+                "summary": dict(self.summary),
+            }
+
+    def to_runtime_entry(self, mode: str) -> Optional[Dict]:
+        """
+        Build a runtime_stats entry (same shape as runtime_parser.parse_runtime_from_log)
+        from the streamed counters. Returns None if the run never logged its summary.
+        """
+        with self.lock:
+            if "runtime_seconds" not in self.summary:
+                return None
+
+            posters = self.summary.get("posters", self.created["posters"])
+            seasons = self.summary.get("seasons", self.created["seasons"])
+            backgrounds = self.summary.get("backgrounds", self.created["backgrounds"])
+            titlecards = self.summary.get("titlecards", self.created["titlecards"])
+            total_images = self.summary.get("total_images") or (
+                posters + seasons + backgrounds + titlecards
+            )
+
+            return {
+                "mode": mode,
+                "runtime_seconds": self.summary["runtime_seconds"],
+                "runtime_formatted": self.summary["runtime_formatted"],
+                "total_images": total_images,
+                "posters": posters,
+                "seasons": seasons,
+                "backgrounds": backgrounds,
+                "titlecards": titlecards,
+                "errors": self.summary.get("errors", self.errors),
+                "fallbacks": self.summary.get("fallbacks", self.fallbacks),
+                "log_file": self.log_file,
+                "start_time": (self.first_line_at or self.started_at).isoformat(
+                    timespec="seconds"
+                ),
+                "end_time": (
+                    self.last_line_at or self.finished_at or datetime.now()
+                ).isoformat(timespec="seconds"),
+            }
@@ -2,7 +2,6 @@
 Database module for runtime statistics tracking
 """
 
-import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -11,6 +10,11 @@ import os
 import threading  # Import threading
 import re
 
+try:
+    from .db_pool import get_pool
+except ImportError:
+    from db_pool import get_pool
+
 logger = logging.getLogger(__name__)
 
 # Determine base directory based on environment
@@ -25,6 +29,40 @@ else:
 DATABASE_DIR = BASE_DIR / "database"
 DB_PATH = DATABASE_DIR / "runtime_stats.db"
 
+# Daily rollup of runtime_stats per (day, mode), kept in sync by triggers so the
+# summary sums a few rows per day instead of scanning every run
+ROLLUP_TABLE = "runtime_daily"
+# While this table has a row, deletes leave the rollup alone: history pruning
+# (delete_old_entries) keeps the aggregated days. The row is only written inside
+# the pruning transaction, so other connections never see it.
+ROLLUP_HOLD_TABLE = "runtime_daily_hold"
+ROLLUP_KEY = "substr({row}.timestamp, 1, 10), IFNULL({row}.mode, '')"
+ROLLUP_VALUES = (
+    "1, IFNULL({row}.total_images, 0), IFNULL({row}.errors, 0), "
+    "CASE WHEN {row}.runtime_seconds > 0 THEN {row}.runtime_seconds ELSE 0 END, "
+    "CASE WHEN {row}.runtime_seconds > 0 THEN 1 ELSE 0 END"
+)
+ROLLUP_ADD = f"""
+    INSERT INTO {ROLLUP_TABLE} (day, mode, runs, total_images, errors, runtime_seconds, timed_runs)
+    VALUES ({ROLLUP_KEY.format(row="new")}, {ROLLUP_VALUES.format(row="new")})
+    ON CONFLICT(day, mode) DO UPDATE SET
+        runs = runs + excluded.runs,
+        total_images = total_images + excluded.total_images,
+        errors = errors + excluded.errors,
+        runtime_seconds = runtime_seconds + excluded.runtime_seconds,
+        timed_runs = timed_runs + excluded.timed_runs;
+"""
+ROLLUP_REMOVE = f"""
+    UPDATE {ROLLUP_TABLE} SET
+        runs = runs - 1,
+        total_images = total_images - IFNULL(old.total_images, 0),
+        errors = errors - IFNULL(old.errors, 0),
+        runtime_seconds = runtime_seconds
+            - CASE WHEN old.runtime_seconds > 0 THEN old.runtime_seconds ELSE 0 END,
+        timed_runs = timed_runs - CASE WHEN old.runtime_seconds > 0 THEN 1 ELSE 0 END
+    WHERE day = substr(old.timestamp, 1, 10) AND mode = IFNULL(old.mode, '');
+"""
+
 
 class RuntimeDatabase:
     """Database handler for runtime statistics"""
@@ -35,11 +73,12 @@ class RuntimeDatabase:
         self.lock = threading.RLock()  # Thread-safety lock
         self.init_database()
 
-    def _get_connection(self):
-        """Helper to create a new, thread-safe connection"""
-        conn = sqlite3.connect(self.db_path, timeout=10)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _get_connection(self, readonly: bool = False):
+        """
+        Get a pooled connection (WAL mode). Readers don't take self.lock;
+        conn.close() returns the connection to the pool.
+        """
+        return get_pool(self.db_path).connection(readonly=readonly)
 
     def init_database(self):
         """Initialize the database and create tables if they don't exist"""
@@ -153,6 +192,8 @@ class RuntimeDatabase:
                 """
                 )
 
+                self._init_daily_rollup(cursor)
+
                 conn.commit()
                 conn.close()
                 logger.debug("Database initialization committed and connection closed")
@@ -180,27 +221,94 @@ class RuntimeDatabase:
             logger.exception("Full traceback:")
             raise
 
+    @staticmethod
+    def _init_daily_rollup(cursor):
+        """Create the runtime_daily rollup and its triggers, backfilled on first creation"""
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (ROLLUP_TABLE,)
+        )
+        exists = cursor.fetchone() is not None
+
+        cursor.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {ROLLUP_TABLE} (
+                day TEXT NOT NULL,
+                mode TEXT NOT NULL,
+                runs INTEGER NOT NULL DEFAULT 0,
+                total_images INTEGER NOT NULL DEFAULT 0,
+                errors INTEGER NOT NULL DEFAULT 0,
+                runtime_seconds INTEGER NOT NULL DEFAULT 0,
+                timed_runs INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, mode)
+            ) WITHOUT ROWID
+        """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS runtime_daily_ai AFTER INSERT ON runtime_stats BEGIN
+                {ROLLUP_ADD}
+            END
+        """
+        )
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {ROLLUP_HOLD_TABLE} (id INTEGER PRIMARY KEY)")
+        # Recreated so databases with the earlier trigger (without the hold check) get it
+        cursor.execute("DROP TRIGGER IF EXISTS runtime_daily_ad")
+        cursor.execute(
+            f"""
+            CREATE TRIGGER runtime_daily_ad AFTER DELETE ON runtime_stats
+            WHEN NOT EXISTS (SELECT 1 FROM {ROLLUP_HOLD_TABLE})
+            BEGIN
+                {ROLLUP_REMOVE}
+            END
+        """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS runtime_daily_au
+            AFTER UPDATE OF timestamp, mode, runtime_seconds, total_images, errors ON runtime_stats
+            BEGIN
+                {ROLLUP_REMOVE}
+                {ROLLUP_ADD}
+            END
+        """
+        )
+
+        if not exists:
+            cursor.execute(
+                f"""
+                INSERT INTO {ROLLUP_TABLE} (day, mode, runs, total_images, errors, runtime_seconds, timed_runs)
+                SELECT {ROLLUP_KEY.format(row="runtime_stats")},
+                    COUNT(*),
+                    SUM(IFNULL(total_images, 0)),
+                    SUM(IFNULL(errors, 0)),
+                    SUM(CASE WHEN runtime_seconds > 0 THEN runtime_seconds ELSE 0 END),
+                    SUM(CASE WHEN runtime_seconds > 0 THEN 1 ELSE 0 END)
+                FROM runtime_stats
+                GROUP BY 1, 2
+            """
+            )
+            logger.info(f"Built {ROLLUP_TABLE} rollup ({cursor.rowcount} day/mode rows)")
+
     def close(self):
         """Close connection - No longer needed."""
         pass
 
     def _is_migrated(self) -> bool:
         """Check if migration has already been performed"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT value FROM migration_info WHERE key = 'logs_migrated'"
-                )
-                result = cursor.fetchone()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT value FROM migration_info WHERE key = 'logs_migrated'"
+            )
+            result = cursor.fetchone()
+            conn.close()
+            return result is not None and result["value"] == "true"
+        except Exception as e:
+            logger.debug(f"Migration check failed: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return result is not None and result["value"] == "true"
-            except Exception as e:
-                logger.debug(f"Migration check failed: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return False
+            return False
 
     def _migrate_date_formats(self):
         """
@@ -573,202 +681,239 @@ class RuntimeDatabase:
 
     def get_latest_runtime(self) -> Optional[Dict]:
         """Get the most recent runtime entry"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT * FROM runtime_stats
-                    ORDER BY timestamp DESC
-                    LIMIT 1
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
                 """
-                )
-                row = cursor.fetchone()
+                SELECT * FROM runtime_stats
+                ORDER BY timestamp DESC
+                LIMIT 1
+            """
+            )
+            row = cursor.fetchone()
+            conn.close()
+            if row:
+                return dict(row)
+            return None
+        except Exception as e:
+            logger.error(f"Error getting latest runtime: {e}")
+            if 'conn' in locals():
                 conn.close()
-                if row:
-                    return dict(row)
-                return None
-            except Exception as e:
-                logger.error(f"Error getting latest runtime: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return None
+            return None
 
     def get_runtime_history(
         self, limit: int = 50, offset: int = 0, mode: str = None
     ) -> List[Dict]:
         """Get runtime history with pagination"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                if mode:
-                    cursor.execute(
-                        """
-                        SELECT * FROM runtime_stats
-                        WHERE mode = ?
-                        ORDER BY timestamp DESC
-                        LIMIT ? OFFSET ?
-                    """,
-                        (mode, limit, offset),
-                    )
-                else:
-                    cursor.execute(
-                        """
-                        SELECT * FROM runtime_stats
-                        ORDER BY timestamp DESC
-                        LIMIT ? OFFSET ?
-                    """,
-                        (limit, offset),
-                    )
-                rows = cursor.fetchall()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            if mode:
+                cursor.execute(
+                    """
+                    SELECT * FROM runtime_stats
+                    WHERE mode = ?
+                    ORDER BY timestamp DESC
+                    LIMIT ? OFFSET ?
+                """,
+                    (mode, limit, offset),
+                )
+            else:
+                cursor.execute(
+                    """
+                    SELECT * FROM runtime_stats
+                    ORDER BY timestamp DESC
+                    LIMIT ? OFFSET ?
+                """,
+                    (limit, offset),
+                )
+            rows = cursor.fetchall()
+            conn.close()
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error getting runtime history: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return [dict(row) for row in rows]
-            except Exception as e:
-                logger.error(f"Error getting runtime history: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return []
+            return []
 
     def get_runtime_history_total_count(self, mode: str = None) -> int:
         """Get total count of runtime history entries"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                if mode:
-                    cursor.execute(
-                        """
-                        SELECT COUNT(*) FROM runtime_stats
-                        WHERE mode = ?
-                    """,
-                        (mode,),
-                    )
-                else:
-                    cursor.execute(
-                        """
-                        SELECT COUNT(*) FROM runtime_stats
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            if mode:
+                cursor.execute(
                     """
-                    )
-                total = cursor.fetchone()[0]
+                    SELECT COUNT(*) FROM runtime_stats
+                    WHERE mode = ?
+                """,
+                    (mode,),
+                )
+            else:
+                cursor.execute(
+                    """
+                    SELECT COUNT(*) FROM runtime_stats
+                """
+                )
+            total = cursor.fetchone()[0]
+            conn.close()
+            return total
+        except Exception as e:
+            logger.error(f"Error getting runtime history total count: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return total
-            except Exception as e:
-                logger.error(f"Error getting runtime history total count: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return 0
+            return 0
 
     def get_runtime_stats_summary(self, days: int = 30) -> Dict:
         """Get summary statistics for the last N days"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-
-                cutoff_date = datetime.now().replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                ) - timedelta(days=days - 1)
-                cutoff_str = cutoff_date.isoformat()
-
-                cursor.execute("SELECT COUNT(*) FROM runtime_stats WHERE timestamp >= ?", (cutoff_str,))
-                total_runs = cursor.fetchone()[0]
-
-                cursor.execute("SELECT SUM(total_images) FROM runtime_stats WHERE timestamp >= ?", (cutoff_str,))
-                total_images = cursor.fetchone()[0] or 0
-
-                cursor.execute("SELECT AVG(runtime_seconds) FROM runtime_stats WHERE timestamp >= ? AND runtime_seconds > 0", (cutoff_str,))
-                avg_runtime = cursor.fetchone()[0] or 0
-
-                cursor.execute("SELECT SUM(errors) FROM runtime_stats WHERE timestamp >= ?", (cutoff_str,))
-                total_errors = cursor.fetchone()[0] or 0
-
-                cursor.execute("SELECT mode, COUNT(*) as count FROM runtime_stats WHERE timestamp >= ? GROUP BY mode", (cutoff_str,))
-                mode_counts = {row["mode"]: row["count"] for row in cursor.fetchall()}
-
-                cursor.execute("SELECT * FROM runtime_stats ORDER BY timestamp DESC LIMIT 1")
-                latest_row = cursor.fetchone()
-                latest_run = None
-                if latest_row:
-                    latest_run_dict = dict(latest_row)
-                    latest_run = {
-                        "total_images": latest_run_dict.get("total_images", 0),
-                        "posters": latest_run_dict.get("posters", 0),
-                        "seasons": latest_run_dict.get("seasons", 0),
-                        "backgrounds": latest_run_dict.get("backgrounds", 0),
-                        "titlecards": latest_run_dict.get("titlecards", 0),
-                        "collections": latest_run_dict.get("collections", 0),
-                        "errors": latest_run_dict.get("errors", 0),
-                        "fallbacks": latest_run_dict.get("fallbacks", 0),
-                        "textless": latest_run_dict.get("textless", 0),
-                        "truncated": latest_run_dict.get("truncated", 0),
-                        "text": latest_run_dict.get("text", 0),
-                        "tba_skipped": latest_run_dict.get("tba_skipped", 0),
-                        "jap_chines_skipped": latest_run_dict.get("jap_chines_skipped", 0),
-                        "notification_sent": bool(latest_run_dict.get("notification_sent", 0)),
-                        "uptime_kuma": bool(latest_run_dict.get("uptime_kuma", 0)),
-                        "images_cleared": latest_run_dict.get("images_cleared", 0),
-                        "folders_cleared": latest_run_dict.get("folders_cleared", 0),
-                        "space_saved": latest_run_dict.get("space_saved"),
-                        "script_version": latest_run_dict.get("script_version"),
-                        "im_version": latest_run_dict.get("im_version"),
-                        "start_time": latest_run_dict.get("start_time"),
-                        "end_time": latest_run_dict.get("end_time"),
-                        "runtime_formatted": latest_run_dict.get("runtime_formatted"),
-                        "mode": latest_run_dict.get("mode"),
-                    }
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
 
-                conn.close()
+            cutoff_date = datetime.now().replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) - timedelta(days=days - 1)
 
-                summary = {
-                    "total_runs": total_runs,
-                    "total_images": total_images,
-                    "average_runtime_seconds": int(avg_runtime),
-                    "average_runtime_formatted": self._format_seconds(int(avg_runtime)),
-                    "total_errors": total_errors,
-                    "mode_counts": mode_counts,
-                    "days": days,
-                }
-                if latest_run:
-                    summary["latest_run"] = latest_run
-                return summary
-            except Exception as e:
-                logger.error(f"Error getting runtime summary: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return {
-                    "total_runs": 0, "total_images": 0, "average_runtime_seconds": 0,
-                    "average_runtime_formatted": "0h 0m 0s", "total_errors": 0,
-                    "mode_counts": {}, "days": days,
+            # One row per day and mode from the rollup instead of scanning runtime_stats
+            cursor.execute(
+                f"""
+                SELECT mode, SUM(runs) AS runs, SUM(total_images) AS total_images,
+                    SUM(errors) AS errors, SUM(runtime_seconds) AS runtime_seconds,
+                    SUM(timed_runs) AS timed_runs
+                FROM {ROLLUP_TABLE}
+                WHERE day >= ?
+                GROUP BY mode
+                HAVING SUM(runs) > 0
+            """,
+                (cutoff_date.date().isoformat(),),
+            )
+            total_runs = total_images = total_errors = runtime_seconds = timed_runs = 0
+            mode_counts = {}
+            for row in cursor.fetchall():
+                mode_counts[row["mode"] or None] = row["runs"]
+                total_runs += row["runs"]
+                total_images += row["total_images"]
+                total_errors += row["errors"]
+                runtime_seconds += row["runtime_seconds"]
+                timed_runs += row["timed_runs"]
+            avg_runtime = runtime_seconds / timed_runs if timed_runs else 0
+
+            cursor.execute("SELECT * FROM runtime_stats ORDER BY timestamp DESC LIMIT 1")
+            latest_row = cursor.fetchone()
+            latest_run = None
+            if latest_row:
+                latest_run_dict = dict(latest_row)
+                latest_run = {
+                    "total_images": latest_run_dict.get("total_images", 0),
+                    "posters": latest_run_dict.get("posters", 0),
+                    "seasons": latest_run_dict.get("seasons", 0),
+                    "backgrounds": latest_run_dict.get("backgrounds", 0),
+                    "titlecards": latest_run_dict.get("titlecards", 0),
+                    "collections": latest_run_dict.get("collections", 0),
+                    "errors": latest_run_dict.get("errors", 0),
+                    "fallbacks": latest_run_dict.get("fallbacks", 0),
+                    "textless": latest_run_dict.get("textless", 0),
+                    "truncated": latest_run_dict.get("truncated", 0),
+                    "text": latest_run_dict.get("text", 0),
+                    "tba_skipped": latest_run_dict.get("tba_skipped", 0),
+                    "jap_chines_skipped": latest_run_dict.get("jap_chines_skipped", 0),
+                    "notification_sent": bool(latest_run_dict.get("notification_sent", 0)),
+                    "uptime_kuma": bool(latest_run_dict.get("uptime_kuma", 0)),
+                    "images_cleared": latest_run_dict.get("images_cleared", 0),
+                    "folders_cleared": latest_run_dict.get("folders_cleared", 0),
+                    "space_saved": latest_run_dict.get("space_saved"),
+                    "script_version": latest_run_dict.get("script_version"),
+                    "im_version": latest_run_dict.get("im_version"),
+                    "start_time": latest_run_dict.get("start_time"),
+                    "end_time": latest_run_dict.get("end_time"),
+                    "runtime_formatted": latest_run_dict.get("runtime_formatted"),
+                    "mode": latest_run_dict.get("mode"),
                 }
 
-    def delete_old_entries(self, days: int = 90) -> int:
-        """Delete entries older than specified days"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cutoff_date = datetime.now() - timedelta(days=days)
-                cutoff_str = cutoff_date.isoformat()
-                cursor.execute(
-                    """
-                    DELETE FROM runtime_stats
-                    WHERE timestamp < ?
-                """,
-                    (cutoff_str,),
-                )
-                deleted_count = cursor.rowcount
-                conn.commit()
+            conn.close()
+
+            summary = {
+                "total_runs": total_runs,
+                "total_images": total_images,
+                "average_runtime_seconds": int(avg_runtime),
+                "average_runtime_formatted": self._format_seconds(int(avg_runtime)),
+                "total_errors": total_errors,
+                "mode_counts": mode_counts,
+                "days": days,
+            }
+            if latest_run:
+                summary["latest_run"] = latest_run
+            return summary
+        except Exception as e:
+            logger.error(f"Error getting runtime summary: {e}")
+            if 'conn' in locals():
                 conn.close()
-                logger.info(f"Deleted {deleted_count} old runtime entries")
-                return deleted_count
-            except Exception as e:
-                logger.error(f"Error deleting old entries: {e}")
-                if 'conn' in locals():
-                    conn.rollback()
+            return {
+                "total_runs": 0, "total_images": 0, "average_runtime_seconds": 0,
+                "average_runtime_formatted": "0h 0m 0s", "total_errors": 0,
+                "mode_counts": {}, "days": days,
+            }
+
+    def delete_old_entries(
+        self, days: int = 90, batch_size: Optional[int] = None, keep_rollup: bool = True
+    ) -> int:
+        """
+        Delete entries older than specified days
+
+        Args:
+            days: Keep entries of the last days
+            batch_size: Delete in batches of this size, committing (and releasing the
+                lock) after each batch so imports are not blocked by a long DELETE
+            keep_rollup: Keep the deleted runs in the runtime_daily rollup, so the
+                summary still covers the pruned days
+        """
+        cutoff_str = (datetime.now() - timedelta(days=days)).isoformat()
+        deleted_count = 0
+        while True:
+            with self.lock:
+                try:
+                    conn = self._get_connection()
+                    cursor = conn.cursor()
+                    if keep_rollup:
+                        cursor.execute(f"INSERT INTO {ROLLUP_HOLD_TABLE} DEFAULT VALUES")
+                    if batch_size:
+                        cursor.execute(
+                            """
+                            DELETE FROM runtime_stats
+                            WHERE id IN (
+                                SELECT id FROM runtime_stats WHERE timestamp < ? LIMIT ?
+                            )
+                        """,
+                            (cutoff_str, batch_size),
+                        )
+                    else:
+                        cursor.execute(
+                            """
+                            DELETE FROM runtime_stats
+                            WHERE timestamp < ?
+                        """,
+                            (cutoff_str,),
+                        )
+                    batch_count = cursor.rowcount
+                    if keep_rollup:
+                        cursor.execute(f"DELETE FROM {ROLLUP_HOLD_TABLE}")
+                    else:
+                        # Days emptied by the delete drop out of the rollup
+                        cursor.execute(f"DELETE FROM {ROLLUP_TABLE} WHERE runs <= 0")
+                    conn.commit()
                     conn.close()
-                return 0
+                except Exception as e:
+                    logger.error(f"Error deleting old entries: {e}")
+                    if 'conn' in locals():
+                        conn.rollback()
+                        conn.close()
+                    break
+            deleted_count += batch_count
+            if not batch_size or batch_count < batch_size:
+                break
+        logger.info(f"Deleted {deleted_count} old runtime entries")
+        return deleted_count
 
     @staticmethod
     def _format_seconds(seconds: int) -> str:
@@ -823,39 +968,37 @@ class RuntimeDatabase:
 
     def get_migration_info(self) -> dict:
         """Get migration info, thread-safe"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT key, value, updated_at FROM migration_info")
-                info = {}
-                for row in cursor.fetchall():
-                    info[row["key"]] = {"value": row["value"], "updated_at": row["updated_at"]}
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute("SELECT key, value, updated_at FROM migration_info")
+            info = {}
+            for row in cursor.fetchall():
+                info[row["key"]] = {"value": row["value"], "updated_at": row["updated_at"]}
+            conn.close()
+            return info
+        except Exception as e:
+            logger.debug(f"Could not get migration info: {e}")
+            if 'conn' in locals():
                 conn.close()
-                return info
-            except Exception as e:
-                logger.debug(f"Could not get migration info: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return {"error": str(e)}
+            return {"error": str(e)}
 
     def get_run_by_id(self, run_id: int) -> Optional[Dict]:
         """Get a specific runtime entry by ID"""
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM runtime_stats WHERE id = ?", (run_id,))
-                row = cursor.fetchone()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM runtime_stats WHERE id = ?", (run_id,))
+            row = cursor.fetchone()
+            conn.close()
+            if row:
+                return dict(row)
+            return None
+        except Exception as e:
+            logger.error(f"Error getting run by ID: {e}")
+            if 'conn' in locals():
                 conn.close()
-                if row:
-                    return dict(row)
-                return None
-            except Exception as e:
-                logger.error(f"Error getting run by ID: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return None
+            return None
 
 # Global database instance
 runtime_db = RuntimeDatabase()
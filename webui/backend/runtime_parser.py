@@ -5,17 +5,80 @@ Utility module for parsing runtime statistics from log files and JSON files
 import re
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import logging
 from datetime import datetime
 
+try:
+    from .log_sinks import read_last_lines
+except ImportError:
+    from log_sinks import read_last_lines
+
 logger = logging.getLogger(__name__)
 
+# Number of trailing log lines that contain the end-of-run summary
+RUNTIME_TAIL_LINES = 150
+
+# One combined pattern for all end-of-run summary lines. The name of the matching
+# alternative (match.lastgroup) tells which field the line carries.
+RE_RUNTIME_SUMMARY = re.compile(
+    # "Script execution time: 0h 1m 23s"
+    r"(?P<runtime>Script execution time:.*?(?P<hours>\d+)h\s*(?P<minutes>\d+)m\s*(?P<seconds>\d+)s)"
+    # "Finished, Total images created: 42" / "... downloaded: 42"
+    r"|(?P<total>Total images (?:downloaded|created):\s*(?P<total_count>\d+))"
+    # "Show/Movie Posters created: 127| Season images created: 0 | ..."
+    r"|(?P<posters>Show/Movie Posters (?:created|downloaded):\s*\d+)"
+    # "During execution '5' Errors occurred"
+    r"|(?P<errors>execution\s+'(?P<errors_count>\d+)'\s+Errors)"
+    # "'8' times the script took a fallback image"
+    r"|(?P<fallbacks>'(?P<fallbacks_count>\d+)'\s+times the script took a fallback image)"
+)
+RE_RUNTIME_TYPE_COUNTS = re.compile(
+    r"Show/Movie Posters (?:created|downloaded):\s*(\d+)"
+    r"(?:.*?Season images (?:created|downloaded):\s*(\d+))?"
+    r"(?:.*?Background images (?:created|downloaded):\s*(\d+))?"
+    r"(?:.*?TitleCards (?:created|downloaded):\s*(\d+))?"
+)
+
+# Runtime string formats handled by _parse_runtime_to_seconds
+RE_RUNTIME_HOURS = re.compile(r"(\d+)h")
+RE_RUNTIME_MINUTES = re.compile(r"(\d+)m")
+RE_RUNTIME_SECONDS = re.compile(r"(\d+)s")
+RE_ISO_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+# Parsed runtime JSON files keyed by path -> ((mtime_ns, size), parsed data)
+_json_parse_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+# Signature of the JSON file last imported by import_json_to_db, keyed by path
+_json_import_signatures: Dict[str, Tuple[int, int]] = {}
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# Run mode -> runtime JSON file written by Posterizarr.ps1 at the end of a run
+MODE_JSON_MAP = {
+    "normal": "normal.json",
+    "testing": "testing.json",
+    "manual": "manual.json",
+    "backup": "backup.json",
+    "syncjelly": "syncjelly.json",
+    "syncemby": "syncemby.json",
+    "scheduled": "scheduled.json",
+    "tautulli": "tautulli.json",
+    "arr": "arr.json",
+    "replace": "replace.json",
+}
+
 
 def parse_runtime_from_log(log_path: Path, mode: str = "normal") -> Optional[Dict]:
     """
     Parse runtime statistics from a log file
 
+    Only the last RUNTIME_TAIL_LINES lines are read (backwards, without loading the
+    whole file) and each line is matched once against a combined, precompiled pattern.
+
     Args:
         log_path: Path to the log file
         mode: The run mode (normal, testing, manual, backup, etc.)
@@ -28,103 +91,50 @@ def parse_runtime_from_log(log_path: Path, mode: str = "normal") -> Optional[Dic
             logger.warning(f"Log file not found: {log_path}")
             return None
 
-        # Read last 150 lines to find the runtime info
-        with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
-            last_lines = lines[-150:] if len(lines) > 150 else lines
-
-        runtime_seconds = None
-        runtime_formatted = None
-        total_images = 0
-        posters = 0
-        seasons = 0
-        backgrounds = 0
-        titlecards = 0
-        errors = 0
-        fallback_images = 0
-
-        # Parse from bottom to top to get latest run
-        for line in reversed(last_lines):
-            # Look for: "Script execution time: 0h 1m 23s"
-            if "Script execution time:" in line and runtime_formatted is None:
-                match = re.search(r"(\d+)h\s*(\d+)m\s*(\d+)s", line)
-                if match:
-                    hours = int(match.group(1))
-                    minutes = int(match.group(2))
-                    seconds = int(match.group(3))
-                    runtime_seconds = hours * 3600 + minutes * 60 + seconds
-                    runtime_formatted = f"{hours}h {minutes}m {seconds}s"
-
-            # Look for: "Finished, Total images downloaded: 42" OR "Finished, Total images created: 42"
-            if (
-                "Total images downloaded:" in line or "Total images created:" in line
-            ) and total_images == 0:
-                match = re.search(r"Total images (?:downloaded|created):\s*(\d+)", line)
-                if match:
-                    total_images = int(match.group(1))
-
-            # Look for: "Show/Movie Posters created: 127| Season images created: 0 | Background images created: 127 | TitleCards created: 0"
-            # OR: "Show/Movie Posters downloaded: 10| Season images downloaded: 5 | Background images downloaded: 3 | TitleCards downloaded: 2"
-            if (
-                "Show/Movie Posters created:" in line
-                or "Show/Movie Posters downloaded:" in line
-            ) and posters == 0:
-                # Posters
-                poster_match = re.search(
-                    r"Show/Movie Posters (?:created|downloaded):\s*(\d+)", line
-                )
-                if poster_match:
-                    posters = int(poster_match.group(1))
+        last_lines = read_last_lines(log_path, RUNTIME_TAIL_LINES)
 
-                # Seasons
-                season_match = re.search(
-                    r"Season images (?:created|downloaded):\s*(\d+)", line
-                )
-                if season_match:
-                    seasons = int(season_match.group(1))
+        found = {}
 
-                # Backgrounds
-                bg_match = re.search(
-                    r"Background images (?:created|downloaded):\s*(\d+)", line
+        # Parse from bottom to top to get latest run - first match per field wins
+        for line in reversed(last_lines):
+            match = RE_RUNTIME_SUMMARY.search(line)
+            if match is None:
+                continue
+
+            field = match.lastgroup
+            if field in found:
+                continue
+
+            if field == "runtime":
+                hours, minutes, seconds = (
+                    int(match.group("hours")),
+                    int(match.group("minutes")),
+                    int(match.group("seconds")),
                 )
-                if bg_match:
-                    backgrounds = int(bg_match.group(1))
-
-                # TitleCards
-                tc_match = re.search(
-                    r"TitleCards (?:created|downloaded):\s*(\d+)", line
+                found["runtime"] = (hours, minutes, seconds)
+            elif field == "posters":
+                counts = RE_RUNTIME_TYPE_COUNTS.search(line)
+                found["posters"] = tuple(
+                    int(value) if value else 0 for value in counts.groups()
                 )
-                if tc_match:
-                    titlecards = int(tc_match.group(1))
-
-            # Look for: "During execution '5' Errors occurred"
-            if "Errors occurred" in line and errors == 0:
-                match = re.search(r"execution\s+'(\d+)'\s+Errors", line)
-                if match:
-                    errors = int(match.group(1))
-
-            # Look for: "'8' times the script took a fallback image"
-            if (
-                "times the script took a fallback image" in line
-                and fallback_images == 0
-            ):
-                match = re.search(
-                    r"'(\d+)'\s+times the script took a fallback image", line
-                )
-                if match:
-                    fallback_images = int(match.group(1))
+            else:
+                found[field] = int(match.group(field + "_count"))
 
             # Stop searching once we found everything from the same run
-            if runtime_formatted and (
-                total_images > 0 or (posters + seasons + backgrounds + titlecards) > 0
+            if "runtime" in found and (
+                found.get("total", 0) > 0 or sum(found.get("posters", ())) > 0
             ):
                 break
 
         # If runtime was not found, we don't have complete data
-        if runtime_formatted is None:
+        if "runtime" not in found:
             logger.warning(f"Could not find runtime data in {log_path}")
             return None
 
+        hours, minutes, seconds = found["runtime"]
+        posters, seasons, backgrounds, titlecards = found.get("posters", (0, 0, 0, 0))
+        total_images = found.get("total", 0)
+
         # If total_images was not found but we have individual counts, calculate it
         if total_images == 0 and (posters + seasons + backgrounds + titlecards) > 0:
             total_images = posters + seasons + backgrounds + titlecards
@@ -134,15 +144,15 @@ def parse_runtime_from_log(log_path: Path, mode: str = "normal") -> Optional[Dic
         # the time-based strategy (recent entry within 5 seconds)
         return {
             "mode": mode,
-            "runtime_seconds": runtime_seconds,
-            "runtime_formatted": runtime_formatted,
+            "runtime_seconds": hours * 3600 + minutes * 60 + seconds,
+            "runtime_formatted": f"{hours}h {minutes}m {seconds}s",
             "total_images": total_images,
             "posters": posters,
             "seasons": seasons,
             "backgrounds": backgrounds,
             "titlecards": titlecards,
-            "errors": errors,
-            "fallbacks": fallback_images,
+            "errors": found.get("errors", 0),
+            "fallbacks": found.get("fallbacks", 0),
             "log_file": log_path.name,
             "start_time": "",  # Not available in log files
             "end_time": "",  # Not available in log files
@@ -167,22 +177,8 @@ def save_runtime_to_db(log_path: Path, mode: str = "normal"):
 
         runtime_data = None
 
-        # Map mode to JSON filename
-        mode_json_map = {
-            "normal": "normal.json",
-            "testing": "testing.json",
-            "manual": "manual.json",
-            "backup": "backup.json",
-            "syncjelly": "syncjelly.json",
-            "syncemby": "syncemby.json",
-            "scheduled": "scheduled.json",
-            "tautulli": "tautulli.json",
-            "arr": "arr.json",
-            "replace": "replace.json",
-        }
-
         # Try to find and parse JSON file first (preferred)
-        json_filename = mode_json_map.get(mode)
+        json_filename = MODE_JSON_MAP.get(mode)
         if json_filename:
             json_path = log_path.parent / json_filename
             if json_path.exists():
@@ -209,6 +205,50 @@ def save_runtime_to_db(log_path: Path, mode: str = "normal"):
         logger.error(f"Error saving runtime to database: {e}")
 
 
+def save_live_run_to_db(
+    runtime_data: Optional[Dict], logs_dir: Path, run_started_at: datetime
+) -> bool:
+    """
+    Persist the runtime entry built by the live log parser at the end of a run.
+
+    The run's JSON file stays the preferred source: if it was (re)written during
+    this run, the logs watcher imports it and the live entry is skipped, so the
+    log never has to be re-scanned and no duplicate row is created.
+
+    Returns:
+        True if an entry was written
+    """
+    try:
+        if not runtime_data:
+            logger.debug("No live runtime data to save (run summary not found)")
+            return False
+
+        json_filename = MODE_JSON_MAP.get(runtime_data.get("mode"))
+        if json_filename:
+            json_path = logs_dir / json_filename
+            if (
+                json_path.exists()
+                and datetime.fromtimestamp(json_path.stat().st_mtime) >= run_started_at
+            ):
+                logger.info(
+                    f"{json_filename} was written by this run, runtime will be imported from it"
+                )
+                return False
+
+        from runtime_database import runtime_db
+
+        entry_id = runtime_db.add_runtime_entry(**runtime_data)
+        logger.info(
+            f"Saved live runtime data for {runtime_data.get('mode')} mode: "
+            f"{runtime_data.get('runtime_formatted')}, {runtime_data.get('total_images')} images"
+        )
+        return entry_id is not None
+
+    except Exception as e:
+        logger.error(f"Error saving live runtime data to database: {e}")
+        return False
+
+
 def parse_runtime_from_json(json_path: Path, mode: str = None) -> Optional[Dict]:
     """
     Parse runtime statistics from a JSON file
@@ -224,6 +264,12 @@ def parse_runtime_from_json(json_path: Path, mode: str = None) -> Optional[Dict]
             filename = json_path.stem.lower()  # Get filename without extension
             mode = filename  # Use filename as mode (e.g., "normal", "manual", "test")
 
+        # Unchanged files are not re-read
+        signature = _file_signature(json_path)
+        cached = _json_parse_cache.get(str(json_path))
+        if cached and cached[0] == signature:
+            return {**cached[1], "mode": mode}
+
         # Read JSON file
         with open(json_path, "r", encoding="utf-8") as f:
             data = json.load(f)
@@ -316,7 +362,7 @@ def parse_runtime_from_json(json_path: Path, mode: str = None) -> Optional[Dict]
                 return dt.isoformat()
             except (ValueError, TypeError):
                 # If it's already in a good format (like ISO) or is "N/A", return as-is
-                if re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", date_str):
+                if RE_ISO_DATETIME.match(date_str):
                     return date_str
                 logger.warning(f"Could not parse date '{date_str}', returning as-is.")
                 return date_str
@@ -356,10 +402,12 @@ def parse_runtime_from_json(json_path: Path, mode: str = None) -> Optional[Dict]
             "log_file": json_path.name,
         }
 
+        _json_parse_cache[str(json_path)] = (signature, result)
+
         logger.info(
             f"Successfully parsed {json_path.name}: {runtime_formatted}, {total_images} images"
         )
-        return result
+        return dict(result)
 
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in {json_path}: {e}")
@@ -400,15 +448,15 @@ def _parse_runtime_to_seconds(runtime_str: str) -> int:
         minutes = 0
         seconds = 0
 
-        hour_match = re.search(r"(\d+)h", runtime_str)
+        hour_match = RE_RUNTIME_HOURS.search(runtime_str)
         if hour_match:
             hours = int(hour_match.group(1))
 
-        min_match = re.search(r"(\d+)m", runtime_str)
+        min_match = RE_RUNTIME_MINUTES.search(runtime_str)
         if min_match:
             minutes = int(min_match.group(1))
 
-        sec_match = re.search(r"(\d+)s", runtime_str)
+        sec_match = RE_RUNTIME_SECONDS.search(runtime_str)
         if sec_match:
             seconds = int(sec_match.group(1))
 
@@ -474,11 +522,18 @@ def import_json_to_db(logs_dir: Path = None):
             json_path = logs_dir / json_file
 
             if json_path.exists():
+                # Skip files that have not changed since they were last imported
+                signature = _file_signature(json_path)
+                if _json_import_signatures.get(str(json_path)) == signature:
+                    logger.debug(f"Skipping unchanged {json_file}")
+                    continue
+
                 runtime_data = parse_runtime_from_json(json_path, mode)
 
                 if runtime_data:
                     # The database now handles the atomic duplicate check.
                     runtime_db.add_runtime_entry(**runtime_data)
+                    _json_import_signatures[str(json_path)] = signature
                     imported_count += 1
                     logger.info(f"Imported {json_file} to database")
 
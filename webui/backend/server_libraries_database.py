@@ -10,6 +10,11 @@ import threading
 from typing import Optional, List, Dict
 from datetime import datetime
 
+try:
+    from .db_pool import get_pool
+except ImportError:
+    from db_pool import get_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,12 +31,15 @@ class ServerLibrariesDB:
         self.db_path = db_path
         # REMOVED: self.connection
         self.lock = threading.RLock()  # Thread-safety lock
+        # Incremented whenever libraries are saved (see library_types.py)
+        self.data_version = 0
 
-    def _get_connection(self):
-        """Helper to create a new, thread-safe connection"""
-        conn = sqlite3.connect(self.db_path, timeout=10)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _get_connection(self, readonly: bool = False):
+        """
+        Get a pooled connection (WAL mode). Readers don't take self.lock;
+        conn.close() returns the connection to the pool.
+        """
+        return get_pool(self.db_path).connection(readonly=readonly)
 
     def connect(self):
         """Establish database connection (now just ensures tables exist)"""
@@ -141,6 +149,7 @@ class ServerLibrariesDB:
 
                 conn.commit()
                 conn.close()
+                self.data_version += 1
                 logger.info(
                     f"Successfully saved {len(libraries)} libraries for {server_type}"
                 )
@@ -188,45 +197,62 @@ class ServerLibrariesDB:
     def get_media_server_libraries(self, server_type: str):
         """Get media server libraries from database"""
         logger.debug(f"Fetching libraries for {server_type}")
-        with self.lock:
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT library_name, library_type, is_excluded, last_fetched
-                    FROM media_server_libraries
-                    WHERE server_type = ?
-                    ORDER BY library_name
-                    """,
-                    (server_type,),
-                )
-
-                rows = cursor.fetchall()
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT library_name, library_type, is_excluded, last_fetched
+                FROM media_server_libraries
+                WHERE server_type = ?
+                ORDER BY library_name
+                """,
+                (server_type,),
+            )
+
+            rows = cursor.fetchall()
+            conn.close()
+
+            libraries = []
+            excluded = []
+            for row in rows:
+                lib_data = {
+                    "name": row["library_name"],
+                    "type": row["library_type"],
+                    "last_fetched": row["last_fetched"]
+                }
+                libraries.append(lib_data)
+                if row["is_excluded"] == 1:
+                    excluded.append(row["library_name"])
+
+            logger.debug(
+                f"Found {len(libraries)} libraries for {server_type} ({len(excluded)} excluded)"
+            )
+            return {"libraries": libraries, "excluded": excluded}
+
+        except sqlite3.Error as e:
+            logger.error(f"Error fetching media server libraries: {e}")
+            if 'conn' in locals():
                 conn.close()
-
-                libraries = []
-                excluded = []
-                for row in rows:
-                    lib_data = {
-                        "name": row["library_name"],
-                        "type": row["library_type"],
-                        "last_fetched": row["last_fetched"]
-                    }
-                    libraries.append(lib_data)
-                    if row["is_excluded"] == 1:
-                        excluded.append(row["library_name"])
-
-                logger.debug(
-                    f"Found {len(libraries)} libraries for {server_type} ({len(excluded)} excluded)"
-                )
-                return {"libraries": libraries, "excluded": excluded}
-
-            except sqlite3.Error as e:
-                logger.error(f"Error fetching media server libraries: {e}")
-                if 'conn' in locals():
-                    conn.close()
-                return {"libraries": [], "excluded": []}
+            return {"libraries": [], "excluded": []}
+
+    def get_library_types(self) -> Dict[str, str]:
+        """Library name -> library type as reported by the media servers"""
+        try:
+            conn = self._get_connection(readonly=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT library_name, library_type FROM media_server_libraries ORDER BY last_fetched"
+            )
+            # Most recently fetched server wins for names used on several servers
+            types = {row["library_name"]: row["library_type"] for row in cursor.fetchall()}
+            conn.close()
+            return types
+        except sqlite3.Error as e:
+            logger.error(f"Error fetching library types: {e}")
+            if 'conn' in locals():
+                conn.close()
+            return {}
 
 def init_server_libraries_db(db_path: Path) -> ServerLibrariesDB:
     """
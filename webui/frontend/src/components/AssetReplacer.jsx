@@ -873,7 +873,11 @@ function AssetReplacer({ asset, onClose, onSuccess }) {
         // Only check Plex Export if we don't already have dbData
         if (!dbData) {
           console.log("Checking Plex Export DB (/api/plex-export/library)...");
-          response = await fetch(`${API_URL}/plex-export/library`);
+          const exportParams = new URLSearchParams({
+            library_name: libraryName,
+            root_foldername: rootfolder,
+          });
+          response = await fetch(`${API_URL}/plex-export/library?${exportParams}`);
           if (response.ok) {
             const plexData = await response.json();
             if (plexData.success && plexData.data) {